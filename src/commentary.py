@@ -373,8 +373,9 @@ def generate_commentary(
 
     Parameters
     ----------
-    point_summary : dict from game_engine ('point_summary' event)
-    score_info    : dict from game_engine ('score' event — post-point)
+    point_summary : dict from game_engine ('point_summary' event), or the
+                    decoded sim.events record of one
+    score_info    : dict from game_engine ('score' event — post-point), or its record
     player1, player2 : full player dicts (with skills, age, name, archetype …)
     tournament    : tournament dict (optional, for round / prestige context)
     """
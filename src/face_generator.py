@@ -13,7 +13,6 @@ Key layout (0-indexed rows/cols):
 
 import random
 import hashlib
-import tkinter as tk
 
 # ---------------------------------------------------------------------------
 # Colour palettes
@@ -489,6 +488,7 @@ def _hex_blend(c1, c2, t):
 
 def create_face_canvas(parent, face, width=160, height=160, bg="#ecf0f1"):
     """Render a face dict onto a Tkinter Canvas and return the widget."""
+    import tkinter as tk  # Here, so generate_face works without a display (headless runs)
 
     canvas = tk.Canvas(parent, width=width, height=height, bg=bg,
                        highlightthickness=0)
@@ -1,11 +1,15 @@
 import tkinter as tk
 from schedule import TournamentScheduler
 from sim.game_engine import GameEngine, SURFACE_EFFECTS
+from sim.stream import PointStream
 from court_viewer import TennisCourtViewer
 from utils.logo_utils import tournament_logo_manager
 import collections
+import contextlib
 import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 import functools
 from archetypes import ARCTYPE_MAP, get_archetype_for_player
@@ -99,7 +103,7 @@ class TennisGMApp:
                 self.scheduler.save_game()
 
     def _player_by_id(self, pid):
-        return next((p for p in self.scheduler.players if p['id'] == pid), None)
+        return self.scheduler.get_player(pid)
 
     def _is_favorite(self, pid_or_player):
         if isinstance(pid_or_player, dict):
@@ -2535,22 +2539,24 @@ class TennisGMApp:
             )
             btn_simulate.pack(side="left")
 
+    @contextlib.contextmanager
+    def _process_map(self):
+        """A process pool's map for the scheduler's batch methods, or None on a single core."""
+        if (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as pool:
+                yield pool.map
+        else:
+            yield None
+
     def simulate_all_current_week_tournaments(self):
-        tournaments = self.scheduler.get_current_week_tournaments()
-        # Sort by prestige order so Juniors appear after ITFs
-        def _prestige_key(t):
-            cat = t.get('category', '')
-            try:
-                return PRESTIGE_ORDER.index(cat)
-            except ValueError:
-                return len(PRESTIGE_ORDER)
-        tournaments.sort(key=_prestige_key)
+        # The week's tournaments have no players in common, so they can be
+        # played side by side; results come back in prestige order either way
+        with self._process_map() as map_tournaments:
+            tournaments = self.scheduler.simulate_current_week(map_tournaments)
         results = []
         for t in tournaments:
-            if t.get('winner_id') is None:
-                winner_id = self.scheduler.simulate_entire_tournament(t['id'])
-                winner = next((p for p in self.scheduler.players if p['id'] == winner_id), None)
-                results.append((t['name'], winner['name'] if winner else "Unknown"))
+            winner = self.scheduler.get_player(t.get('winner_id'))
+            results.append((t['name'], winner['name'] if winner else "Unknown"))
 
         # Show a summary popup and refresh the list
         popup = tk.Toplevel(self.root)
@@ -2587,7 +2593,7 @@ class TennisGMApp:
                 tk.Label(self.root, text=f"Round {r + 1}:", font=("Arial", 12, "underline")).pack(anchor="w")
                 for m in tournament['bracket'][r]:
                     def get_name_rank(pid):
-                        player = next((p for p in self.scheduler.players if p['id'] == pid), None)
+                        player = self.scheduler.get_player(pid)
                         if player:
                             return f"{player['name']} ({player.get('rank', 'N/A')})"
                         return "BYE"
@@ -2657,7 +2663,7 @@ class TennisGMApp:
         # Convert participant IDs to player objects
         participants = []
         for pid in participant_ids:
-            player = next((p for p in self.scheduler.players if p['id'] == pid), None)
+            player = self.scheduler.get_player(pid)
             if player:
                 participants.append(player)
         
@@ -2899,27 +2905,15 @@ Last Title: {self.get_player_last_tournament_won(player2)}
         button_frame.pack_propagate(False)
         
         def start_match():
-            # Simulate and save the match - get the exact same data to visualize
-            result = self.scheduler.simulate_through_match(tournament['id'], match_idx)
-            
-            # Unpack the returned tuple: (winner_id, match_log, point_events)
-            if isinstance(result, tuple) and len(result) == 3:
-                winner_id, match_log, all_point_events = result
-            else:
-                # Fallback if returns just winner_id
-                winner_id = result
-                match_log = []
-                all_point_events = []
-            
-            # Refresh tournament display with the saved result
-            self.manage_tournament(tournament)
-            
-            # Create a GameEngine object for display purposes (to access player data)
-            sets_to_win = 3 if tournament.get('category') == "Grand Slam" else 2
-            game_engine = GameEngine(player1, player2, tournament['surface'], sets_to_win=sets_to_win)
-            
-            # Display the visualization using the SAME data that was saved
-            self.display_simple_match_log(match_log, tournament, all_point_events, player1, player2, game_engine)
+            # The scheduler records the result up front; the viewer pulls the same
+            # match point by point
+            streamed = self.scheduler.stream_match(tournament['id'], match_idx)
+            if streamed is None:
+                self.manage_tournament(tournament)
+                return
+            game_engine, events = streamed
+            self.display_simple_match_log(game_engine.match_log, tournament, PointStream(events),
+                                          player1, player2, game_engine)
         
         tk.Button(
             button_frame,
@@ -2950,13 +2944,23 @@ Last Title: {self.get_player_last_tournament_won(player2)}
         # Force screen update to ensure faceoff screen is displayed
         self.root.update()
 
+    def replay_tournament_match(self, tournament, round_idx, match_idx, player1=None, player2=None):
+        """Watch a finished match, regenerated from its replay record."""
+        game_engine, events = self.scheduler.replay_match(tournament['id'], round_idx, match_idx)
+        if player1 is None or player2 is None:
+            # Current player dicts (faces etc.); the engine keeps the skills of the day
+            player1 = self.scheduler.get_player(game_engine.p1['id']) or game_engine.p1
+            player2 = self.scheduler.get_player(game_engine.p2['id']) or game_engine.p2
+        self.display_simple_match_log(game_engine.match_log, tournament, PointStream(events),
+                                      player1, player2, game_engine)
+
     def simulate_match_in_tournament(self, tournament, match_idx):
         match = self.scheduler.get_current_matches(tournament['id'])[match_idx]
         if match['winner']:
             self.manage_tournament(tournament)
             return
         winner_id = self.scheduler.simulate_through_match(tournament['id'], match_idx)
-        winner = next((p for p in self.scheduler.players if p['id'] == winner_id), None)
+        winner = self.scheduler.get_player(winner_id)
         self.manage_tournament(tournament)
 
     def watch_match_in_tournament(self, tournament, match_idx):
@@ -2981,8 +2985,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             return
 
         # Get player data
-        player1 = next(p for p in self.scheduler.players if p['id'] == match['player1']['id'])
-        player2 = next(p for p in self.scheduler.players if p['id'] == match['player2']['id'])
+        player1 = self.scheduler.get_player(match['player1']['id'])
+        player2 = self.scheduler.get_player(match['player2']['id'])
         
         # Show face-off screen - simulation will happen when user clicks "Start Match"
         self.show_player_faceoff(player1, player2, tournament, match_idx)
@@ -2996,8 +3000,10 @@ Last Title: {self.get_player_last_tournament_won(player2)}
         self.pending_callbacks = []  # Store callback IDs to cancel them
         self.current_court_viewer = None  # Track court viewer for cleanup
         self.current_point_idx = 0  # Track current point for keyboard navigation
-        self.max_points = len(match_log) if match_log else 0  # Track max points
         self.scheduled_advance_idx = -1  # Track if auto-advance is scheduled
+        # Points are pulled from the engine as the viewer advances (a plain list works too)
+        if point_events is not None and not isinstance(point_events, PointStream):
+            point_events = PointStream(point_events)
         
         def cleanup_bindings():
             # Clean up mouse wheel bindings
@@ -3377,7 +3383,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                 pass
             
             # Check if match is finished (we're at or past the last point)
-            is_match_finished = i >= len(point_events) if point_events else True
+            is_match_finished = not point_events.has(i) if point_events is not None else True
             
             # Process any pending events before destroying widgets
             try:
@@ -3417,8 +3423,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             def display_scoreboard():
                 if not is_match_finished:
                     # During match: show previous point's score to avoid spoilers
-                    if i > 0 and point_events and (i - 1) < len(point_events):
-                        events = point_events[i - 1]['events']
+                    if i > 0:
+                        events = point_events.get(i - 1)['events']
                         for event in events:
                             if event['type'] == 'score':
                                 sets = event['sets']
@@ -3428,28 +3434,23 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                                 break
                         else:
                             return False
-                    elif i == 0:
+                    else:
                         # First point: show initial score
-                        if point_events and len(point_events) > 0:
-                            events = point_events[0]['events']
-                            for event in events:
-                                if event['type'] == 'score':
-                                    # Subtract 1 from current_set to get pre-point state
-                                    sets = event['sets']
-                                    current_set = {'player1': 0, 'player2': 0}
-                                    p1_name = event['player1_name']
-                                    p2_name = event['player2_name']
-                                    break
-                            else:
-                                return False
+                        events = point_events.get(0)['events']
+                        for event in events:
+                            if event['type'] == 'score':
+                                # Subtract 1 from current_set to get pre-point state
+                                sets = event['sets']
+                                current_set = {'player1': 0, 'player2': 0}
+                                p1_name = event['player1_name']
+                                p2_name = event['player2_name']
+                                break
                         else:
                             return False
-                    else:
-                        return False
                 else:
                     # End screen: use final data from the LAST point event
-                    if point_events and len(point_events) > 0:
-                        last_events = point_events[-1]['events']
+                    if point_events is not None and point_events.last is not None:
+                        last_events = point_events.last['events']
                         for event in last_events:
                             if event['type'] == 'score':
                                 sets = event['sets']
@@ -3663,8 +3664,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                 
                 if not is_match_finished:
                     # During match: show previous point's stats (use point i-1 so current point doesn't spoil)
-                    if i > 0 and point_events and (i - 1) < len(point_events) and 'events' in point_events[i - 1]:
-                        events = point_events[i - 1]['events']
+                    if i > 0:
+                        events = point_events.get(i - 1)['events']
                         if events and 'match_stats' in events[0]:
                             match_stats_p1 = events[0]['match_stats']['player1']
                             match_stats_p2 = events[0]['match_stats']['player2']
@@ -3674,8 +3675,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                         match_stats_p2 = {'aces': 0, 'breaks': 0, 'forehand_winners': 0, 'backhand_winners': 0, 'dropshot_winners': 0, 'volley_winners': 0}
                 else:
                     # End screen: use final stats from the LAST point event
-                    if point_events and len(point_events) > 0:
-                        last_events = point_events[-1]['events']
+                    if point_events is not None and point_events.last is not None:
+                        last_events = point_events.last['events']
                         if last_events and 'match_stats' in last_events[0]:
                             match_stats_p1 = last_events[0]['match_stats']['player1']
                             match_stats_p2 = last_events[0]['match_stats']['player2']
@@ -3859,7 +3860,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             
             # Animate point with real-time player + ball movement
             next_idx = i + 1
-            if not is_match_finished and point_events and i < len(point_events):
+            if not is_match_finished:
                 court_viewer.set_player_names(player1['name'], player2['name'])
                 self.current_court_viewer = court_viewer
 
@@ -3876,7 +3877,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                             commentary_label.config(text=ctext)
                         except Exception:
                             pass
-                    if _next is not None and _next < len(match_log):
+                    if _next is not None:
                         def safe_advance():
                             try:
                                 if self.animation_active:
@@ -3886,7 +3887,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                         cid = self.root.after(1500, lambda: self.root.after_idle(safe_advance))
                         self.pending_callbacks.append(cid)
 
-                animate_point(court_viewer, point_events[i]['events'],
+                animate_point(court_viewer, point_events.get(i)['events'],
                               player1['id'], player2['id'], on_point_complete)
             
             # Navigation buttons
@@ -3896,7 +3897,6 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             # Keyboard binding for right arrow to go to next point
             # Use instance variables instead of closure to avoid stale references
             self.current_point_idx = i
-            self.max_points = len(match_log) if match_log else 0
             
             # Unbind any previous right arrow binding to avoid conflicts
             try:
@@ -3905,18 +3905,16 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                 pass
             
             def on_right_arrow(event):
-                # Don't advance if match is finished or at the end
-                if is_match_finished or self.current_point_idx >= self.max_points - 1:
+                # Don't advance past the end screen
+                if is_match_finished:
                     return
-                # Only advance if there's a valid next point
-                if self.current_point_idx + 1 < self.max_points:
-                    try:
-                        # Set scheduled advance to invalid so any pending auto-advance doesn't trigger
-                        self.scheduled_advance_idx = -1
-                        # Add a small delay to ensure clean widget destruction
-                        self.root.after(50, lambda: show_screen(self.current_point_idx + 1))
-                    except:
-                        pass
+                try:
+                    # Set scheduled advance to invalid so any pending auto-advance doesn't trigger
+                    self.scheduled_advance_idx = -1
+                    # Add a small delay to ensure clean widget destruction
+                    self.root.after(50, lambda: show_screen(self.current_point_idx + 1))
+                except:
+                    pass
             
             self.root.bind("<Right>", on_right_arrow)
                          
@@ -3931,8 +3929,9 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             tournament = next((t for t in tournaments if t['winner_id'] is None), None)
             if not tournament:
                 return
-        winner_id = self.scheduler.simulate_entire_tournament(tournament['id'])
-        winner = next((p for p in self.scheduler.players if p['id'] == winner_id), None)
+        with self._process_map() as map_matches:
+            winner_id = self.scheduler.simulate_entire_tournament(tournament['id'], map_matches=map_matches)
+        winner = self.scheduler.get_player(winner_id)
         msg = f"Tournament complete! Winner: {winner['name']}" if winner else "Tournament complete! (Winner unknown)"
         # Show a popup
         popup = tk.Toplevel(self.root)
@@ -4141,7 +4140,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
     
     def show_bracket_player_popup(self, player_id, tournament, event):
         """Show a popup with player info when clicked in bracket"""
-        player = next((p for p in self.scheduler.players if p['id'] == player_id), None)
+        player = self.scheduler.get_player(player_id)
         if not player:
             return
         
@@ -4404,6 +4403,11 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                     btn_window_sim = canvas.create_window(x+10, y+2*match_height+18, anchor="nw", window=btn_sim)
                     btn_window_watch = canvas.create_window(x+80, y+2*match_height+18, anchor="nw", window=btn_watch)
                     button_refs.append((btn_sim, btn_watch))
+                elif winner_id and f"{actual_round}-{m_idx}" in tournament.get('replays', {}):
+                    btn_replay = tk.Button(canvas, text="Replay", font=("Arial", 10),
+                                           command=functools.partial(self.replay_tournament_match, tournament, actual_round, m_idx))
+                    canvas.create_window(x+10, y+2*match_height+18, anchor="nw", window=btn_replay)
+                    button_refs.append((btn_replay,))
                     
             match_positions.append(round_y_positions)
             # Draw lines to next round
@@ -4446,7 +4450,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
         )
 
     def simulate_current_round_bracket(self, tournament):
-        self.scheduler.simulate_current_round(tournament['id'])
+        with self._process_map() as map_matches:
+            self.scheduler.simulate_current_round(tournament['id'], map_matches=map_matches)
         self.show_tournament_bracket(tournament)
 
     def simulate_match_in_bracket(self, tournament, match_idx):
@@ -4472,8 +4477,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
             return
 
         # Get player data
-        player1 = next((p for p in self.scheduler.players if p['id'] == match['player1']['id']), None)
-        player2 = next((p for p in self.scheduler.players if p['id'] == match['player2']['id']), None)
+        player1 = self.scheduler.get_player(match['player1']['id'])
+        player2 = self.scheduler.get_player(match['player2']['id'])
         
         # Show face-off screen - simulation will happen when user clicks "Start Match"
         self.show_player_faceoff_bracket(player1, player2, tournament, match_idx)
@@ -5499,12 +5504,7 @@ Last Title: {self.get_player_last_tournament_won(player2)}
         p1 = copy.deepcopy(t['player_data'][p1_id])
         p2 = copy.deepcopy(t['player_data'][p2_id])
 
-        engine = GameEngine(p1, p2, t['surface'], sets_to_win=t['sets_to_win'])
-        if not t['apply_form']:
-            engine.p1["skills"] = {k: v for k, v in t['player_data'][p1_id]["skills"].items()}
-            engine.p2["skills"] = {k: v for k, v in t['player_data'][p2_id]["skills"].items()}
-            engine.speed[p1["id"]] = t['player_data'][p1_id]["skills"]["speed"]
-            engine.speed[p2["id"]] = t['player_data'][p2_id]["skills"]["speed"]
+        engine = GameEngine(p1, p2, t['surface'], sets_to_win=t['sets_to_win'], apply_form=t['apply_form'])
 
         list(engine.simulate_match(visualize=False))
         winner_id = p1_id if engine.sets['player1'] > engine.sets['player2'] else p2_id
@@ -5696,33 +5696,28 @@ Last Title: {self.get_player_last_tournament_won(player2)}
 
         def start_match():
             import copy
+            import random
             from sim.game_engine import GameEngine
 
-            p1_copy = copy.deepcopy(player1)
-            p2_copy = copy.deepcopy(player2)
-            engine = GameEngine(p1_copy, p2_copy, t['surface'], sets_to_win=t['sets_to_win'])
-
-            if not t['apply_form']:
-                engine.p1["skills"] = {k: v for k, v in player1["skills"].items()}
-                engine.p2["skills"] = {k: v for k, v in player2["skills"].items()}
-                engine.speed[p1_copy["id"]] = player1["skills"]["speed"]
-                engine.speed[p2_copy["id"]] = player2["skills"]["speed"]
-
-            point_events = []
-            match_events = list(engine.simulate_match(visualize=True))
-            match_log = engine.match_log
-
-            for event in match_events:
-                if event['type'] == 'point':
-                    point_events.append(event)
-
-            winner_id = player1['id'] if engine.sets['player1'] > engine.sets['player2'] else player2['id']
-            score = engine.format_set_scores()
-
-            # Update bracket
-            t['active_matches'][match_idx] = (player1['id'], player2['id'], winner_id, score)
+            match = t['active_matches'][match_idx]
+            if len(match) >= 4 and match[2] is not None:
+                self.show_exhibition_bracket()
+                return
+            seed = random.getrandbits(64)
+
+            def new_engine():
+                return GameEngine(copy.deepcopy(player1), copy.deepcopy(player2), t['surface'],
+                                  sets_to_win=t['sets_to_win'], apply_form=t['apply_form'],
+                                  rng=random.Random(seed))
+
+            # Update the bracket up front, so closing the viewer mid-match loses nothing;
+            # the viewer pulls the same match (same seed) point by point
+            result = new_engine().simulate_match(headless=True)
+            t['active_matches'][match_idx] = (player1['id'], player2['id'], result.winner['id'],
+                                              result.format_set_scores())
             t['bracket'][t['current_round']][match_idx] = t['active_matches'][match_idx]
             self._exhibition_check_round_complete()
+            engine = new_engine()
 
             # Override show_tournament_bracket so back button returns to exhibition bracket
             original_show_bracket = self.show_tournament_bracket
@@ -5731,7 +5726,8 @@ Last Title: {self.get_player_last_tournament_won(player2)}
                 self.show_exhibition_bracket()
             self.show_tournament_bracket = _exh_back
 
-            self.display_simple_match_log(match_log, t, point_events, player1, player2, engine)
+            self.display_simple_match_log(engine.match_log, t, PointStream(engine.simulate_match(visualize=True)),
+                                          player1, player2, engine)
 
         tk.Button(button_frame, text="▶️ START MATCH", font=("Arial", 14, "bold"),
                   bg="#27ae60", fg="white", padx=30, pady=15, relief="raised", bd=0,
@@ -6,8 +6,10 @@ from archetypes import get_archetype_for_player
 from face_generator import generate_face
 
 class NewGenGenerator:
-    def __init__(self, names_path='data/names.json'):
+    def __init__(self, names_path='data/names.json', rng=None):
         self.names_path = names_path
+        # random.Random to draw from (default: the global random module)
+        self.rng = rng if rng is not None else random
         self.name_data = self.load_names()
         
     def load_names(self):
@@ -31,24 +33,25 @@ class NewGenGenerator:
 
     def generate_player_with_ids(self, current_year, player_id, player_rank):
         """Generate a new young player with random attributes"""
-        first_name = random.choice(self.name_data["first_names"])
-        last_name_idx = random.randrange(len(self.name_data["last_names"]))
+        first_name = self.rng.choice(self.name_data["first_names"])
+        last_name_idx = self.rng.randrange(len(self.name_data["last_names"]))
         last_name = self.name_data["last_names"][last_name_idx]
 
         # Increment the last name and update names.json
         new_last_name = self.increment_name(last_name)
         self.name_data["last_names"][last_name_idx] = new_last_name
-        with open(self.names_path, 'w', encoding='utf-8') as f:
-            json.dump(self.name_data, f, indent=2, ensure_ascii=False)
+        if self.names_path is not None:  # None: names kept in memory only
+            with open(self.names_path, 'w', encoding='utf-8') as f:
+                json.dump(self.name_data, f, indent=2, ensure_ascii=False)
 
-        r = random.random()
+        r = self.rng.random()
         if r > 0.9:
             if r >= 0.95:
-                potential_factor = round(random.uniform(1.9, 2.0), 3)
+                potential_factor = round(self.rng.uniform(1.9, 2.0), 3)
             else:
-                potential_factor = round(random.uniform(1.5, 2.0), 3)
+                potential_factor = round(self.rng.uniform(1.5, 2.0), 3)
         else:
-            potential_factor = round(random.uniform(1.0, 1.5), 3)
+            potential_factor = round(self.rng.uniform(1.0, 1.5), 3)
 
         skills = self.generate_skills()
 
@@ -56,8 +59,8 @@ class NewGenGenerator:
             "id": player_id,
             "name": f"{first_name} {last_name}",
             "age": 16,
-            "hand": random.choice(["Right", "Left"]),
-            "nationality": random.choice(self.NATIONALITIES),
+            "hand": self.rng.choice(["Right", "Left"]),
+            "nationality": self.rng.choice(self.NATIONALITIES),
             "skills": skills,
             "potential_factor": potential_factor,
             "rank": player_rank,
@@ -73,8 +76,8 @@ class NewGenGenerator:
             "highest_points": 0,
             "tournament_history": [],
             "tournament_wins": [],
-            "bonus": random.choice(list(skills.keys())),
-            "mentality": random.choices(self.MENTALITIES, weights=self.MENTALITY_WEIGHTS, k=1)[0],
+            "bonus": self.rng.choice(list(skills.keys())),
+            "mentality": self.rng.choices(self.MENTALITIES, weights=self.MENTALITY_WEIGHTS, k=1)[0],
             "year_start_rankings": {},  # Track ranking at start of each year
         }
 
@@ -100,19 +103,19 @@ class NewGenGenerator:
     def generate_skills(self):
         """Generate random skills for a new player (between 25 and 55)"""
         return {
-            "serve": random.randint(35, 55),
-            "forehand": random.randint(35, 55),
-            "backhand": random.randint(35, 55),
-            "speed": random.randint(35, 55),
-            "stamina": random.randint(35, 55),
-            "mental": random.randint(35, 55),
-            "straight": random.randint(35, 55),
-            "cross": random.randint(35, 55),
-            "dropshot": random.randint(35, 55),
-            "volley": random.randint(35, 55),
-            "lift": random.randint(35, 55),
-            "slice": random.randint(35, 55),
-            "iq": random.randint(35, 55)
+            "serve": self.rng.randint(35, 55),
+            "forehand": self.rng.randint(35, 55),
+            "backhand": self.rng.randint(35, 55),
+            "speed": self.rng.randint(35, 55),
+            "stamina": self.rng.randint(35, 55),
+            "mental": self.rng.randint(35, 55),
+            "straight": self.rng.randint(35, 55),
+            "cross": self.rng.randint(35, 55),
+            "dropshot": self.rng.randint(35, 55),
+            "volley": self.rng.randint(35, 55),
+            "lift": self.rng.randint(35, 55),
+            "slice": self.rng.randint(35, 55),
+            "iq": self.rng.randint(35, 55)
         }
     
     def generate_new_players(self, current_year, count, existing_players=None):
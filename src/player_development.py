@@ -36,12 +36,12 @@ class PlayerDevelopment:
             return age_factor
 
     @staticmethod
-    def develop_skill(current_value, chance):
-        return min(current_value + 1 if random.random() < chance else current_value, 100)
+    def develop_skill(current_value, chance, rng=random):
+        return min(current_value + 1 if rng.random() < chance else current_value, 100)
 
     @staticmethod
-    def regress_skill(current_value, chance):
-        return max(current_value - 1 if random.random() < chance else current_value, 0)
+    def regress_skill(current_value, chance, rng=random):
+        return max(current_value - 1 if rng.random() < chance else current_value, 0)
 
     @staticmethod
     def _ensure_skill_caps(player):
@@ -57,10 +57,11 @@ class PlayerDevelopment:
 
 
     @staticmethod
-    def develop_player_weekly(player, archetype_func=None):
+    def develop_player_weekly(player, archetype_func=None, rng=random):
+        """Develop one player's skills for a week; returns True if any skill changed."""
         age = player.get('age', 20)
         if age >= 40 or player.get('retired', False):
-            return
+            return False
 
         skills = player.get('skills', {})
         caps = PlayerDevelopment._ensure_skill_caps(player)
@@ -102,6 +103,7 @@ class PlayerDevelopment:
                 except Exception:
                     archetype_skills = set()
 
+        changed = False
         for skill_name, current_value in skills.items():
             cap = caps.get(skill_name, {'progcap': 0, 'regcap': 0})
             if age < 24:
@@ -114,8 +116,9 @@ class PlayerDevelopment:
                     chance *= 1.1
                 if skill_name in archetype_skills:
                     chance *= 1.2
-                if random.random() < chance and current_value < 100:
+                if rng.random() < chance and current_value < 100:
                     skills[skill_name] = current_value + 1
+                    changed = True
                     cap['progcap'] += 1
             elif age < 28:
                 # Refinement phase - slower progression
@@ -127,22 +130,26 @@ class PlayerDevelopment:
                     chance *= 1.1
                 if skill_name in archetype_skills:
                     chance *= 1.2
-                if random.random() < chance and current_value < 100:
+                if rng.random() < chance and current_value < 100:
                     skills[skill_name] = current_value + 1
+                    changed = True
                     cap['progcap'] += 1
             elif age >= 28:
                 # Regression phase
                 if cap['regcap'] >= 5:
                     continue
                 chance = PlayerDevelopment.calculate_regression_chance(age, current_value) / 10.0
-                if random.random() < chance and current_value > 0:
+                if rng.random() < chance and current_value > 0:
                     skills[skill_name] = current_value - 1
+                    changed = True
                     cap['regcap'] += 1
             else:
                 continue
 
             caps[skill_name] = cap
 
+        return changed
+
     @staticmethod
     def reset_caps(scheduler):
         """
@@ -157,14 +164,20 @@ class PlayerDevelopment:
                 caps[skill]['regcap'] = 0
 
     @staticmethod
-    def weekly_development(scheduler):
+    def weekly_development(scheduler, rng=None):
         """
-        Run weekly development for all players.
+        Run weekly development for all players, drawing from rng
+        (default: the scheduler's current week stream).
         """
+        rng = rng or getattr(scheduler, 'rng', random)
+        outcome_cache = getattr(scheduler, 'outcome_cache', None)
         for player in scheduler.players:
             if player.get('retired', False):
                 continue
-            PlayerDevelopment.develop_player_weekly(player)
+            changed = PlayerDevelopment.develop_player_weekly(player, rng=rng)
+            if changed and outcome_cache is not None:
+                # Pooled outcomes of this player's matchups were played with the old skills
+                outcome_cache.invalidate_player(player)
 
     @staticmethod
     def seasonal_development(scheduler):
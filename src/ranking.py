@@ -1,5 +1,6 @@
 import json
 import math
+from bisect import bisect_left, insort
 from collections import defaultdict
 from datetime import datetime, date, timedelta
 
@@ -90,13 +91,56 @@ class RankingSystem:
         }
     } 
 
+    # Round names by number of rounds, from the first round to the winner
+    ROUND_NAMES = {
+        # Grand Slams (8 rounds including final)
+        8: {
+            0: "Round 128", 1: "Round 64", 2: "Round 32", 3: "Round 16", 4: "Quarter", 5: "Semi", 6: "Final", 7: "Winner"
+        },
+        # Masters 1000 (7 rounds)
+        7: {
+            0: "Round 64", 1: "Round 32", 2: "Round 16", 3: "Quarter", 4: "Semi", 5: "Final", 6: "Winner"
+        },
+        # ATP 500/250 (6 rounds)
+        6: {
+            0: "Round 32", 1: "Round 16", 2: "Quarter", 3: "Semi", 4: "Final", 5: "Winner"
+        },
+        # Challengers (5 rounds)
+        5: {
+            0: "Round 16", 1: "Quarter", 2: "Semi", 3: "Final", 4: "Winner"
+        },
+        # Kings
+        3: {
+            0: "Semi", 1: "Final", 2: "Winner"
+        }
+    }
+
     def __init__(self, data_path='data/ranking.json'):
         self.data_path = data_path
         self.ranking_history = defaultdict(list)  # Stores points with dates
         self.players = []
+        # Combined ranking kept between update_combined_rankings calls
+        self._ranked = None      # the players list it ranks
+        self._order = []         # (-combined rating, name, list position) of active players, best first
+        self._keys = {}          # player id -> its key in _order
+        self._ratings = {}       # player id -> (combined rating, ELO rating, championship points)
+        self._states = {}        # player id -> _rating_state when last rated
         self.load_ranking()
 
+    @property
+    def players(self):
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        # The id index (see get_current_points) follows every assignment
+        self._players = players
+        self._players_by_id = {p['id']: p for p in reversed(players)}
+
     def load_ranking(self):
+        if self.data_path is None:  # History kept in memory only
+            self.ranking_history = defaultdict(list)
+            return
         try:
             with open(self.data_path) as f:
                 data = json.load(f)
@@ -107,6 +151,8 @@ class RankingSystem:
             self.ranking_history = defaultdict(list)
 
     def save_ranking(self):
+        if self.data_path is None:
+            return
         with open(self.data_path, 'w') as f:
             json.dump({'history': dict(self.ranking_history)}, f, indent=2)
 
@@ -119,43 +165,20 @@ class RankingSystem:
         is_kings = tournament_category.startswith("Special")
         is_itf = tournament_category.startswith("ITF")
         is_jun = tournament_category.startswith("Juniors")
-        round_mapping = {
-            # Grand Slams (8 rounds including final)
-            8: {
-                0: "Round 128", 1: "Round 64", 2: "Round 32", 3: "Round 16", 4: "Quarter", 5: "Semi", 6: "Final", 7: "Winner"
-            },
-            # Masters 1000 (7 rounds)
-            7: {
-                0: "Round 64", 1: "Round 32", 2: "Round 16", 3: "Quarter", 4: "Semi", 5: "Final", 6: "Winner"
-            },
-            # ATP 500/250 (6 rounds)
-            6: {
-                0: "Round 32", 1: "Round 16", 2: "Quarter", 3: "Semi", 4: "Final", 5: "Winner"
-            },
-            # Challengers (5 rounds)
-            5: {
-                0: "Round 16", 1: "Quarter", 2: "Semi", 3: "Final", 4: "Winner"
-            },
-            # Kings
-            3: {
-                0: "Semi", 1: "Final", 2: "Winner"
-            }
-        }
-        
         if is_challenger:
-            mapping = round_mapping[5]
+            mapping = self.ROUND_NAMES[5]
         elif is_itf:
-            mapping = round_mapping[5]
+            mapping = self.ROUND_NAMES[5]
         elif is_jun:
-            mapping = round_mapping[5]
+            mapping = self.ROUND_NAMES[5]
         elif is_250500:
-            mapping = round_mapping[6]
+            mapping = self.ROUND_NAMES[6]
         elif is_masters:
-            mapping = round_mapping[7]
+            mapping = self.ROUND_NAMES[7]
         elif is_gs:
-            mapping = round_mapping[8]
+            mapping = self.ROUND_NAMES[8]
         elif is_kings:
-            mapping = round_mapping[3]
+            mapping = self.ROUND_NAMES[3]
             
         round_name = mapping.get(round_reached, "")
         points = self.POINTS.get(tournament_category, {}).get(round_name, 0)
@@ -167,7 +190,7 @@ class RankingSystem:
         if isinstance(current_date, datetime):
             current_date = current_date.date()
             
-        player = next((p for p in self.players if p['id'] == player_id), None)
+        player = self._players_by_id.get(player_id)
         if not player or player.get('retired', False):
             return 0
     
@@ -286,9 +309,13 @@ class RankingSystem:
         Update ELO ratings after a match
         result: 1 if player1 wins, 0 if player2 wins, 0.5 for draw
         """
-        # Find players
-        player1 = next((p for p in players if p['id'] == player1_id), None)
-        player2 = next((p for p in players if p['id'] == player2_id), None)
+        # Find players (through the index when they are the players ranked here)
+        if players is self.players:
+            player1 = self._players_by_id.get(player1_id)
+            player2 = self._players_by_id.get(player2_id)
+        else:
+            player1 = next((p for p in players if p['id'] == player1_id), None)
+            player2 = next((p for p in players if p['id'] == player2_id), None)
         
         if not player1 or not player2:
             return
@@ -386,48 +413,104 @@ class RankingSystem:
         championship_points = self.get_current_points(player['id'], current_date)
         return elo_rating + championship_points
 
+    @staticmethod
+    def _rating_state(player):
+        """
+        What a player's combined rating depends on: ELO rating, retirement and
+        tournament history. The history is the list itself (compared by
+        identity; it is replaced when old entries are dropped or a player is
+        merged back from a worker), its length (a new tournament) and its last
+        entry's round (the current tournament, updated in place as the player
+        goes through).
+        """
+        history = player.get('tournament_history')
+        last = history[-1] if history else None
+        return (player.get('elo_rating', 0), player.get('retired', False), history,
+                len(history) if history else 0,
+                (last.get('category'), last.get('round')) if last else None)
+
+    @staticmethod
+    def _same_state(a, b):
+        return a[2] is b[2] and a[:2] == b[:2] and a[3:] == b[3:]
+
     def update_combined_rankings(self, players, current_date):
-        """Update rankings based on combined ELO + Championship points"""
+        """
+        Rank active players by combined rating (ELO + championship points),
+        writing rank, points, elo_points and championship_points into them.
+        Returns the rank changes as {player_id: (old_rank, new_rank)}.
+
+        Ratings are kept between calls with the same players list: only the
+        players whose ELO rating or tournament history changed since (see
+        _rating_state) are rated again and moved in the sorted order, and only
+        the places between the first and the last move are renumbered. A new
+        list (load, retirements, newgens) is ranked from scratch.
+        """
         if isinstance(current_date, datetime):
             current_date = current_date.date()
-            
-        self.players = players
-        
-        # Calculate combined ratings for all players
-        ranked_players = []
-        for player in players:
+
+        if players is not self.players:
+            self.players = players
+        if players is not self._ranked:
+            self._ranked = players
+            self._order = []
+            self._keys = {}
+            self._ratings = {}
+            self._states = {}
+
+        changed = []
+        for position, player in enumerate(players):
+            state = self._rating_state(player)
+            previous = self._states.get(player['id'])
+            if previous is None or not self._same_state(previous, state):
+                changed.append((position, player, state))
+        if not changed:
+            return {}
+
+        # Take the changed players out of the order, then put them back at their new places
+        order = self._order
+        size = len(order)
+        places = []
+        for _, player, _ in changed:
+            key = self._keys.pop(player['id'], None)
+            if key is not None:
+                places.append(bisect_left(order, key))
+        for place in sorted(places, reverse=True):
+            del order[place]
+        new_keys = []
+        for position, player, state in changed:
+            self._states[player['id']] = state
             if player.get('retired', False):
+                self._ratings.pop(player['id'], None)
                 continue
             elo_rating = self.get_elo_rating(player)
             championship_points = self.get_current_points(player['id'], current_date)
             combined_rating = elo_rating + championship_points
-            
-            ranked_players.append({
-                'id': player['id'],
-                'name': player['name'],
-                'combined_rating': combined_rating,
-                'elo_rating': elo_rating,
-                'championship_points': championship_points
-            })
-        
-        # Sort by combined rating descending
-        ranked_players.sort(key=lambda x: (-x['combined_rating'], x['name']))
-        
-        # Update ranks in player objects
+            self._ratings[player['id']] = (combined_rating, elo_rating, championship_points)
+            key = (-combined_rating, player['name'], position)
+            self._keys[player['id']] = key
+            insort(order, key)
+            new_keys.append(key)
+        places.extend(bisect_left(order, key) for key in new_keys)
+        if not places:
+            return {}
+
+        # Places outside [first, last] keep their players, so only these are renumbered
+        first = min(places)
+        last = len(order) - 1 if len(order) != size else max(places)
         ranking_changes = {}
-        for rank, player_data in enumerate(ranked_players, 1):
-            for player in players:
-                if player['id'] == player_data['id']:
-                    old_rank = player.get('rank', 999)
-                    player['rank'] = rank
-                    # Store separate values for display
-                    player['points'] = player_data['combined_rating']  # Total for main display
-                    player['elo_points'] = player_data['elo_rating']  # ELO component
-                    player['championship_points'] = player_data['championship_points']  # Championship component
-                    if old_rank != rank:
-                        ranking_changes[player['id']] = (old_rank, rank)
-                    break
-                    
+        for place in range(first, last + 1):
+            player = players[order[place][2]]
+            rank = place + 1
+            old_rank = player.get('rank', 999)
+            combined_rating, elo_rating, championship_points = self._ratings[player['id']]
+            player['rank'] = rank
+            # Store separate values for display
+            player['points'] = combined_rating  # Total for main display
+            player['elo_points'] = elo_rating  # ELO component
+            player['championship_points'] = championship_points  # Championship component
+            if old_rank != rank:
+                ranking_changes[player['id']] = (old_rank, rank)
+
         return ranking_changes
     
     def calculate_junior_ranking(self, player):
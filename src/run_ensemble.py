@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Ensemble runner: play M independent universes from one starting save (or
+default data), each with its own seed, for K seasons each in a process pool,
+and aggregate compact per-season summaries: big-event champions, Hall of
+Fame entries, weeks at #1 and match win shares by archetype. Run from the
+repository root, like main_tk.
+
+Each worker plays one universe at a time in a private copy of the files the
+scheduler reads and writes, and puts each season's summary on a queue as soon
+as the season ends. The aggregator folds summaries into running totals as
+they arrive (and appends them to --out as JSON lines), so memory stays bounded
+however many universes and seasons are played.
+
+Usage: python src/run_ensemble.py --universes M --seasons K [--save PATH] [--new] [--seed N]
+                                  [--workers W] [--fidelity] [--out FILE]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from archetypes import get_archetype_for_player
+from run_headless import peak_rss
+from schedule import TournamentScheduler
+from sim.fidelity import FidelityPolicy
+from sim.rng import derive_seed, new_master_seed
+
+MAJOR_CATEGORIES = ("Special", "Grand Slam", "Masters 1000")
+DATA_FILES = ("default_data.json", "names.json", "ranking.json")
+
+
+def archetype(player):
+    return get_archetype_for_player(player)[0]
+
+
+def play_universe(task, summaries):
+    """
+    Worker: play one universe for `seasons` seasons in a temporary directory,
+    putting each season's summary (see play_season) on the `summaries` queue.
+    """
+    universe, seed, save_path, seasons, fidelity = task
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-universe-')
+    try:
+        os.mkdir(os.path.join(workdir, 'data'))
+        for name in DATA_FILES:
+            shutil.copy(os.path.join(cwd, 'data', name), os.path.join(workdir, 'data', name))
+        start_save = os.path.join(workdir, 'data', 'start.json')
+        if save_path:
+            shutil.copy(os.path.join(cwd, save_path), start_save)
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler = TournamentScheduler(save_path=start_save, seed=seed,
+                                            fidelity=FidelityPolicy() if fidelity else None)
+            start_ids = {p['id'] for p in scheduler.players}
+            for _ in range(seasons):
+                summaries.put(play_season(scheduler, universe, start_ids))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def play_season(scheduler, universe, start_ids):
+    """Play weeks until the next season starts; returns the season's summary."""
+    year = scheduler.current_year
+    hof_before = {h['name'] for h in scheduler.hall_of_fame}
+    w1_before = {p['id']: p.get('w1', 0) for p in scheduler.players}
+    champions = []
+    played = Counter()
+    won = Counter()
+    while scheduler.current_year == year:
+        tournaments = scheduler.simulate_current_week()
+        players = {p['id']: p for p in scheduler.players}
+        # This week's archetypes (skills develop from week to week)
+        archetypes = {pid: archetype(player) for pid, player in players.items()}
+        for tournament in tournaments:
+            for round_matches in tournament.get('bracket', []):
+                for p1, p2, winner, *_ in round_matches:
+                    if p1 is None or p2 is None or winner is None:
+                        continue
+                    played[archetypes[p1]] += 1
+                    played[archetypes[p2]] += 1
+                    won[archetypes[winner]] += 1
+            winner = players.get(tournament.get('winner_id'))
+            if winner is not None and tournament.get('category') in MAJOR_CATEGORIES:
+                champions.append({'tournament': tournament['name'], 'category': tournament['category'],
+                                  'player': winner['name'], 'archetype': archetypes[winner['id']],
+                                  'newgen': winner['id'] not in start_ids})
+        scheduler.advance_week(news=False)
+    rank1 = Counter()
+    for p in scheduler.players:
+        weeks = p.get('w1', 0) - w1_before.get(p['id'], 0)
+        if weeks > 0:
+            rank1[archetype(p)] += weeks
+    return {
+        'universe': universe,
+        'season': year,
+        'champions': champions,
+        'hof_entries': [h['name'] for h in scheduler.hall_of_fame if h['name'] not in hof_before],
+        'rank1_weeks': dict(rank1),
+        'rank1_players': sum(1 for p in scheduler.players if p.get('w1', 0) > w1_before.get(p['id'], 0)),
+        'archetype_matches': dict(played),
+        'archetype_wins': dict(won),
+    }
+
+
+class Aggregate:
+    """Running totals over season summaries; its size depends on the archetypes, not the seasons."""
+
+    def __init__(self):
+        self.seasons = 0
+        self.titles = Counter()          # archetype -> major titles
+        self.newgen_titles = 0
+        self.hof_entries = 0
+        self.rank1_weeks = Counter()     # archetype -> weeks at #1
+        self.rank1_players = 0
+        self.matches = Counter()
+        self.wins = Counter()
+        self.win_rate = defaultdict(lambda: [0, 0.0, 0.0])   # archetype -> Welford (n, mean, M2) per season
+
+    def add(self, summary):
+        self.seasons += 1
+        for champion in summary['champions']:
+            self.titles[champion['archetype']] += 1
+            self.newgen_titles += champion['newgen']
+        self.hof_entries += len(summary['hof_entries'])
+        self.rank1_weeks.update(summary['rank1_weeks'])
+        self.rank1_players += summary['rank1_players']
+        self.matches.update(summary['archetype_matches'])
+        self.wins.update(summary['archetype_wins'])
+        for name, played in summary['archetype_matches'].items():
+            rate = summary['archetype_wins'].get(name, 0) / played
+            stats = self.win_rate[name]
+            stats[0] += 1
+            delta = rate - stats[1]
+            stats[1] += delta / stats[0]
+            stats[2] += delta * (rate - stats[1])
+
+    def report(self):
+        titles = sum(self.titles.values()) or 1
+        weeks = sum(self.rank1_weeks.values()) or 1
+        print(f"  {self.seasons} seasons: {self.hof_entries / self.seasons:.2f} Hall of Fame entries and"
+              f" {self.rank1_players / self.seasons:.2f} different #1s per season,"
+              f" {self.newgen_titles / titles:.1%} of major titles won by newgens")
+        print(f"  {'archetype':<32} {'matches':>8} {'win rate':>9} {'sd/season':>10} {'titles':>7} {'#1 weeks':>9}")
+        for name, played in self.matches.most_common():
+            n, _, m2 = self.win_rate[name]
+            sd = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+            print(f"  {name:<32} {played:>8} {self.wins[name] / played:>9.3f} {sd:>10.3f}"
+                  f" {self.titles[name] / titles:>7.1%} {self.rank1_weeks[name] / weeks:>9.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--universes', type=int, required=True)
+    parser.add_argument('--seasons', type=int, required=True)
+    parser.add_argument('--save', default='data/save.json', help='starting save')
+    parser.add_argument('--new', action='store_true', help='start from default data')
+    parser.add_argument('--seed', type=int, help='ensemble seed; universe u plays with a seed derived from it')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--fidelity', action='store_true', help='play lower categories with cheaper models')
+    parser.add_argument('--out', help='append every season summary to this file as a JSON line')
+    args = parser.parse_args()
+
+    save_path = None if args.new else args.save
+    if save_path and not os.path.exists(save_path):
+        parser.error(f"no save at {save_path} (use --new to start from default data)")
+    seed = args.seed if args.seed is not None else new_master_seed()
+    tasks = ((u, derive_seed(seed, "universe", u), save_path, args.seasons, args.fidelity)
+             for u in range(args.universes))
+
+    aggregate = Aggregate()
+    start = time.perf_counter()
+    expected = args.universes * args.seasons
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=args.workers) as pool, \
+            (open(args.out, 'a') if args.out else contextlib.nullcontext()) as out:
+        summaries = manager.Queue()
+        pending = set()
+        while aggregate.seasons < expected:
+            # Keep a bounded window of universes in flight
+            while len(pending) < 2 * args.workers:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                pending.add(pool.submit(play_universe, task, summaries))
+            # Free finished universes' slots; result() raises a worker's exception
+            # instead of waiting for its seasons forever
+            finished, pending = wait(pending, timeout=0, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+            try:
+                summary = summaries.get(timeout=1)
+            except queue.Empty:
+                continue
+            aggregate.add(summary)
+            if out is not None:
+                out.write(json.dumps(summary) + "\n")
+                out.flush()
+            print(f"  universe {summary['universe']} season {summary['season']}:"
+                  f" {aggregate.seasons}/{expected} seasons ({time.perf_counter() - start:.0f}s)")
+    elapsed = time.perf_counter() - start
+
+    print(f"  ensemble seed {seed}, {args.universes} universes x {args.seasons} seasons in {elapsed:.1f}s,"
+          f" peak RSS {peak_rss()}, workers {peak_rss(children=True)}")
+    aggregate.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Headless season runner: load a save (or default data) and play weeks of
+tournaments and advance_week without the Tk app, for long simulations on
+machines without a display. Run from the repository root, like main_tk.
+
+News and the all-time records table are only brought up to date at
+checkpoints (every --checkpoint weeks and the last week), where the save is
+written too; --news keeps them up to date every week. At the end prints
+weeks/sec, matches/sec and peak RSS. The ranking history goes to
+data/ranking.json when continuing a save and next to --save for a new game
+(--new); --no-save writes no file at all.
+
+A new game (--new) checkpoints to data/headless_save.json unless --save
+names another file, so the app's data/save.json is only written when it is
+the save being continued.
+
+Usage: python src/run_headless.py (--weeks N | --years N) [--save PATH] [--new] [--seed N]
+                                  [--checkpoint K] [--news] [--workers W] [--fidelity] [--no-save]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from schedule import TournamentScheduler
+from sim.fidelity import FidelityPolicy
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+APP_SAVE = os.path.join('data', 'save.json')
+NEW_GAME_SAVE = os.path.join('data', 'headless_save.json')
+
+
+def peak_rss(children=False):
+    """Peak resident set size, as text (ru_maxrss is in KB on Linux, bytes on macOS)."""
+    if resource is None:
+        return "n/a"
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return f"{peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024:.0f} MB"
+
+
+def matches_played(tournaments):
+    return sum(1 for t in tournaments for round_matches in t.get('bracket', [])
+               for m in round_matches if m[0] is not None and m[1] is not None)
+
+
+def run(scheduler, weeks, checkpoint, news, map_tournaments, save_path, quiet):
+    """Play `weeks` weeks; returns the number of matches played."""
+    matches = 0
+    for week in range(1, weeks + 1):
+        at_checkpoint = week == weeks or (checkpoint and week % checkpoint == 0)
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            matches += matches_played(scheduler.simulate_current_week(map_tournaments))
+            scheduler.advance_week(news=news or at_checkpoint)
+        if at_checkpoint:
+            if save_path:
+                scheduler.save_game(save_path)
+            print(f"  year {scheduler.current_year} week {scheduler.current_week}: {week} weeks,"
+                  f" {matches} matches{', saved' if save_path else ''}")
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    length = parser.add_mutually_exclusive_group(required=True)
+    length.add_argument('--weeks', type=int)
+    length.add_argument('--years', type=int, help='52 weeks each')
+    parser.add_argument('--save', help='save to load and to write at checkpoints'
+                        f' (default: {APP_SAVE}, or {NEW_GAME_SAVE} with --new)')
+    parser.add_argument('--new', action='store_true', help='start from default data even if the save exists')
+    parser.add_argument('--seed', type=int, help='master seed of a new game (see sim.rng)')
+    parser.add_argument('--checkpoint', type=int, default=52, help='weeks between checkpoints (0: last week only)')
+    parser.add_argument('--news', action='store_true', help='generate news and records every week')
+    parser.add_argument('--workers', type=int, default=1, help='processes playing a week\'s tournaments')
+    parser.add_argument('--fidelity', action='store_true', help='play lower categories with cheaper models')
+    parser.add_argument('--no-save', action='store_true', help='never write the save or the ranking history')
+    parser.add_argument('--verbose', action='store_true', help='keep the scheduler\'s own output')
+    args = parser.parse_args()
+
+    weeks = args.weeks if args.weeks is not None else 52 * args.years
+    if args.save is None:
+        # A new game never checkpoints over the app's own save
+        args.save = NEW_GAME_SAVE if args.new else APP_SAVE
+    # The ranking history is written as points are awarded: nowhere with --no-save,
+    # and next to the save for a new game, so the game's own data/ranking.json is kept
+    if args.no_save:
+        ranking_path = None
+    elif args.new:
+        ranking_path = os.path.splitext(args.save)[0] + '_ranking.json'
+    else:
+        ranking_path = os.path.join('data', 'ranking.json')
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) if not args.verbose else contextlib.nullcontext():
+        scheduler = TournamentScheduler(save_path=None if args.new else args.save, seed=args.seed,
+                                        fidelity=FidelityPolicy() if args.fidelity else None,
+                                        ranking_path=ranking_path)
+    if args.no_save:
+        scheduler.newgen_generator.names_path = None   # newgens' names go on from data/names.json in memory
+    print(f"  loaded year {scheduler.current_year} week {scheduler.current_week}"
+          f" (seed {scheduler.rng_seed}) in {time.perf_counter() - start:.1f}s")
+
+    save_path = None if args.no_save else args.save
+    start = time.perf_counter()
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            matches = run(scheduler, weeks, args.checkpoint, args.news, pool.map, save_path, not args.verbose)
+    else:
+        matches = run(scheduler, weeks, args.checkpoint, args.news, None, save_path, not args.verbose)
+    elapsed = time.perf_counter() - start
+
+    children = f", workers {peak_rss(children=True)}" if args.workers > 1 else ""
+    print(f"  {weeks} weeks, {matches} matches in {elapsed:.1f}s: {weeks / elapsed:.2f} weeks/s,"
+          f" {matches / elapsed:.0f} matches/s, peak RSS {peak_rss()}{children}")
+
+
+if __name__ == "__main__":
+    main()
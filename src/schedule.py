@@ -6,6 +6,10 @@ from math import log2, ceil
 from datetime import datetime, timedelta
 from collections import defaultdict
 from sim.game_engine import GameEngine  # Import the Game Engine
+from sim.fidelity import FULL
+from sim.instrument import EngineProfile
+from sim.rng import derive_seed, make_rng, new_master_seed
+from sim.replay import make_replay, player_snapshot, replay_match, snapshot_hash
 from ranking import RankingSystem
 from player_development import PlayerDevelopment
 from newgen import NewGenGenerator
@@ -71,13 +75,39 @@ class TournamentScheduler:
 
         return [p + 1 for p in positions]  # convert to 1-based
     
-    def __init__(self, data_path='data/default_data.json', save_path='data/save.json'):
+    def __init__(self, data_path='data/default_data.json', save_path='data/save.json', seed=None,
+                 outcome_cache=None, fidelity=None, profile=None, ranking_path='data/ranking.json'):
+        """
+        Load the saved game (or default data; always with save_path=None) and
+        set up rankings and news.
+        seed is the master seed of every random stream (see sim.rng); by default
+        it comes from the save, or is freshly drawn for a new game.
+        outcome_cache (a sim.outcome_cache.OutcomeCache) makes unwatched
+        matches draw from pooled outcomes of the same matchup instead of
+        being simulated; off by default.
+        fidelity (a sim.fidelity.FidelityPolicy) plays unwatched matches of
+        the categories it names with a cheaper model, calibrated against the
+        full engine at load and at every new season; off by default.
+        profile (a sim.instrument.EngineProfile) instruments every match the
+        engine plays here; each week's profile is kept in profile_weeks and
+        each season's in profile_seasons (see _close_profile_week); off by
+        default.
+        ranking_path is the file the ranking history is read from and written
+        to as points are awarded; None keeps it in memory only.
+        """
         self.data_path = data_path
         self.save_path = save_path
+        self.rng_seed = seed
+        self.outcome_cache = outcome_cache
+        self.fidelity = fidelity
+        self.profile = profile
+        self.profile_weeks = []      # {'year', 'week', **EngineProfile.report()} per week played
+        self.profile_seasons = {}    # year -> EngineProfile.report() of the whole season
+        self._season_profile = EngineProfile(profile.timers) if profile is not None else None
         self.current_week = 1
         self.current_year = 1
         self.current_date = datetime(2025, 1, 1)
-        self.ranking_system = RankingSystem()
+        self.ranking_system = RankingSystem(data_path=ranking_path)
         self.newgen_generator = NewGenGenerator()
         self.hall_of_fame = []
         self.previous_rankings = {}
@@ -90,6 +120,7 @@ class TournamentScheduler:
             'pending_matches': []
         }
         self.load_data(data_path, save_path)
+        self.rng = self.stream("week", self.current_year, self.current_week)
         self.records = []
         self.records_manager = RecordsManager(self)
         self.records_manager.update_all_records()
@@ -111,6 +142,7 @@ class TournamentScheduler:
             if 'elo_rating' not in player:
                 self.ranking_system.initialize_elo_ratings(self.players)
                 break
+        self._calibrate_fidelity()
         
         self.ranking_system.update_combined_rankings(self.players, self.current_date)
         self.ranking_system.update_all_junior_rankings(self.players)
@@ -118,6 +150,34 @@ class TournamentScheduler:
         # Generate only the tournament showcase at launch
         self.news_feed = self._generate_tournament_showcase()
         
+    @property
+    def players(self):
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        # Assigning the list rebuilds the id index (see get_player), so the
+        # list is only ever replaced, never grown or shrunk in place.
+        self._players = players
+        self._players_by_id = {p['id']: p for p in reversed(players)}
+
+    @property
+    def tournaments(self):
+        return self._tournaments
+
+    @tournaments.setter
+    def tournaments(self, tournaments):
+        self._tournaments = tournaments
+        self._tournaments_by_id = {t['id']: t for t in reversed(tournaments)}
+
+    def get_player(self, player_id):
+        """The active player with this id, or None (retired players are dropped from players)."""
+        return self._players_by_id.get(player_id)
+
+    def get_tournament(self, tournament_id):
+        """The tournament with this id; raises KeyError if there is none."""
+        return self._tournaments_by_id[tournament_id]
+
     def save_game(self, save_path='data/save.json'):
         """Save all game data to a file"""
         game_data = {
@@ -127,69 +187,86 @@ class TournamentScheduler:
             'players': self.players,
             'tournaments': self.tournaments,
             'hall_of_fame': self.hall_of_fame,
-            'records': self.records
+            'records': self.records,
+            'rng_seed': self.rng_seed
         }
     
         with open(save_path, 'w') as f:
             json.dump(game_data, f, indent=2)
         
-    def load_data(self, data_path='data/default_data.json', save_path='data/save.json'):
+    def _load_default_data(self, data_path):
+        """Start a new game from the default data at data_path."""
         try:
-            # Try loading saved game
-            with open(save_path) as f:
-                data = json.load(f)
-                self.players = data['players']
-                self.tournaments = data['tournaments']
-                for player in self.players:
-                    if 'retired' not in player: 
-                        player['retired'] = False
-                self.current_year = data['current_year']
-                self.current_week = data['current_week']
-                self.current_date = datetime.fromisoformat(data['current_date'])
-                self.records = data.get('records', [])
-                
-                for player in self.players:
-                    # Initialize required player stats if missing
-                    if 'tournament_history' not in player:
-                        player['tournament_history'] = []
-                    if 'tournament_wins' not in player:
-                        player['tournament_wins'] = []
-                    if 'matches_played' not in player:
-                        # Calculate matches_played from tournament_history
-                        player['matches_played'] = len(player['tournament_history'])
-                self.ranking_system.ranking_history = defaultdict(list)
-                for player_id, entries in data.get('ranking_history', {}).items():
-                    self.ranking_system.ranking_history[int(player_id)] = entries
-                self.hall_of_fame = data.get('hall_of_fame', [])
-                self.world_crown = data.get('world_crown', {
-                    'current_bracket': {},
-                    'current_year_teams': {},
-                    'match_results': {},
-                    'winners_history': [],
-                    'pending_matches': []
-                })
-            print("Loaded saved game")
-        except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
-            print (f"Error loading saved game: {str(e)}")
-            try:
-                with open(data_path) as f:
-                    default_data = json.load(f)
-                    self.players = default_data['players']
-                    self.tournaments = default_data['tournaments']
-                    self.current_year = 1
-                    self.current_week = 1
-                    self.current_date = datetime(2025, 1, 1)
-                    self.ranking_system.ranking_history = defaultdict(list)
-                    self.hall_of_fame = []
-                    print("Loaded default data")
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                print(f"Error loading default data: {str(e)}. Creating minimal data.")
-                self.players = []
-                self.tournaments = []
+            with open(data_path) as f:
+                default_data = json.load(f)
+                self.players = default_data['players']
+                self.tournaments = default_data['tournaments']
                 self.current_year = 1
                 self.current_week = 1
                 self.current_date = datetime(2025, 1, 1)
+                self.ranking_system.ranking_history = defaultdict(list)
                 self.hall_of_fame = []
+                print("Loaded default data")
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Error loading default data: {str(e)}. Creating minimal data.")
+            self.players = []
+            self.tournaments = []
+            self.current_year = 1
+            self.current_week = 1
+            self.current_date = datetime(2025, 1, 1)
+            self.hall_of_fame = []
+
+    def load_data(self, data_path='data/default_data.json', save_path='data/save.json'):
+        """
+        Load the save at save_path, or start a new game from data_path when there
+        is no readable save; save_path=None always starts a new game.
+        """
+        if save_path is None:
+            self._load_default_data(data_path)
+        else:
+            try:
+                # Try loading saved game
+                with open(save_path) as f:
+                    data = json.load(f)
+                    self.players = data['players']
+                    self.tournaments = data['tournaments']
+                    for player in self.players:
+                        if 'retired' not in player: 
+                            player['retired'] = False
+                    self.current_year = data['current_year']
+                    self.current_week = data['current_week']
+                    self.current_date = datetime.fromisoformat(data['current_date'])
+                    self.records = data.get('records', [])
+                    if self.rng_seed is None:
+                        self.rng_seed = data.get('rng_seed')
+                
+                    for player in self.players:
+                        # Initialize required player stats if missing
+                        if 'tournament_history' not in player:
+                            player['tournament_history'] = []
+                        if 'tournament_wins' not in player:
+                            player['tournament_wins'] = []
+                        if 'matches_played' not in player:
+                            # Calculate matches_played from tournament_history
+                            player['matches_played'] = len(player['tournament_history'])
+                    self.ranking_system.ranking_history = defaultdict(list)
+                    for player_id, entries in data.get('ranking_history', {}).items():
+                        self.ranking_system.ranking_history[int(player_id)] = entries
+                    self.hall_of_fame = data.get('hall_of_fame', [])
+                    self.world_crown = data.get('world_crown', {
+                        'current_bracket': {},
+                        'current_year_teams': {},
+                        'match_results': {},
+                        'winners_history': [],
+                        'pending_matches': []
+                    })
+                print("Loaded saved game")
+            except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+                print (f"Error loading saved game: {str(e)}")
+                self._load_default_data(data_path)
+        if self.rng_seed is None:
+            self.rng_seed = new_master_seed()
+        rng = self.stream("migration")
         for player in self.players:
             if 'retired' not in player:
                 player['retired'] = False
@@ -201,9 +278,9 @@ class TournamentScheduler:
             # MIGRATION: Ensure dropshot/volley skills and tendencies exist
             skills = player.setdefault('skills', {})
             if 'dropshot' not in skills:
-                skills['dropshot'] = random.randint(25, 55)
+                skills['dropshot'] = rng.randint(25, 55)
             if 'volley' not in skills:
-                skills['volley'] = random.randint(25, 55)
+                skills['volley'] = rng.randint(25, 55)
             # MIGRATION: Ensure mental skill exists (set to average of other skills)
             if 'mental' not in skills:
                 other_vals = [v for k, v in skills.items() if k != 'mental']
@@ -215,9 +292,9 @@ class TournamentScheduler:
                     skills[new_skill] = round(sum(other_vals) / max(1, len(other_vals))) if other_vals else 50
             # Tendencies: cross, straight, dropshot, volley
             if not all(k in player for k in ('cross_tend', 'straight_tend', 'dropshot_tend', 'volley_tend')):
-                dropshot_tend = random.randint(0, 10)
-                volley_tend = random.randint(0, 10)
-                straight_tend = random.randint(40, 60)
+                dropshot_tend = rng.randint(0, 10)
+                volley_tend = rng.randint(0, 10)
+                straight_tend = rng.randint(40, 60)
                 cross_tend = 100 - (dropshot_tend + volley_tend + straight_tend)
                 if cross_tend < 10:
                     diff = 10 - cross_tend
@@ -233,9 +310,9 @@ class TournamentScheduler:
                 player['volley_tend'] = volley_tend
             # MIGRATION: Ensure lift_tend, slice_tend exist
             if 'lift_tend' not in player:
-                player['lift_tend'] = random.randint(3, 20)
+                player['lift_tend'] = rng.randint(3, 20)
             if 'slice_tend' not in player:
-                player['slice_tend'] = random.randint(3, 20)
+                player['slice_tend'] = rng.randint(3, 20)
             # MIGRATION: Ensure peak_skills exists (snapshot current skills as initial peak)
             if 'peak_skills' not in player:
                 player['peak_skills'] = {k: v for k, v in player.get('skills', {}).items()}
@@ -243,20 +320,65 @@ class TournamentScheduler:
             _NEW_MENTALITIES = ["neutral", "opportunist", "strategist", "disruptor", "marathonian",
                                 "brute", "baseliner", "net-player", "specialist", "wildcard"]
             if player.get('mentality', 'neutral') not in _NEW_MENTALITIES:
-                player['mentality'] = random.choice(_NEW_MENTALITIES)
+                player['mentality'] = rng.choice(_NEW_MENTALITIES)
         # MIGRATION: Generate peak_skills for HOF members that lack them
         for hof in self.hall_of_fame:
             if 'peak_skills' not in hof or not hof.get('peak_skills'):
-                hof['peak_skills'] = self._generate_hof_peak_skills(hof)
+                hof['peak_skills'] = self._generate_hof_peak_skills(hof, rng)
             if 'hand' not in hof:
-                hof['hand'] = random.choice(['Right', 'Right', 'Right', 'Left'])
+                hof['hand'] = rng.choice(['Right', 'Right', 'Right', 'Left'])
             if 'archetype' not in hof:
                 hof['archetype'] = 'All-Rounder'
     
+    def stream(self, *path):
+        """Independent random.Random for `path` under this game's master seed (see sim.rng)."""
+        return make_rng(self.rng_seed, *path)
+
+    def match_seed(self, tournament, match_idx):
+        """Seed of one match of the current round, fixed by its place in the calendar and the bracket."""
+        return derive_seed(self.rng_seed, "match", self.current_year, self.current_week, tournament['id'],
+                           tournament['current_round'], match_idx)
+
+    def match_rng(self, tournament, match_idx):
+        """Random stream of one match of the current round (see match_seed)."""
+        return random.Random(self.match_seed(tournament, match_idx))
+
+    def replay_match(self, tournament_id, round_idx, match_idx):
+        """
+        Play a finished match again from its replay record (see sim.replay).
+        Returns (engine, events) like sim.replay.replay_match; raises KeyError
+        if the match has no record (byes, or tournaments reset since).
+        """
+        tournament = self.get_tournament(tournament_id)
+        record = tournament.get('replays', {})[f"{round_idx}-{match_idx}"]
+        return replay_match(record, tournament['player_snapshots'])
+
+    def _close_profile_week(self):
+        """
+        Move the engine profile of the week just played into profile_weeks and
+        the season's total, which goes to profile_seasons after week 52.
+        Matches played in worker processes (map_matches) are not profiled.
+        """
+        if self.profile is None:
+            return
+        self.profile_weeks.append({'year': self.current_year, 'week': self.current_week, **self.profile.report()})
+        self._season_profile.merge(self.profile)
+        self.profile.reset()
+        if self.current_week >= 52:
+            self.profile_seasons[self.current_year] = self._season_profile.report()
+            self._season_profile.reset()
+
     def get_current_week_tournaments(self):
         return [t for t in self.tournaments if t['week'] == self.current_week]
     
-    def advance_week(self):
+    def advance_week(self, news=True):
+        """
+        Move to the next week: new season at week 52, draws, rankings and
+        player development, then records and news. news=False skips the news
+        feed and the all-time records table (brought up to date by the next
+        week played with news), for batch runs nobody reads week by week.
+        """
+        self._close_profile_week()
         self.old_rankings = {p['id']: p['rank'] for p in self.players if not p.get('retired', False)}
         self.current_week += 1
         self.current_date += timedelta(days=7)
@@ -271,11 +393,15 @@ class TournamentScheduler:
                 tournament['bracket'] = []
                 tournament['current_round'] = 0
                 tournament['active_matches'] = []
+                tournament['replays'] = {}
+                tournament['player_snapshots'] = {}
         self._cleanup_old_tournament_history()
         if self.current_week > 52:
             self.current_week = 1
             self.current_year += 1
-            self.current_year_retirees = self._process_retirements()
+            self.rng = self.stream("week", self.current_year, self.current_week)
+            season_rng = self.stream("season", self.current_year)
+            self.current_year_retirees = self._process_retirements(season_rng)
             retired_count = len(self.current_year_retirees)
             # Age up active players and update yearly ranking tracking
             for player in self.players:
@@ -298,6 +424,7 @@ class TournamentScheduler:
             candidate_count = retired_count * 2                    # generate exactly 2x retirees
 
             if candidate_count > 0 and slots > 0:
+                self.newgen_generator.rng = season_rng
                 new_players = self.newgen_generator.generate_new_players(
                     self.current_year,
                     count=candidate_count,
@@ -318,12 +445,14 @@ class TournamentScheduler:
                 to_add = [p for p, _ in scored[:min(slots, candidate_count)]]
                 for p in to_add:
                     p.setdefault('favorite', False)
-                self.players.extend(to_add)
+                self.players = self.players + to_add
             # If no retirees or no slots, add nobody.
 
             self._reset_tournaments_for_new_year()
             self._rebuild_ranking_history()
+            self._calibrate_fidelity()
         else:
+            self.rng = self.stream("week", self.current_year, self.current_week)
             current_week_tournaments = [t for t in self.tournaments if t['week'] == self.current_week]
             if current_week_tournaments:
                 self.assign_players_to_tournaments()
@@ -349,7 +478,7 @@ class TournamentScheduler:
             for p in self.players if not p.get('retired', False)
         }
         PlayerDevelopment.seasonal_development(self)
-        PlayerDevelopment.weekly_development(self)
+        PlayerDevelopment.weekly_development(self, rng=self.rng)
         # Track peak skills: snapshot skills when overall is a new personal best
         for p in self.players:
             if p.get('retired', False):
@@ -361,12 +490,12 @@ class TournamentScheduler:
                 peak_ovr = sum(peak.values()) / len(peak) if peak else 0
                 if current_ovr > peak_ovr:
                     p['peak_skills'] = {k: v for k, v in skills.items()}
-        self.previous_records = copy.deepcopy(self.records)
         self.update_weeks_at_top()
         self.records_manager.update_mawn_last_week()
-        self.records_manager.update_all_records()
-                
-        self.generate_news_feed()
+        if news:
+            self.previous_records = copy.deepcopy(self.records)
+            self.records_manager.update_all_records()
+            self.generate_news_feed()
         return self.current_week
     
     def update_weeks_at_top(self):
@@ -388,10 +517,14 @@ class TournamentScheduler:
         for player in self.players:
             if 'tournament_history' not in player:
                 continue
-            player['tournament_history'] = [
+            kept = [
                 entry for entry in player['tournament_history']
                 if not self._is_tournament_too_old(entry, cutoff_year, cutoff_week)
             ]
+            # Only a history that lost entries is replaced, so the ranking
+            # re-rates just those players (see RankingSystem._rating_state)
+            if len(kept) != len(player['tournament_history']):
+                player['tournament_history'] = kept
             
     def _is_tournament_too_old(self, tournament_entry, cutoff_year, cutoff_week):
         if tournament_entry['year'] < cutoff_year:
@@ -555,7 +688,7 @@ class TournamentScheduler:
             for tournament in juniors:
                 if len(eligible_juniors) >= 16:
                     # Randomly select 16 from eligible pool
-                    selected = random.sample(eligible_juniors, 16)
+                    selected = self.rng.sample(eligible_juniors, 16)
                     tournament['participants'] = [p['id'] for p in selected]
                     junior_player_ids.update(p['id'] for p in selected)
                     # Remove selected players from eligible pool for other junior tournaments
@@ -699,7 +832,7 @@ class TournamentScheduler:
             else:
                 # Get participation chance and roll
                 chance = get_participation_chance(player_rank, category)
-                if random.random() < chance:
+                if self.rng.random() < chance:
                     available_for_week.append(player)
                 
             # Stop if all tournaments are full
@@ -733,7 +866,7 @@ class TournamentScheduler:
             # If there are multiple tournaments in this category, shuffle to randomly distribute players across them
             # Otherwise, keep ranking order for single premium tournaments (for better seeding)
             if len(category_tournaments) > 1 or category not in PREMIUM_CATEGORIES:
-                random.shuffle(category_players)
+                self.rng.shuffle(category_players)
             
             # Distribute players to tournaments in this category
             shuffled_idx = 0
@@ -754,7 +887,7 @@ class TournamentScheduler:
                 break
 
     def generate_bracket(self, tournament_id):
-        tournament = next(t for t in self.tournaments if t['id'] == tournament_id)
+        tournament = self.get_tournament(tournament_id)
 
         # Ensure participants are assigned (handle empty lists too)
         if not tournament.get('participants'):
@@ -771,7 +904,7 @@ class TournamentScheduler:
             tournament['active_matches'] = [(winner_id, None, winner_id, "BYE")]
             self._update_player_tournament_history(tournament, winner_id, 0)
             # Add tournament win record
-            winner = next((p for p in self.players if p['id'] == winner_id), None)
+            winner = self.get_player(winner_id)
             if winner:
                 if 'tournament_wins' not in winner:
                     winner['tournament_wins'] = []
@@ -782,24 +915,26 @@ class TournamentScheduler:
                 })
             return
 
+        def listed_rank(pid):
+            player = self.get_player(pid)
+            return player['rank'] if player is not None else 999
+
         # Trim or pad to draw size
         if len(participants) > draw_size:
-            participants = sorted(
-                participants,
-                key=lambda pid: next((p['rank'] for p in self.players if p['id'] == pid), 999)
-            )[:draw_size]
+            participants = sorted(participants, key=listed_rank)[:draw_size]
         while len(participants) < draw_size:
             participants.append(None)
 
         # Define premium tournament categories that get ranking-based seeding
         PREMIUM_CATEGORIES = ["Special", "Grand Slam", "Masters 1000", "ATP 500", "ATP 250"]
+        rng = self.stream("tournament", self.current_year, self.current_week, tournament['id'])
         use_ranking_seeding = tournament['category'] in PREMIUM_CATEGORIES
         
         # Rank: best -> worst (None treated as worst)
         def rank_of(pid):
             if pid is None:
                 return 10_000_000
-            return next((p['rank'] for p in self.players if p['id'] == pid), 999)
+            return listed_rank(pid)
 
         if use_ranking_seeding:
             # Premium tournaments: use ranking-based seeding (top half vs randomized bottom half)
@@ -810,7 +945,7 @@ class TournamentScheduler:
             bottom_half = sorted_ids[half_draw:]  # Bottom half players
             
             # Randomize the bottom half for more interesting matchups
-            random.shuffle(bottom_half)
+            rng.shuffle(bottom_half)
             
             # Build pairs: top seed vs random bottom half player
             pairs = []
@@ -830,12 +965,14 @@ class TournamentScheduler:
                 bracket_positions[opp_pos] = p_bot
         else:
             # Challenger/ITF tournaments: use random seeding (shuffle all participants)
-            random.shuffle(participants)
+            rng.shuffle(participants)
             bracket_positions = participants
 
         # Build bracket rounds
         num_rounds = int(ceil(log2(draw_size)))
         tournament['bracket'] = [[] for _ in range(num_rounds)]
+        tournament['replays'] = {}
+        tournament['player_snapshots'] = {}
 
         # First round: adjacent positions form matches
         first_round = []
@@ -852,7 +989,7 @@ class TournamentScheduler:
         """
         Fetch the matches for the current round of the tournament.
         """
-        tournament = next(t for t in self.tournaments if t['id'] == tournament_id)
+        tournament = self.get_tournament(tournament_id)
         current_round = tournament['current_round']
 
         # Ensure the current round exists in the bracket
@@ -862,15 +999,22 @@ class TournamentScheduler:
         # Fetch matches for the current round
         return [
             {
-                'player1': next((p for p in self.players if p['id'] == m[0]), None),
-                'player2': next((p for p in self.players if p['id'] == m[1]), None),
-                'winner': next((p for p in self.players if p['id'] == m[2]), None) if len(m) > 2 else None
+                'player1': self.get_player(m[0]),
+                'player2': self.get_player(m[1]),
+                'winner': self.get_player(m[2]) if len(m) > 2 else None
             }
             for m in tournament['bracket'][current_round]
         ]
         
-    def simulate_through_match(self, tournament_id, target_match_idx):
-        tournament = next(t for t in self.tournaments if t['id'] == tournament_id)
+    def simulate_through_match(self, tournament_id, target_match_idx, visualize=False, match_result=None):
+        """
+        Simulate one match of the current round and record its result.
+        Point events are only produced when visualize=True; otherwise the match
+        runs headless and the returned match_log and point_events are empty.
+        A MatchResult already computed from match_task (e.g. in a worker
+        process) can be passed as match_result to record it without replaying.
+        """
+        tournament = self.get_tournament(tournament_id)
         
         original_players = {}
         match_log = []  # FIX: always defined
@@ -909,38 +1053,75 @@ class TournamentScheduler:
                 self._update_player_tournament_history(tournament, player1_id, tournament['current_round'])
             else:
                 # Fetch player data
-                player1 = next(p for p in self.players if p['id'] == player1_id)
-                player2 = next(p for p in self.players if p['id'] == player2_id)
+                player1 = self.get_player(player1_id)
+                player2 = self.get_player(player2_id)
                 original_players = {
                     player1_id: player1.copy(),
                     player2_id: player2.copy()
                 }
 
                 sets_to_win = 3 if tournament.get('category') == "Grand Slam" or tournament.get('category') =="Special" else 2
-                game_engine = GameEngine(player1, player2, tournament['surface'], sets_to_win=sets_to_win)
-                # Store ball position events if in visualization mode
-                point_events = []
-                match_events = list(game_engine.simulate_match(visualize=True))
-                match_log = game_engine.match_log
-                
-                # Extract point events with ball positions and find match winner
-                match_winner = None
-                if match_events:
-                    for event in match_events:
-                        if event['type'] == 'point':
-                            point_events.append(event)
-                        elif event['type'] == 'match_end':
-                            match_winner = event['winner']
+                seed = self.match_seed(tournament, target_match_idx)
+                # Cheaper fidelity tiers and pooled outcomes of repeat meetings
+                # have no engine run to replay, so they keep no replay record
+                quick_result = None
+                if match_result is None and not visualize:
+                    tier = self.fidelity_tier(tournament)
+                    if tier != FULL:
+                        quick_result = self.fidelity.play(tier, player1, player2, tournament['surface'], sets_to_win,
+                                                          random.Random(seed), self.ranking_system)
+                    elif self.outcome_cache is not None:
+                        quick_result = self.outcome_cache.sample(player1, player2, tournament['surface'],
+                                                                 sets_to_win, random.Random(seed))
+                if quick_result is not None:
+                    match_result = quick_result
+                else:
+                    # Keep only what is needed to play the match again (see replay_match)
+                    snapshots = tournament.setdefault('player_snapshots', {})
+                    hashes = []
+                    for player in (player1, player2):
+                        snapshot = player_snapshot(player)
+                        hashes.append(snapshot_hash(snapshot))
+                        snapshots.setdefault(hashes[-1], snapshot)
+                    tournament.setdefault('replays', {})[f"{tournament['current_round']}-{target_match_idx}"] = \
+                        make_replay(seed, tournament['surface'], sets_to_win, hashes)
+                    # A result passed in was played by an engine elsewhere (stream_match, a
+                    # worker of play_round) from the same seed, so it keeps its replay record
+                    # but needs no engine here
+                    if match_result is None:
+                        game_engine = GameEngine(player1, player2, tournament['surface'], sets_to_win=sets_to_win,
+                                                 rng=random.Random(seed), profile=self.profile)
+                if match_result is not None:
+                    game_engine = match_result
+                    winner_id = match_result.winner_id
+                elif visualize:
+                    # Store ball position events if in visualization mode
+                    point_events = []
+                    match_events = list(game_engine.simulate_match(visualize=True))
+                    match_log = game_engine.match_log
                     
-                    # Set winner_id based on actual match winner
-                    if match_winner:
-                        winner_id = match_winner['id']
+                    # Extract point events with ball positions and find match winner
+                    match_winner = None
+                    if match_events:
+                        for event in match_events:
+                            if event['type'] == 'point':
+                                point_events.append(event)
+                            elif event['type'] == 'match_end':
+                                match_winner = event['winner']
+                        
+                        # Set winner_id based on actual match winner
+                        if match_winner:
+                            winner_id = match_winner['id']
+                        else:
+                            # Fallback if no match_end event found
+                            winner_id = player1['id'] if game_engine.sets['player1'] > game_engine.sets['player2'] else player2['id']
                     else:
-                        # Fallback if no match_end event found
+                        # Handle case with no events (quick match or error)
                         winner_id = player1['id'] if game_engine.sets['player1'] > game_engine.sets['player2'] else player2['id']
                 else:
-                    # Handle case with no events (quick match or error)
-                    winner_id = player1['id'] if game_engine.sets['player1'] > game_engine.sets['player2'] else player2['id']
+                    # Nobody is watching: compact result only, no events or log lines
+                    match_result = game_engine.simulate_match(headless=True)
+                    winner_id = match_result.winner_id
                 final_score = game_engine.format_set_scores()
 
                 loser_id = player2_id if winner_id == player1['id'] else player1_id
@@ -956,10 +1137,10 @@ class TournamentScheduler:
 
             # Update matches_played for both players right when we record the match result
             if player1_id is not None:
-                player1 = next(p for p in self.players if p['id'] == player1_id)
+                player1 = self.get_player(player1_id)
                 player1['matches_played'] = player1.get('matches_played', 0) + 1
             if player2_id is not None:
-                player2 = next(p for p in self.players if p['id'] == player2_id)
+                player2 = self.get_player(player2_id)
                 player2['matches_played'] = player2.get('matches_played', 0) + 1
 
             # Check if all matches in the current round are complete
@@ -970,7 +1151,7 @@ class TournamentScheduler:
         finally:
             # Restore original stats but preserve ELO rating changes
             for player_id, original_stats in original_players.items():
-                player = next(p for p in self.players if p['id'] == player_id)
+                player = self.get_player(player_id)
                 # Save current values that should persist across the temporary simulation
                 current_elo_rating = player.get('elo_rating')
                 current_highest_elo = player.get('highest_elo')
@@ -989,7 +1170,7 @@ class TournamentScheduler:
             
     def _update_player_tournament_history(self, tournament, player_id, round_reached):
         """Update a player's tournament history when they lose a match"""
-        player = next((p for p in self.players if p['id'] == player_id), None)
+        player = self.get_player(player_id)
         if not player:
             return
 
@@ -1041,37 +1222,37 @@ class TournamentScheduler:
                 self._prepare_next_round(tournament)
                 
     def update_match_result(self, tournament_id, match_index, winner_id):
-        for tournament in self.tournaments:
-            if tournament['id'] == tournament_id:
-                match = list(tournament['active_matches'][match_index])
-                # Update the winner
-                match[2] = winner_id
-                # Add the score if needed
-                if len(match) == 3:
-                    match.append("N/A")
-
-                # Persist matches_played for both players when a result is written
-                p1_id, p2_id = match[0], match[1]
-                if p1_id is not None:
-                    p1 = next((p for p in self.players if p['id'] == p1_id), None)
-                    if p1 is not None:
-                        p1['matches_played'] = p1.get('matches_played', 0) + 1
-                if p2_id is not None:
-                    p2 = next((p for p in self.players if p['id'] == p2_id), None)
-                    if p2 is not None:
-                        p2['matches_played'] = p2.get('matches_played', 0) + 1
-
-                # Update both active_matches and the bracket so the saved structure contains the score
-                tournament['active_matches'][match_index] = tuple(match)
-                # Ensure bracket exists and update it as well
-                if 'bracket' in tournament and 0 <= tournament.get('current_round', 0) < len(tournament['bracket']):
-                    try:
-                        tournament['bracket'][tournament['current_round']][match_index] = tuple(match)
-                    except Exception:
-                        # If bracket structure isn't aligned, ignore and rely on active_matches
-                        pass
-                break
-            
+        tournament = self._tournaments_by_id.get(tournament_id)
+        if tournament is None:
+            return
+        match = list(tournament['active_matches'][match_index])
+        # Update the winner
+        match[2] = winner_id
+        # Add the score if needed
+        if len(match) == 3:
+            match.append("N/A")
+
+        # Persist matches_played for both players when a result is written
+        p1_id, p2_id = match[0], match[1]
+        if p1_id is not None:
+            p1 = self.get_player(p1_id)
+            if p1 is not None:
+                p1['matches_played'] = p1.get('matches_played', 0) + 1
+        if p2_id is not None:
+            p2 = self.get_player(p2_id)
+            if p2 is not None:
+                p2['matches_played'] = p2.get('matches_played', 0) + 1
+
+        # Update both active_matches and the bracket so the saved structure contains the score
+        tournament['active_matches'][match_index] = tuple(match)
+        # Ensure bracket exists and update it as well
+        if 'bracket' in tournament and 0 <= tournament.get('current_round', 0) < len(tournament['bracket']):
+            try:
+                tournament['bracket'][tournament['current_round']][match_index] = tuple(match)
+            except Exception:
+                # If bracket structure isn't aligned, ignore and rely on active_matches
+                pass
+    
     def _prepare_next_round(self, tournament):
         current_round = tournament['current_round']
         next_round = current_round + 1
@@ -1087,7 +1268,7 @@ class TournamentScheduler:
                 tournament['winner_id'] = winner_id
                 if 'history' not in tournament:
                     tournament['history'] = []
-                winner = next((p for p in self.players if p['id'] == winner_id), None)
+                winner = self.get_player(winner_id)
                 winner_name = winner['name'] if winner else "Unknown"
                 tournament['history'].append({
                     'winner': winner_name,
@@ -1160,9 +1341,87 @@ class TournamentScheduler:
 
         print(f"\nRound {current_round + 1} complete! Advancing to Round {next_round + 1}")
         
-    def simulate_entire_tournament(self, tournament_id):
-        """Simulate all remaining matches in a tournament automatically"""
-        tournament = next(t for t in self.tournaments if t['id'] == tournament_id)
+    def fidelity_tier(self, tournament):
+        """Fidelity tier unwatched matches of this tournament are played at (see sim.fidelity)."""
+        if self.fidelity is None:
+            return FULL
+        return self.fidelity.tier_for(tournament.get('category'))
+
+    def _calibrate_fidelity(self):
+        """Fit the cheaper fidelity tiers to the current players, from the season's own seed."""
+        if self.fidelity is not None:
+            self.fidelity.calibrate(self.players, self.ranking_system,
+                                    seed=derive_seed(self.rng_seed, "fidelity", self.current_year))
+
+    def match_task(self, tournament_id, match_idx):
+        """
+        Picklable arguments for play_match_task for a match of the current round,
+        or None for byes and finished matches. The seed is the match's own
+        stream, so the result equals what simulate_through_match would produce.
+        """
+        tournament = self.get_tournament(tournament_id)
+        return self._match_task(tournament, match_idx, {p['id']: p for p in self.players})
+
+    def _match_task(self, tournament, match_idx, players):
+        """match_task with the tournament and an id -> player dict already at hand."""
+        match = tournament['active_matches'][match_idx]
+        if (len(match) == 4 and match[2] is not None) or match[0] is None or match[1] is None:
+            return None
+        sets_to_win = 3 if tournament.get('category') in ("Grand Slam", "Special") else 2
+        seed = self.match_seed(tournament, match_idx)
+        return players[match[0]], players[match[1]], tournament['surface'], sets_to_win, seed
+
+    def play_round(self, tournament, map_matches):
+        """
+        Play every unplayed match of the tournament's current round as one
+        batch of play_match_task calls through map_matches (e.g. a process
+        pool's map). Returns {match index: MatchResult}; nothing is recorded
+        yet, so the caller records the results in bracket order and the ELO
+        updates come out as if the matches were played one by one.
+        Rounds of a cheaper fidelity tier cost less than shipping the matches
+        to a worker, and pooled outcomes depend on the order matches are
+        played, so those rounds (and map_matches=None) return {}.
+        """
+        if map_matches is None or self.outcome_cache is not None or self.fidelity_tier(tournament) != FULL:
+            return {}
+        players = {p['id']: p for p in self.players}
+        tasks = {}
+        for match_idx in range(len(tournament['active_matches'])):
+            task = self._match_task(tournament, match_idx, players)
+            if task is not None:
+                tasks[match_idx] = task
+        if not tasks:
+            return {}
+        return dict(zip(tasks, map_matches(_play_match_task_args, list(tasks.values()))))
+
+    def stream_match(self, tournament_id, match_idx):
+        """
+        Play a match of the current round for the viewer. Returns (engine,
+        events), or None for byes and finished matches. The result is recorded
+        (ELO, history, bracket) up front, just as simulate_through_match would
+        record it, so closing the viewer mid-match loses nothing; events is a
+        lazy simulate_match(visualize=True) stream of the same match from the
+        same seed, simulated only as far as it is consumed.
+        """
+        task = self.match_task(tournament_id, match_idx)
+        if task is None:
+            return None
+        player1, player2, surface, sets_to_win, seed = task
+        # The viewer's engine is built before recording changes the players
+        engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, rng=random.Random(seed))
+        result = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, rng=random.Random(seed),
+                            profile=self.profile).simulate_match(headless=True)
+        self.simulate_through_match(tournament_id, match_idx, match_result=result)
+        return engine, engine.simulate_match(visualize=True)
+
+    def simulate_entire_tournament(self, tournament_id, map_matches=None):
+        """
+        Simulate all remaining matches in a tournament automatically.
+        map_matches, e.g. a process pool's map, plays each round's matches as
+        play_match_task(*task) calls; results are recorded in bracket order,
+        so the outcome is the same as playing them here.
+        """
+        tournament = self.get_tournament(tournament_id)
 
         # Ensure tournament is properly initialized
         if 'participants' not in tournament:
@@ -1183,11 +1442,14 @@ class TournamentScheduler:
                 
             matches = tournament['active_matches']
 
+            precomputed = self.play_round(tournament, map_matches)
+
             # Simulate all matches in current round
             for match_idx in range(len(matches)):
                 # Skip already completed matches
                 if len(matches[match_idx]) < 3 or matches[match_idx][2] is None:
-                    self.simulate_through_match(tournament_id, match_idx)
+                    self.simulate_through_match(tournament_id, match_idx,
+                                                match_result=precomputed.get(match_idx))
 
             # Check if all matches in current round are complete
             if all(len(m) > 2 and m[2] is not None for m in matches):
@@ -1195,7 +1457,7 @@ class TournamentScheduler:
                 if current_round == len(tournament['bracket']) - 1:
                     if matches and matches[0][2]:
                         tournament['winner_id'] = matches[0][2]
-                        winner = next((p for p in self.players if p['id'] == matches[0][2]), None)
+                        winner = self.get_player(matches[0][2])
                         if winner:
                             if 'tournament_wins' not in winner:
                                 winner['tournament_wins'] = []
@@ -1231,8 +1493,94 @@ class TournamentScheduler:
                 break
                 
         return tournament.get('winner_id')
-        
-    def _process_retirements(self):
+
+    def simulate_current_week(self, map_tournaments=None):
+        """
+        Simulate every unfinished tournament of the current week, in prestige
+        order. Returns the tournaments simulated, in that order.
+        map_tournaments, e.g. a process pool's map, plays the tournaments
+        concurrently as play_tournament_task(task) calls, each on a copy of its
+        draw and players; the results (brackets, histories, titles, ELO and
+        matches played) are merged back in prestige order, so the outcome is
+        the same as playing them here. The week is played here instead when
+        tournaments share a player, a draw is not made yet, or an outcome
+        cache is in use (its pools depend on the order matches are played).
+        """
+        def prestige(t):
+            category = t.get('category')
+            return self.PRESTIGE_ORDER.index(category) if category in self.PRESTIGE_ORDER else len(self.PRESTIGE_ORDER)
+
+        tournaments = sorted((t for t in self.get_current_week_tournaments() if t.get('winner_id') is None),
+                             key=prestige)
+        tasks = None
+        if map_tournaments is not None and self.outcome_cache is None and len(tournaments) > 1:
+            tasks = [self.tournament_task(t) for t in tournaments]
+            seen = set()
+            for task in tasks:
+                ids = [p['id'] for p in task[1]] if task is not None else []
+                if task is None or seen.intersection(ids):
+                    tasks = None
+                    break
+                seen.update(ids)
+
+        if tasks is None:
+            for tournament in tournaments:
+                self.simulate_entire_tournament(tournament['id'])
+            return tournaments
+
+        players = {p['id']: p for p in self.players}
+        for tournament, (state, draw_players, profile) in zip(tournaments, map_tournaments(play_tournament_task, tasks)):
+            if state is not tournament:   # map_tournaments may also be a plain map
+                tournament.clear()
+                tournament.update(state)
+            for result in draw_players:
+                player = players[result['id']]
+                if player is not result:
+                    player.clear()
+                    player.update(result)
+            if profile is not None:
+                self.profile.merge(profile)
+        return tournaments
+
+    def tournament_task(self, tournament):
+        """
+        Picklable arguments for play_tournament_task: the tournament, the
+        players of its draw and what their matches depend on (seeds, date,
+        fidelity). None if the draw is not made yet.
+        """
+        if not tournament.get('bracket') or not tournament.get('active_matches'):
+            return None
+        ids = set(tournament.get('participants', []))
+        for match in tournament['active_matches']:
+            ids.update(i for i in match[:2] if i is not None)
+        players = [p for p in self.players if p['id'] in ids]
+        return (tournament, players, self.rng_seed, self.current_year, self.current_week, self.current_date,
+                self.fidelity, self.profile.timers if self.profile is not None else None)
+
+    @classmethod
+    def for_tournament(cls, tournament, players, rng_seed, current_year, current_week, current_date,
+                       fidelity=None, profile=None):
+        """
+        A scheduler holding just one tournament and its players, enough for
+        simulate_entire_tournament (see play_tournament_task). It reads and
+        writes no files.
+        """
+        scheduler = cls.__new__(cls)
+        scheduler.tournaments = [tournament]
+        scheduler.players = players
+        scheduler.rng_seed = rng_seed
+        scheduler.current_year = current_year
+        scheduler.current_week = current_week
+        scheduler.current_date = current_date
+        scheduler.ranking_system = RankingSystem(data_path=None)
+        scheduler.ranking_system.players = players   # championship points count toward highest_elo
+        scheduler.outcome_cache = None
+        scheduler.fidelity = fidelity
+        scheduler.profile = profile
+        scheduler.rng = scheduler.stream("week", current_year, current_week)
+        return scheduler
+
+    def _process_retirements(self, rng=random):
         """Handle player retirements at the end of the year"""
         retired_players = []
         retired_count = 0
@@ -1282,7 +1630,7 @@ class TournamentScheduler:
             # Chance-based retirement for players 36-39
             if age >= 36:
                 retirement_chance = (age - 35) * 0.2  # 20% at 36, 40% at 37, etc.
-                if random.random() < retirement_chance:
+                if rng.random() < retirement_chance:
                     player['retired'] = True
                     retired_players.append(player['name'])
                     retired_count += 1
@@ -1358,7 +1706,7 @@ class TournamentScheduler:
 
         return pts
 
-    def _generate_hof_peak_skills(self, hof_entry):
+    def _generate_hof_peak_skills(self, hof_entry, rng=random):
         """Generate plausible peak skills for HOF members based on their best rank.
         
         Skill ranges by peak rank tier:
@@ -1384,7 +1732,7 @@ class TournamentScheduler:
                        'speed', 'stamina', 'mental', 'dropshot', 'volley',
                        'lift', 'slice', 'iq']
         # Generate raw values around target, then rescale to hit target_ovr
-        raw = {s: random.gauss(target_ovr, spread) for s in skill_names}
+        raw = {s: rng.gauss(target_ovr, spread) for s in skill_names}
         raw_mean = sum(raw.values()) / len(raw)
         shift = target_ovr - raw_mean
         skills = {s: max(35, min(100, round(v + shift))) for s, v in raw.items()}
@@ -1422,6 +1770,8 @@ class TournamentScheduler:
             tournament['active_matches'] = []
             tournament['current_round'] = 0
             tournament['winner_id'] = None
+            tournament['replays'] = {}
+            tournament['player_snapshots'] = {}
             
             if 'matches' in tournament:
                 del tournament['matches']
@@ -1456,7 +1806,7 @@ class TournamentScheduler:
             news_items.append({
                 'type': 'development',
                 'title': 'PLAYER DEVELOPMENT WEEK',
-                'content': random.choice(dev_templates)
+                'content': self.rng.choice(dev_templates)
             })
         
         # 3. New players and retirements
@@ -1500,15 +1850,15 @@ class TournamentScheduler:
 
                 if len(newgens) == 1:
                     archetype = newgens[0].get('archetype', 'player').lower()
-                    template = random.choice(single_newgen_templates)
+                    template = self.rng.choice(single_newgen_templates)
                     content = template.format(name=newgens[0]['name'], archetype=archetype)
                 elif len(newgens) <= 3:
                     names = ', '.join(p['name'] for p in newgens[:-1]) + f" and {newgens[-1]['name']}"
-                    template = random.choice(few_newgens_templates)
+                    template = self.rng.choice(few_newgens_templates)
                     content = template.format(names=names)
                 else:
                     names = f"{newgens[0]['name']}, {newgens[1]['name']}, and {newgens[2]['name']}"
-                    template = random.choice(many_newgens_templates)
+                    template = self.rng.choice(many_newgens_templates)
                     content = template.format(count=len(newgens), names=names, year=self.current_year, arch_flavor=arch_flavor)
 
                 news_items.append({
@@ -1557,11 +1907,11 @@ class TournamentScheduler:
                 if len(notable_retirees) == 1:
                     titles, gs = _retiree_stats(notable_retirees[0])
                     gs_note = f", including {gs} Grand Slam{'s' if gs != 1 else ''}" if gs > 0 else ""
-                    template = random.choice(single_retirement_templates)
+                    template = self.rng.choice(single_retirement_templates)
                     content = template.format(name=notable_retirees[0], titles=titles, gs_note=gs_note)
                 else:
                     names = ', '.join(notable_retirees[:-1]) + f" and {notable_retirees[-1]}"
-                    template = random.choice(multiple_retirement_templates)
+                    template = self.rng.choice(multiple_retirement_templates)
                     content = template.format(names=names)
 
                 news_items.append({
@@ -1607,7 +1957,7 @@ class TournamentScheduler:
                 f"The numbers don't lie: these five players made the biggest upward moves in the {last_year} rankings, each transforming their career trajectory:",
                 f"As we enter {self.current_year}, we look back at the players who defied expectations with the most impressive ranking gains of last season:",
             ]
-            content.append(random.choice(improvement_intros))
+            content.append(self.rng.choice(improvement_intros))
 
             improvement_templates = [
                 "{name} — climbed from #{old_rank} to #{new_rank} (+{improvement} positions)",
@@ -1619,7 +1969,7 @@ class TournamentScheduler:
             ]
 
             for i, (player, old_rank, new_rank, improvement) in enumerate(improved_players[:5], 1):
-                template = random.choice(improvement_templates)
+                template = self.rng.choice(improvement_templates)
                 formatted = template.format(
                     name=player['name'], old_rank=old_rank,
                     new_rank=new_rank, improvement=improvement
@@ -1644,7 +1994,7 @@ class TournamentScheduler:
                 f"From Grand Slams to 250s, these players racked up more wins than anyone else in {last_year}:",
                 f"The {last_year} trophy table is topped by these five players, each of whom enjoyed outstanding seasons on the title front:",
             ]
-            content.append(random.choice(winner_intros))
+            content.append(self.rng.choice(winner_intros))
 
             winner_templates = [
                 "{name} — {wins} {title_suffix} won",
@@ -1657,7 +2007,7 @@ class TournamentScheduler:
 
             for i, (player, wins) in enumerate(tournament_winners[:5], 1):
                 title_suffix = "title" if wins == 1 else "titles"
-                template = random.choice(winner_templates)
+                template = self.rng.choice(winner_templates)
                 formatted = template.format(
                     name=player['name'], wins=wins,
                     title_suffix=title_suffix, last_year=last_year
@@ -1686,7 +2036,7 @@ class TournamentScheduler:
             recap_items.append({
                 'type': 'year_end_no1',
                 'title': f'{self.current_year} WORLD #1',
-                'content': random.choice(ye_templates)
+                'content': self.rng.choice(ye_templates)
             })
 
         return recap_items
@@ -1757,7 +2107,7 @@ class TournamentScheduler:
                 if new_entries:
                     for name in new_entries:
                         pos = curr_names.index(name) + 1
-                        template = random.choice(achievement_templates)
+                        template = self.rng.choice(achievement_templates)
                         content = template.format(name=name, title=title.lower(), pos=pos)
 
                         achievement_items.append({
@@ -1781,7 +2131,7 @@ class TournamentScheduler:
                 not tournament['category'] == "Juniors" and
                 tournament.get('winner_id')):
 
-                winner = next((p for p in self.players if p['id'] == tournament['winner_id']), None)
+                winner = self.get_player(tournament['winner_id'])
                 if not winner:
                     continue
 
@@ -1800,7 +2150,7 @@ class TournamentScheduler:
                     for match in final_round:
                         if len(match) >= 3 and match[2] == winner['id']:
                             loser_id = match[1] if match[0] == winner['id'] else match[0]
-                            runner_up = next((p for p in self.players if p['id'] == loser_id), None)
+                            runner_up = self.get_player(loser_id)
                             break
 
                 # Build context line
@@ -1831,7 +2181,7 @@ class TournamentScheduler:
                         f"{winner['name']} takes the {tournament['name']} crown ({category}).",
                     ]
 
-                headline = random.choice(headline_templates)
+                headline = self.rng.choice(headline_templates)
 
                 # Additional detail paragraph
                 detail_templates = [
@@ -1842,7 +2192,7 @@ class TournamentScheduler:
                     f"The #{rank}-ranked {archetype} was in imperious form throughout the week.",
                     f"Playing with the composure of a seasoned champion, the {age}-year-old #{rank} seed was clinical.",
                 ]
-                detail = random.choice(detail_templates)
+                detail = self.rng.choice(detail_templates)
 
                 content = f"{headline} {context_line} {detail}"
 
@@ -1890,7 +2240,7 @@ class TournamentScheduler:
 
         # Priority-ordered context selection
         if is_first_title:
-            return random.choice([
+            return self.rng.choice([
                 "It is the first professional title of his career — a breakthrough that has been a long time coming.",
                 "A maiden title at last. He lifts his first professional trophy in what could prove to be a pivotal moment in his career.",
                 "First career title secured. The emotion was visible as he celebrated a victory that marks the true beginning of his professional journey.",
@@ -1900,7 +2250,7 @@ class TournamentScheduler:
             ])
 
         if is_first_gs:
-            return random.choice([
+            return self.rng.choice([
                 "It is his first Grand Slam title — a career-defining achievement that places him among the sport's elite.",
                 "Grand Slam champion for the first time. The weight of the moment was clear, but he handled it with remarkable composure.",
                 "A maiden major crown. Years of work have culminated in the biggest victory of his professional life.",
@@ -1912,7 +2262,7 @@ class TournamentScheduler:
         if category == 'Grand Slam' and len(gs_wins) > 1:
             count = len(gs_wins)
             ordinal = f"{count}{'nd' if count == 2 else 'rd' if count == 3 else 'th'}"
-            return random.choice([
+            return self.rng.choice([
                 f"That's Grand Slam title number {count} for the champion, further cementing his status among the all-time greats.",
                 f"He adds a {ordinal} Grand Slam to his collection — a feat that demands respect from even his fiercest critics.",
                 f"Grand Slam #{count}. With each major title, the case for his place in tennis immortality grows stronger.",
@@ -1923,14 +2273,14 @@ class TournamentScheduler:
 
         if is_defending and times_won_here >= 3:
             ordinal = f"{times_won_here}{'rd' if times_won_here == 3 else 'th'}"
-            return random.choice([
+            return self.rng.choice([
                 f"He defends his title successfully — that's now {times_won_here} times he's won this tournament. He owns this event.",
                 f"A {ordinal} title at this venue. The defending champion has made this tournament his personal fortress.",
                 f"Title #{times_won_here} here. The dynasty continues as he retains his crown once again.",
             ])
 
         if is_defending:
-            return random.choice([
+            return self.rng.choice([
                 "He successfully defends his title from last year, proving his triumph was no fluke.",
                 "Back-to-back champion. The defending champion rose to the occasion when it mattered most.",
                 "The defending champion retains his crown, fending off all challengers with characteristic resolve.",
@@ -1940,7 +2290,7 @@ class TournamentScheduler:
             ])
 
         if is_biggest_win:
-            return random.choice([
+            return self.rng.choice([
                 "It is the most prestigious title of his career to date — a significant step up in class.",
                 "A new career-best result. He has never won at this level before, and the significance of the achievement is not lost on him.",
                 "His biggest tournament win yet. The victory represents a clear elevation in his standing on the tour.",
@@ -1950,7 +2300,7 @@ class TournamentScheduler:
             ])
 
         if is_first_m1000:
-            return random.choice([
+            return self.rng.choice([
                 "It is his first Masters 1000 crown — a statement victory that announces his arrival among the tour's premier competitors.",
                 "A first Masters 1000 title. Breaking through at this level is a milestone that only the best achieve.",
                 "Maiden Masters victory. The step up to this tier of tournament is significant, and he handled the pressure superbly.",
@@ -1960,7 +2310,7 @@ class TournamentScheduler:
             ])
 
         if is_young:
-            return random.choice([
+            return self.rng.choice([
                 f"At just {winner['age']} years old, he is already collecting hardware at this level — a remarkable feat for a player so young.",
                 f"Only {winner['age']} and already a champion here. The maturity on display belied his tender age.",
                 f"Remarkable maturity from the {winner['age']}-year-old. Most players his age are still finding their feet at this level.",
@@ -1970,7 +2320,7 @@ class TournamentScheduler:
             ])
 
         # Default: career title count
-        return random.choice([
+        return self.rng.choice([
             f"That brings his career title count to {total_wins} — a respectable and growing collection.",
             f"Title number {total_wins} for the champion. The consistency continues season after season.",
             f"He now holds {total_wins} professional titles, adding another chapter to an already impressive career.",
@@ -2052,7 +2402,7 @@ class TournamentScheduler:
             relevant_skills = [_effect_to_skill[k] for k in fx if k in _effect_to_skill]
             candidate_players = []
             for pid in participants:
-                p = next((pl for pl in self.players if pl['id'] == pid), None)
+                p = self.get_player(pid)
                 if p and not p.get('retired', False):
                     skills = p.get('skills', {})
                     # Surface affinity: average of the skills that matter on this surface
@@ -2070,7 +2420,7 @@ class TournamentScheduler:
                 elif fav_affinity >= 60:
                     surf_desc = f", comfortable on {surface}"
 
-                favorite_str = random.choice([
+                favorite_str = self.rng.choice([
                     f"Pre-tournament favorite: #{fav_rank} {fav['name']}{surf_desc}.",
                     f"Bookmakers' pick: {fav['name']} (#{fav_rank}){surf_desc}.",
                     f"The one to beat: {fav['name']}, currently ranked #{fav_rank}{surf_desc}.",
@@ -2084,7 +2434,7 @@ class TournamentScheduler:
                     ]
                     if dark_horses:
                         dh = dark_horses[0]
-                        favorite_str += random.choice([
+                        favorite_str += self.rng.choice([
                             f" Dark horse: #{dh[3]} {dh[0]['name']} — deadly on {surface}.",
                             f" Watch out for {dh[0]['name']} (#{dh[3]}), a {surface} specialist who could upset the draw.",
                             f" Sleeper pick: {dh[0]['name']} (#{dh[3]}) thrives on {surface} courts.",
@@ -2092,27 +2442,27 @@ class TournamentScheduler:
 
         # ── Surface context ──
         surface_flavor = {
-            'clay': random.choice([
+            'clay': self.rng.choice([
                 f"Played on clay — expect long rallies, heavy topspin, and grueling baseline battles.",
                 f"The red clay courts will reward patience and endurance this week.",
                 f"Clay-court tennis at its finest. Footwork and stamina will be key.",
             ]),
-            'grass': random.choice([
+            'grass': self.rng.choice([
                 f"The fast grass courts will favor big servers and aggressive net play.",
                 f"Grass season is here — low bounces, quick points, and serve-and-volley magic.",
                 f"On grass, the ball skids and stays low. Adaptability is everything.",
             ]),
-            'hard': random.choice([
+            'hard': self.rng.choice([
                 f"Hard courts provide a balanced test — rewarding all-around excellence.",
                 f"On hard courts, there's nowhere to hide. The most complete player usually wins.",
                 f"The hard-court surface levels the playing field — pure tennis fundamentals decide.",
             ]),
-            'indoor': random.choice([
+            'indoor': self.rng.choice([
                 f"Indoor conditions mean controlled environments, fast surfaces, and big serving.",
                 f"No wind, no sun — just pure skill under the roof. Indoor tennis rewards precision.",
                 f"The indoor courts offer speed and consistency. Serve and return will be crucial.",
             ]),
-            'neutral': random.choice([
+            'neutral': self.rng.choice([
                 f"A unique surface that tests every aspect of a player's game equally.",
                 f"On neutral courts, there are no surface advantages — only talent matters.",
             ]),
@@ -2376,7 +2726,7 @@ class TournamentScheduler:
                         for pid in match[:2]:
                             if pid is None or pid == tournament.get('winner_id'):
                                 continue
-                            player = next((p for p in self.players if p['id'] == pid), None)
+                            player = self.get_player(pid)
                             if not player or player.get('age', 30) >= 20:
                                 continue
                             score = round_idx * 10 + cat_prestige
@@ -2395,7 +2745,7 @@ class TournamentScheduler:
             tweets.append({
                 'type': 'tweet',
                 'title': '💬 PROSPECT WATCH',
-                'content': random.choice([
+                'content': self.rng.choice([
                     f"Keep an eye on {player['name']}! The {player['age']}-year-old {archetype.lower()} reached the {round_name} of the {tournament['name']}.",
                     f"{player['name']} ({player['age']}) is showing serious promise. The young {archetype.lower()} made it to the {round_name} at the {tournament['name']}.",
                     f"Prospect alert: {player['name']}, a {player['age']}-year-old {archetype.lower()}, just reached the {round_name} of a {tournament['category']} event.",
@@ -2415,12 +2765,12 @@ class TournamentScheduler:
             if last_year_key in year_rankings:
                 old_rank = year_rankings[last_year_key]
                 if old_rank > 100 and current_rank <= 50:
-                    if random.random() < 0.08:
+                    if self.rng.random() < 0.08:
                         archetype = player.get('archetype', 'player')
                         tweets.append({
                             'type': 'tweet',
                             'title': '💬 RISING STAR',
-                            'content': random.choice([
+                            'content': self.rng.choice([
                                 f"{player['name']} has been on a tear this season — from #{old_rank} to #{current_rank}. The {archetype.lower()} is making a statement.",
                                 f"Remember the name: {player['name']}. Ranked #{old_rank} at the start of the year, now all the way up to #{current_rank}.",
                                 f"{player['name']}'s rise continues. The {archetype.lower()} started the year at #{old_rank} and now sits at #{current_rank}.",
@@ -2439,7 +2789,7 @@ class TournamentScheduler:
             tweets.append({
                 'type': 'tweet',
                 'title': '👑 NEW WORLD #1',
-                'content': random.choice([
+                'content': self.rng.choice([
                     f"{current_no1['name']} reaches the summit! A new world #1 is crowned.",
                     f"History is made — {current_no1['name']} rises to the #1 ranking for the first time!",
                     f"A new era begins. {current_no1['name']} is the new world #1.",
@@ -2455,12 +2805,12 @@ class TournamentScheduler:
                 not tournament['category'].startswith("Challenger") and
                 not tournament['category'].startswith("ITF") and
                 not tournament['category'] == "Juniors"):
-                winner = next((p for p in self.players if p['id'] == tournament['winner_id']), None)
+                winner = self.get_player(tournament['winner_id'])
                 if winner and winner.get('age', 20) >= 32:
                     tweets.append({
                         'type': 'tweet',
                         'title': '💬 AGELESS',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"Age is just a number. {winner['name']}, {winner['age']}, proves he still has what it takes with a title at the {tournament['name']}.",
                             f"Don't count out the veterans. {winner['name']} ({winner['age']}) is still winning at the highest level.",
                             f"{winner['name']} rolls back the years. At {winner['age']}, the {winner.get('archetype', 'veteran').lower()} shows no signs of slowing down.",
@@ -2514,7 +2864,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '📊 DEVELOPMENT UPDATE',
-                    'content': random.choice(templates)
+                    'content': self.rng.choice(templates)
                 })
 
         # ── 6. Ranking milestones (first time top 10, top 50, career high) ──
@@ -2530,7 +2880,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '🔟 TOP 10 BREAKTHROUGH',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"Welcome to the elite! {player['name']} breaks into the top 10 for the first time, climbing to #{current_rank}.",
                         f"{player['name']} cracks the top 10! A milestone moment in his career — now ranked #{current_rank}.",
                         f"Top 10 alert: {player['name']} has arrived. From #{old_rank} to #{current_rank} this week.",
@@ -2541,11 +2891,11 @@ class TournamentScheduler:
                 })
             # First time top 50
             elif current_rank <= 50 and old_rank > 50:
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     tweets.append({
                         'type': 'tweet',
                         'title': '💬 CLIMBING THE RANKS',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"{player['name']} enters the top 50 for the first time! Now ranked #{current_rank}.",
                             f"Milestone: {player['name']} moves to #{current_rank}, breaking into the top 50.",
                             f"Steady climb for {player['name']} — he's now a top-50 player at #{current_rank}.",
@@ -2562,7 +2912,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': '⬆️ CAREER HIGH',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"New career-high ranking for {player['name']}! He jumps from #{old_rank} to #{current_rank}.",
                             f"{player['name']} hits a new peak — #{current_rank} is the highest he's ever been ranked.",
                             f"Career best! {player['name']} surges to #{current_rank}, up {old_rank - current_rank} spots this week.",
@@ -2589,7 +2939,7 @@ class TournamentScheduler:
             tweets.append({
                 'type': 'tweet',
                 'title': '📉 ROUGH WEEK',
-                'content': random.choice([
+                'content': self.rng.choice([
                     f"Tough times for {player['name']}. Drops {drop} spots from #{old_rank} to #{current_rank}.",
                     f"{player['name']} slides from #{old_rank} to #{current_rank}. What's going on?",
                     f"Not the week {player['name']} wanted — down {drop} places to #{current_rank}.",
@@ -2614,7 +2964,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '🔥 HOT STREAK',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"{player['name']} is on fire this season! Already {len(recent_wins)} titles in {self.current_year}.",
                         f"Can anyone stop {player['name']}? That's {len(recent_wins)} tournament wins this year and counting.",
                         f"{player['name']} is collecting trophies like it's nothing — {len(recent_wins)} titles in {self.current_year} so far.",
@@ -2628,12 +2978,12 @@ class TournamentScheduler:
         for tournament in self.tournaments:
             if (tournament['week'] == last_week and tournament.get('winner_id') and
                 tournament['category'] in ('Grand Slam', 'Masters 1000', 'ATP 500')):
-                winner = next((p for p in self.players if p['id'] == tournament['winner_id']), None)
+                winner = self.get_player(tournament['winner_id'])
                 if winner and winner.get('rank', 999) > 50:
                     tweets.append({
                         'type': 'tweet',
                         'title': '😱 UPSET SPECIAL',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"Nobody saw this coming! World #{winner.get('rank', '?')} {winner['name']} wins the {tournament['name']}. The bracket is in shambles.",
                             f"UPSET OF THE YEAR candidate: #{winner.get('rank', '?')} {winner['name']} takes down the field at the {tournament['name']}!",
                             f"{winner['name']}, ranked #{winner.get('rank', '?')}, just won a {tournament['category']} event. Tennis is chaos and we love it.",
@@ -2653,7 +3003,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '🗣️ HOT TAKE',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"Is {p['name']} past his Grand Slam-winning days? Still ranked #{p['rank']} but no Slam title in {self.current_year}.",
                         f"Hot take: {p['name']} won't add another Grand Slam to his collection. Prove me wrong.",
                         f"For a player of {p['name']}'s caliber, a year without a Grand Slam title has to sting.",
@@ -2664,7 +3014,7 @@ class TournamentScheduler:
                 })
 
         # Random stat leader spotlight
-        if random.random() < 0.15:
+        if self.rng.random() < 0.15:
             stat_choices = [
                 ('serve', '🎯 SERVE MACHINE'),
                 ('forehand', '💥 FOREHAND WEAPON'),
@@ -2673,7 +3023,7 @@ class TournamentScheduler:
                 ('volley', '🏐 NET WIZARD'),
                 ('dropshot', '🪶 TOUCH ARTIST'),
             ]
-            stat_key, title = random.choice(stat_choices)
+            stat_key, title = self.rng.choice(stat_choices)
             active = [p for p in self.players if not p.get('retired', False) and p.get('rank', 999) <= 100]
             if active:
                 best = max(active, key=lambda p: p.get('skills', {}).get(stat_key, 0))
@@ -2682,7 +3032,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': title,
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"{best['name']} has the best {stat_key} on tour right now ({stat_val} rating). Absolute weapon.",
                             f"Stat check: {best['name']}'s {stat_key} is rated {stat_val}. Best among all players.",
                             f"Want to see elite {stat_key} technique? Watch {best['name']}. {stat_val} rating, best on tour.",
@@ -2709,7 +3059,7 @@ class TournamentScheduler:
             tweets.append({
                 'type': 'tweet',
                 'title': '🚀 BIGGEST MOVER',
-                'content': random.choice([
+                'content': self.rng.choice([
                     f"Biggest mover of the week: {player['name']} rockets up {climb} spots to #{current_rank}!",
                     f"{player['name']} is this week's biggest climber — #{old_rank} → #{current_rank}. (+{climb})",
                     f"Up {climb} ranks! {player['name']} jumps from #{old_rank} to #{current_rank} in a single week.",
@@ -2723,14 +3073,14 @@ class TournamentScheduler:
         for tournament in self.tournaments:
             if (tournament['week'] == last_week and tournament.get('winner_id') and
                 tournament['category'].startswith("Challenger")):
-                winner = next((p for p in self.players if p['id'] == tournament['winner_id']), None)
+                winner = self.get_player(tournament['winner_id'])
                 if winner:
                     total_wins = len(winner.get('tournament_wins', []))
                     if total_wins == 1:
                         tweets.append({
                             'type': 'tweet',
                             'title': '💬 FIRST STEPS',
-                            'content': random.choice([
+                            'content': self.rng.choice([
                                 f"Everyone starts somewhere. {winner['name']} picks up his first professional title at the {tournament['name']}. A career begins.",
                                 f"First title secured! {winner['name']} wins the {tournament['name']}. From unknown to champion.",
                                 f"{winner['name']} will never forget this week — his first ever professional title, at the {tournament['name']}.",
@@ -2747,11 +3097,11 @@ class TournamentScheduler:
             current_rank = player.get('rank', 999)
             old_rank = old_ranks.get(player['id'], 999)
             if current_rank - old_rank >= 8 and old_rank <= 60:
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     tweets.append({
                         'type': 'tweet',
                         'title': '💬 FATHER TIME',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"Is the end near for {player['name']}? The {player['age']}-year-old drops from #{old_rank} to #{current_rank}.",
                             f"{player['name']} ({player['age']}) sliding down the rankings — #{old_rank} to #{current_rank}. Retirement talk incoming?",
                             f"Father Time remains undefeated. {player['name']}, {player['age']}, falls to #{current_rank}.",
@@ -2768,11 +3118,11 @@ class TournamentScheduler:
             total_wins = len(player.get('tournament_wins', []))
             if total_wins in [39, 49, 59, 69, 79, 89, 99]:
                 milestone = total_wins + 1
-                if player.get('age') < 34 and random.random() < 0.20:
+                if player.get('age') < 34 and self.rng.random() < 0.20:
                     tweets.append({
                         'type': 'tweet',
                         'title': '🏆 MILESTONE WATCH',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"{player['name']} sits at {total_wins} career titles. Can he reach {milestone} this season?",
                             f"Just one more win from a milestone — {player['name']} has {total_wins} titles. #{milestone} is calling.",
                             f"Milestone alert: {player['name']} is one title away from {milestone} career wins.",
@@ -2794,7 +3144,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '🌟 FUTURE STAR',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"{player['name']} enters the top 30 at just {age} years old! Still in his prime development years — the ceiling is scary.",
                         f"Only {age} and already #{current_rank} in the world. {player['name']} hasn't even hit his peak yet. Remember this tweet.",
                         f"{player['name']} ({age}) breaks into the top 30. With years of development still ahead, this {archetype.lower()} could be special.",
@@ -2816,7 +3166,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '🔎 SCOUTING REPORT',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"Scouts are buzzing about {player['name']}. The {age}-year-old {archetype.lower()} just broke into the top 150. Future superstar material?",
                         f"Add {player['name']} to your watchlist. At {age}, reaching #{current_rank} is extremely rare. This kid is the real deal.",
                         f"📋 Scouting alert: {player['name']} ({age}) enters the top 150 at #{current_rank}. The {archetype.lower()} is years ahead of the curve.",
@@ -2835,20 +3185,20 @@ class TournamentScheduler:
                     final_round = bracket[-1]
                     for match in final_round:
                         if len(match) >= 3 and match[2] is not None:
-                            p1 = next((p for p in self.players if p['id'] == match[0]), None)
-                            p2 = next((p for p in self.players if p['id'] == match[1]), None)
+                            p1 = self.get_player(match[0])
+                            p2 = self.get_player(match[1])
                             if p1 and p2:
                                 age_diff = abs(p1.get('age', 25) - p2.get('age', 25))
                                 young = p1 if p1.get('age', 25) < p2.get('age', 25) else p2
                                 old = p2 if young == p1 else p1
                                 if age_diff >= 10 and young.get('age', 25) <= 22:
-                                    winner = next((p for p in self.players if p['id'] == match[2]), None)
+                                    winner = self.get_player(match[2])
                                     if winner:
                                         if winner['id'] == young['id']:
                                             tweets.append({
                                                 'type': 'tweet',
                                                 'title': '⚔️ CLASH OF GENERATIONS',
-                                                'content': random.choice([
+                                                'content': self.rng.choice([
                                                     f"Youth prevails! {young['name']} ({young['age']}) defeats {old['name']} ({old['age']}) in the {tournament['name']} final. The changing of the guard continues.",
                                                     f"The torch is passed! {young['name']} ({young['age']}) beats {old['name']} ({old['age']}) in the {tournament['name']} final. A generational shift.",
                                                     f"Out with the old, in with the new. {young['name']} ({young['age']}) takes down veteran {old['name']} ({old['age']}) for the {tournament['name']} title.",
@@ -2858,7 +3208,7 @@ class TournamentScheduler:
                                             tweets.append({
                                                 'type': 'tweet',
                                                 'title': '⚔️ CLASH OF GENERATIONS',
-                                                'content': random.choice([
+                                                'content': self.rng.choice([
                                                     f"Experience wins out! {old['name']} ({old['age']}) holds off {young['name']} ({young['age']}) in the {tournament['name']} final. Not yet, kid.",
                                                     f"The veteran prevails. {old['name']} ({old['age']}) fends off {young['name']} ({young['age']}) at the {tournament['name']}. Still the king.",
                                                     f"Not so fast, youngster. {old['name']} ({old['age']}) teaches {young['name']} ({young['age']}) a lesson in the {tournament['name']} final.",
@@ -2866,7 +3216,7 @@ class TournamentScheduler:
                                             })
 
         # ── 19. Overall rating spotlight ──
-        if random.random() < 0.10:
+        if self.rng.random() < 0.10:
             active = [p for p in self.players if not p.get('retired', False)]
             if active:
                 def calc_ovr(p):
@@ -2879,7 +3229,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': '👤 PLAYER SPOTLIGHT',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"{best_ovr['name']} currently has the highest overall rating on tour ({ovr}). The complete package.",
                             f"By the numbers, {best_ovr['name']} is the most complete player in tennis right now. OVR: {ovr}.",
                             f"No weaknesses. {best_ovr['name']} tops the tour with a {ovr} overall rating.",
@@ -2898,7 +3248,7 @@ class TournamentScheduler:
                 tweets.append({
                     'type': 'tweet',
                     'title': '📊 MATCH MILESTONE',
-                    'content': random.choice([
+                    'content': self.rng.choice([
                         f"{player['name']} has now played {mp} professional matches. A testament to longevity and dedication.",
                         f"Milestone: {player['name']} reaches {mp} career matches played. What a journey.",
                         f"{mp} matches and counting for {player['name']}. The body of work speaks for itself.",
@@ -2931,14 +3281,14 @@ class TournamentScheduler:
                         tweets.append({
                             'type': 'tweet',
                             'title': '🏟️ TITLE DEFENSE',
-                            'content': random.choice([
+                            'content': self.rng.choice([
                                 f"All eyes on {player['name']} this week as he defends his {tournament['name']} title. Can he do it again?",
                                 f"{player['name']} returns to the {tournament['name']} as defending champion. The pressure is on.",
                                 f"Reminder: {player['name']} won the {tournament['name']} last year. He'll look to defend his crown this week.",
                                 f"Must-watch this week: {player['name']} puts his {tournament['name']} title on the line.",
                                 f"The defending champion is in the draw. {player['name']} aims to hold onto his {tournament['name']} crown.",
                                 f"Back to defend: {player['name']} arrives at the {tournament['name']} as the man to beat.",
-                            ]) if career_wins_here <= 1 else random.choice([
+                            ]) if career_wins_here <= 1 else self.rng.choice([
                                 f"{player['name']} heads to the {tournament['name']} as defending champion — and he's won it {career_wins_here} times. Good luck to the field.",
                                 f"The {tournament['name']} is {player['name']}'s kingdom. He returns to defend title #{career_wins_here}.",
                                 f"{career_wins_here}-time champion {player['name']} is back at the {tournament['name']}. The rest of the draw shivers.",
@@ -2947,11 +3297,11 @@ class TournamentScheduler:
                         })
 
         # ── 24. Stat comparison — two top players head to head ──
-        if random.random() < 0.25:
+        if self.rng.random() < 0.25:
             top_players = [p for p in self.players
                           if not p.get('retired', False) and p.get('rank', 999) <= 15]
             if len(top_players) >= 2:
-                p1, p2 = random.sample(top_players, 2)
+                p1, p2 = self.rng.sample(top_players, 2)
                 s1 = p1.get('skills', {})
                 s2 = p2.get('skills', {})
                 p1_leads = [(sk, s1.get(sk, 0), s2.get(sk, 0)) for sk in s1
@@ -2964,7 +3314,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': '📊 STAT COMPARISON',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"{p1['name']} vs {p2['name']} — who's better? {p1['name']}'s {p1_best[0]} ({p1_best[1]}) edges out ({p1_best[2]}), but {p2['name']}'s {p2_best[0]} ({p2_best[1]}) is superior ({p2_best[2]}). Depends what you value.",
                             f"Tale of the tape: {p1['name']} has the {p1_best[0]} advantage ({p1_best[1]} vs {p1_best[2]}), {p2['name']} wins on {p2_best[0]} ({p2_best[1]} vs {p2_best[2]}). Who would you rather have?",
                             f"Quick comparison — {p1['name']}: {p1_best[0]} {p1_best[1]}. {p2['name']}: {p2_best[0]} {p2_best[1]}. Both elite, completely different strengths.",
@@ -2979,7 +3329,7 @@ class TournamentScheduler:
             if (tournament['week'] == last_week and tournament.get('winner_id') and
                 not tournament['category'].startswith("ITF") and
                 not tournament['category'] == "Juniors"):
-                winner = next((p for p in self.players if p['id'] == tournament['winner_id']), None)
+                winner = self.get_player(tournament['winner_id'])
                 if winner:
                     times_won = len([
                         w for w in winner.get('tournament_wins', [])
@@ -2990,7 +3340,7 @@ class TournamentScheduler:
                         tweets.append({
                             'type': 'tweet',
                             'title': '🏆 DYNASTY WATCH',
-                            'content': random.choice([
+                            'content': self.rng.choice([
                                 f"{winner['name']} wins the {tournament['name']} for the {ordinal} time. He owns this tournament.",
                                 f"Dynasty alert: {winner['name']} captures his {ordinal} {tournament['name']} title. Does anyone else even bother entering?",
                                 f"The {tournament['name']} belongs to {winner['name']}. Title #{times_won} at his favorite hunting ground.",
@@ -3014,7 +3364,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': '🧊 COLD STREAK',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"Week {self.current_week} and still no title for #{current_rank} {player['name']} in {self.current_year}. The drought continues.",
                             f"{player['name']} is ranked #{current_rank} but has zero titles this year. Is something off, or just unlucky?",
                             f"Titleless in {self.current_year}: {player['name']} (#{current_rank}) still searching for silverware. Time is running out.",
@@ -3025,7 +3375,7 @@ class TournamentScheduler:
                     })
 
         # ── 27. Youngest in top X — check each tier independently ──
-        if random.random() < 0.30:
+        if self.rng.random() < 0.30:
             tiers = [
                 (20, "top 20"),
                 (50, "top 50"),
@@ -3033,7 +3383,7 @@ class TournamentScheduler:
                 (150, "top 150"),
             ]
             # Pick one tier at random to avoid flooding
-            tier_cutoff, tier_label = random.choice(tiers)
+            tier_cutoff, tier_label = self.rng.choice(tiers)
             tier_players = [p for p in self.players
                            if not p.get('retired', False) and p.get('rank', 999) <= tier_cutoff]
             if tier_players:
@@ -3045,7 +3395,7 @@ class TournamentScheduler:
                     tweets.append({
                         'type': 'tweet',
                         'title': '👶 YOUNGEST ON TOUR',
-                        'content': random.choice([
+                        'content': self.rng.choice([
                             f"At just {age}, {youngest['name']} is the youngest player in the {tier_label}. The future of tennis, right here.",
                             f"Fun fact: {youngest['name']} ({age}) is the youngest {tier_label} player on tour right now. Ranked #{rank}.",
                             f"Nobody in the {tier_label} is younger than {youngest['name']}. At {age}, he's got the whole tennis world ahead of him.",
@@ -3058,24 +3408,28 @@ class TournamentScheduler:
                     })
 
         # ── 28. Fanboy tweet ──
-        if random.random() < 0.50:
+        if self.rng.random() < 0.50:
             self._add_fan_zone_tweet(tweets)
 
         # Shuffle and limit to keep the feed interesting but not overwhelming
-        random.shuffle(tweets)
+        self.rng.shuffle(tweets)
         if len(tweets) > 12:
             priority_titles = {'👑 NEW WORLD #1', '🔟 TOP 10 BREAKTHROUGH', '😱 UPSET SPECIAL',
                               '⚔️ CLASH OF GENERATIONS', '🚀 BIGGEST MOVER', '🌟 FUTURE STAR',
                               '🔎 SCOUTING REPORT', '🏆 DYNASTY WATCH', '🏟️ TITLE DEFENSE', '🗨️ FAN ZONE'}
             priority = [t for t in tweets if t['title'] in priority_titles]
             others = [t for t in tweets if t['title'] not in priority_titles]
-            random.shuffle(others)
+            self.rng.shuffle(others)
             tweets = priority + others
             tweets = tweets[:12]
 
-        # Pad with FAN ZONE tweets if fewer than 6
+        # Pad with FAN ZONE tweets if fewer than 6 (stop if there is nobody to feature,
+        # e.g. a headless game where archetypes were never assigned)
         while len(tweets) < 12:
+            count = len(tweets)
             self._add_fan_zone_tweet(tweets)
+            if len(tweets) == count:
+                break
 
         return tweets
 
@@ -3098,7 +3452,7 @@ class TournamentScheduler:
         if not available:
             available = candidates  # Fallback if all used
 
-        player = random.choice(available)
+        player = self.rng.choice(available)
         archetype = player.get('archetype', 'player')
         arch_key = player.get('archetype_key', [])
         skills = player.get('skills', {})
@@ -3123,7 +3477,7 @@ class TournamentScheduler:
         skill_flavors = {
             'serve': ['serving', 'serve', 'delivery'],
             'forehand': ['forehand', 'forehand technique', 'forehand power'],
-            'backhand': ['backhand', 'backhand precision', 'two-hander' if random.random() < 0.5 else 'backhand'],
+            'backhand': ['backhand', 'backhand precision', 'two-hander' if self.rng.random() < 0.5 else 'backhand'],
             'speed': ['movement', 'court coverage', 'footwork'],
             'stamina': ['endurance', 'fitness', 'stamina'],
             'straight': ['down-the-line game', 'straight shots', 'line-painting'],
@@ -3131,7 +3485,7 @@ class TournamentScheduler:
             'dropshot': ['touch', 'dropshots', 'feel at the net'],
             'volley': ['net game', 'volleys', 'hands at the net'],
         }
-        skill_word = random.choice(skill_flavors.get(best_skill, [best_skill]))
+        skill_word = self.rng.choice(skill_flavors.get(best_skill, [best_skill]))
 
         fan_tweets = [
             f"{player['name']} is playing so well recently. His style of {archetype.lower()} is so fun to watch and his {skill_word} is absolutely elite right now! 🎾🔥",
@@ -3154,16 +3508,43 @@ class TournamentScheduler:
         tweets.append({
             'type': 'tweet',
             'title': '🗨️ FAN ZONE',
-            'content': random.choice(fan_tweets)
+            'content': self.rng.choice(fan_tweets)
         })
     
-    def simulate_current_round(self, tournament_id):
+    def simulate_current_round(self, tournament_id, map_matches=None):
         """
         Simulate all matches in the current round of the tournament.
+        With map_matches the round is played as one batch (see play_round)
+        and recorded in bracket order.
         """
-        tournament = next(t for t in self.tournaments if t['id'] == tournament_id)
+        tournament = self.get_tournament(tournament_id)
         matches = tournament.get('active_matches', [])
+        precomputed = self.play_round(tournament, map_matches) if matches else {}
         for match_idx, match in enumerate(matches):
             # Only simulate matches that are not yet completed
             if len(match) < 3 or match[2] is None:
-                self.simulate_through_match(tournament_id, match_idx)
+                self.simulate_through_match(tournament_id, match_idx, match_result=precomputed.get(match_idx))
+
+
+def play_match_task(player1, player2, surface, sets_to_win, seed):
+    """Play one match described by TournamentScheduler.match_task; safe to run in another process."""
+    engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, rng=random.Random(seed))
+    return engine.simulate_match(headless=True)
+
+
+def _play_match_task_args(task):
+    return play_match_task(*task)
+
+
+def play_tournament_task(task):
+    """
+    Play the tournament described by TournamentScheduler.tournament_task;
+    safe to run in another process. Returns (tournament, players of its
+    draw, EngineProfile or None) after the tournament.
+    """
+    tournament, players, rng_seed, year, week, date, fidelity, profile_timers = task
+    profile = EngineProfile(profile_timers) if profile_timers is not None else None
+    scheduler = TournamentScheduler.for_tournament(tournament, players, rng_seed, year, week, date,
+                                                   fidelity, profile)
+    scheduler.simulate_entire_tournament(tournament['id'])
+    return tournament, players, profile
@@ -0,0 +1,547 @@
+import numpy as np
+
+from sim.game_engine import STAT_KEYS, SURFACE_EFFECTS
+from sim import shot_model
+
+# Batch match simulator: plays many independent matches in lockstep with NumPy.
+#
+# It follows the same game model as GameEngine (one simulate_point call decides a
+# whole game, 6-6 is settled by a single tiebreak game) but advances every match
+# one shot per step, with masks for matches that are serving, rallying or done.
+# Random streams differ from GameEngine, so individual matches are not
+# reproduced; win rates, score distributions and match_stats counters agree
+# within statistical tolerance.
+
+SKILLS = ("serve", "forehand", "backhand", "speed", "stamina", "straight", "cross",
+          "mental", "lift", "slice", "iq", "dropshot", "volley")
+SKILL_DEFAULTS = {"dropshot": 30, "volley": 30, "lift": 30, "slice": 30,
+                  "iq": 50, "mental": 50, "cross": 50, "straight": 50}
+(SERVE, FOREHAND, BACKHAND, SPEED, STAMINA, STRAIGHT, CROSS,
+ MENTAL, LIFT, SLICE, IQ, DROPSHOT, VOLLEY) = range(len(SKILLS))
+
+MENTALITIES = ["neutral", "opportunist", "strategist", "disruptor", "marathonian",
+               "brute", "baseliner", "net-player", "specialist", "wildcard"]
+(NEUTRAL, OPPORTUNIST, STRATEGIST, DISRUPTOR, MARATHONIAN,
+ BRUTE, BASELINER, NET_PLAYER, SPECIALIST, WILDCARD) = range(len(MENTALITIES))
+
+# Hands: GameEngine compares against "Right"/"Left" exactly, anything else
+# (e.g. lowercase "right") never gets a forehand and is read as a left-hander
+# by the weak-side targeting.
+HAND_RIGHT, HAND_LEFT, HAND_OTHER = 0, 1, 2
+
+# Choice columns of the tendency table (same order as GameEngine)
+C_CROSS, C_STRAIGHT, C_DROPSHOT, C_VOLLEY, C_LIFT, C_SLICE = range(6)
+BASE_TENDENCIES = (35, 35, 5, 5, 10, 10)
+
+# Shot types
+T_FOREHAND, T_BACKHAND, T_DROPSHOT, T_VOLLEY, T_LIFT, T_SLICE = range(6)
+
+# Court sides / shot_leftright: 0 = right, 1 = left
+RIGHT, LEFT = 0, 1
+
+S_ACES, S_BREAKS = 0, 1
+WINNER_STAT = {T_FOREHAND: 2, T_BACKHAND: 3, T_DROPSHOT: 4, T_VOLLEY: 5, T_LIFT: 6, T_SLICE: 7}
+
+SURFACES = ["clay", "grass", "hard", "indoor"]
+
+
+def _surface_fx_row(surface):
+    """Per-surface factors in FX_* column order; the shot factors come from sim.shot_model."""
+    fx = SURFACE_EFFECTS.get(surface, {})
+    model = shot_model.ShotModel(fx)
+    return [model.serve_fx, model.power_fx[shot_model.FOREHAND], model.power_fx[shot_model.BACKHAND],
+            model.power_fx[shot_model.LIFT], model.power_fx[shot_model.VOLLEY], model.power_fx[shot_model.DROPSHOT],
+            model.precision_fx["straight"], model.precision_fx["cross"],
+            fx.get("slice_stamina", 1.5), fx.get("stamina_drain", 1.0), fx.get("speed", 1.0)]
+
+
+SURFACE_FX = np.array([_surface_fx_row(s) for s in SURFACES])
+(FX_SERVE, FX_FOREHAND, FX_BACKHAND, FX_LIFT, FX_VOLLEY, FX_DROPSHOT,
+ FX_STRAIGHT, FX_CROSS, FX_SLICE_STAMINA, FX_STAMINA_DRAIN, FX_SPEED) = range(SURFACE_FX.shape[1])
+
+# Return power multiplier ranges by bucket of the incoming shot's power
+# (<=10, <=20, ..., <=100, >100), shared with GameEngine.calculate_shot
+POWER_LO = np.array([lo for lo, _ in shot_model.RETURN_POWER_RANGES], dtype=float)
+POWER_HI = np.array([hi for _, hi in shot_model.RETURN_POWER_RANGES], dtype=float)
+
+
+def skill_vector(player):
+    """Return the player's skills as a list in SKILLS order."""
+    skills = player["skills"]
+    return [skills.get(s, SKILL_DEFAULTS.get(s, 50)) for s in SKILLS]
+
+
+def hand_code(player):
+    hand = player.get("hand")
+    if hand == "Right":
+        return HAND_RIGHT
+    if hand == "Left":
+        return HAND_LEFT
+    return HAND_OTHER
+
+
+def mentality_code(player):
+    mentality = player.get("mentality", "neutral")
+    return MENTALITIES.index(mentality) if mentality in MENTALITIES else NEUTRAL
+
+
+class BatchResult:
+    """Outcome arrays of a batch run. Player axis: 0 = player1, 1 = player2."""
+
+    def __init__(self, winner, set_scores, n_sets, match_stats, games, shots):
+        self.winner = winner            # (M,) index of the match winner
+        self.set_scores = set_scores    # (M, max_sets, 2) games per set, -1 padded
+        self.n_sets = n_sets            # (M,) sets played
+        self.match_stats = match_stats  # (M, 2, len(STAT_KEYS)) counters
+        self.games = games              # (M,) games played
+        self.shots = shots              # (M,) shots hit, serves included
+
+    def __len__(self):
+        return len(self.winner)
+
+    def format_set_scores(self, i):
+        """Format the set scores of match i as a string (e.g., "6-4, 7-5")."""
+        return ", ".join(f"{a}-{b}" for a, b in self.set_scores[i, :self.n_sets[i]])
+
+    def stats_dict(self, i, player):
+        """Return match_stats of one player of match i as a GameEngine-style dict."""
+        return {name: int(v) for name, v in zip(STAT_KEYS, self.match_stats[i, player])}
+
+
+class BatchEngine:
+    """
+    Simulate M independent matches at once.
+
+    skills1/skills2:   (M, len(SKILLS)) raw skill vectors, see skill_vector()
+    mentality1/2:      (M,) mentality codes, see MENTALITIES
+    hand1/2:           (M,) hand codes, see hand_code()
+    surfaces:          (M,) surface codes (index into SURFACES) or a single code
+    sets_to_win:       (M,) or scalar
+    tendencies1/2:     optional (M, 6) base shot tendencies before mentality/IQ
+                       adjustment (defaults to GameEngine's neutral base)
+    """
+
+    def __init__(self, skills1, skills2, mentality1, mentality2, hand1, hand2, surfaces,
+                 sets_to_win=2, tendencies1=None, tendencies2=None, rng=None, apply_form=True):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        raw = np.stack([np.asarray(skills1, dtype=np.float64),
+                        np.asarray(skills2, dtype=np.float64)], axis=1)
+        self.n = m = raw.shape[0]
+        self.mentality = np.stack([np.broadcast_to(mentality1, (m,)),
+                                   np.broadcast_to(mentality2, (m,))], axis=1).astype(np.int64)
+        self.hand = np.stack([np.broadcast_to(hand1, (m,)),
+                              np.broadcast_to(hand2, (m,))], axis=1).astype(np.int64)
+        self.surface = np.broadcast_to(np.asarray(surfaces, dtype=np.int64), (m,)).copy()
+        self.fx = SURFACE_FX[self.surface]
+        self.sets_to_win = np.broadcast_to(np.asarray(sets_to_win, dtype=np.int64), (m,)).copy()
+        if tendencies1 is None:
+            tendencies1 = BASE_TENDENCIES
+        if tendencies2 is None:
+            tendencies2 = BASE_TENDENCIES
+        self.tendencies = np.stack([np.broadcast_to(np.asarray(tendencies1, dtype=np.float64), (m, 6)),
+                                    np.broadcast_to(np.asarray(tendencies2, dtype=np.float64), (m, 6))], axis=1)
+
+        # Random form, then the mental-boost variant used on important points
+        if apply_form:
+            form = self.rng.uniform(0.975, 1.025, size=(m, 2, 1))
+            self.base_skills = np.minimum(100, np.floor(raw * form))
+        else:
+            self.base_skills = raw.copy()
+        modifier = 1.0 + (self.base_skills[:, :, MENTAL:MENTAL + 1] - 50) / 500.0
+        self.boost_skills = np.minimum(100, np.floor(self.base_skills * modifier))
+        self.boost_skills[:, :, MENTAL] = self.base_skills[:, :, MENTAL]
+        self.raw_speed = raw[:, :, SPEED].copy()
+
+    @classmethod
+    def from_players(cls, players1, players2, surfaces, sets_to_win=2, rng=None, apply_form=True):
+        """Build a batch from two equal-length lists of player dicts and surface names."""
+        if isinstance(surfaces, str):
+            surfaces = [surfaces] * len(players1)
+        return cls(
+            [skill_vector(p) for p in players1],
+            [skill_vector(p) for p in players2],
+            [mentality_code(p) for p in players1],
+            [mentality_code(p) for p in players2],
+            [hand_code(p) for p in players1],
+            [hand_code(p) for p in players2],
+            [SURFACES.index(s) for s in surfaces],
+            sets_to_win=sets_to_win,
+            rng=rng,
+            apply_form=apply_form,
+        )
+
+    # ── helpers (all vectorised over the rows given) ──
+
+    @staticmethod
+    def _speed_modifier(stamina):
+        return np.where(stamina >= 40, 1.0, 1.0 - (40 - stamina) / 40 * 0.25)
+
+    @staticmethod
+    def _power_modifier(stamina):
+        return np.where(stamina >= 20, 1.0, 1.0 - (20 - stamina) / 20 * 0.30)
+
+    def _triangular_precision(self, skill):
+        """Vectorised random.triangular(1, 100, skill), rounded and clamped."""
+        u = self.rng.random(skill.shape)
+        c = (skill - 1) / 99.0
+        flip = u > c
+        value = np.where(
+            flip,
+            100 - 99 * np.sqrt(np.clip((1 - u) * (1 - c), 0, None)),
+            1 + 99 * np.sqrt(np.clip(u * c, 0, None)),
+        )
+        return np.clip(np.round(value), 1, 100)
+
+    @staticmethod
+    def _weak_side_direction(hitter_pos, opp_hand, opp_skills):
+        """Column (C_CROSS/C_STRAIGHT) that lands on the opponent's weaker wing."""
+        bh_weaker = opp_skills[:, BACKHAND] < opp_skills[:, FOREHAND]
+        target_right = np.where(opp_hand == HAND_RIGHT, bh_weaker, ~bh_weaker)
+        return np.where(hitter_pos == RIGHT, target_right, ~target_right).astype(np.int64)
+
+    def _tendencies(self, rows, h, o, skills, rm, game_id):
+        """Mentality and IQ adjusted choice weights for hitter h against o, shape (len(rows), 6)."""
+        hs = skills[rows, h]
+        os_ = skills[rows, o]
+        ment = self.mentality[rows, h]
+        w = self.tendencies[rows, h].copy()
+        k = len(rows)
+        ar = np.arange(k)
+        opp_avg = os_.sum(axis=1) / len(SKILLS)
+
+        # Opportunist: safe when comfortable, specials under pressure
+        mask = ment == OPPORTUNIST
+        easy = mask & (rm >= 1.0)
+        w[easy, C_DROPSHOT] *= 0.6
+        w[easy, C_VOLLEY] *= 0.6
+        w[easy, C_LIFT] *= 0.7
+        w[easy, C_SLICE] *= 0.7
+        press = mask & (rm <= 0.7)
+        boost = 1 + (0.7 - rm[press]) * 2
+        w[press, C_DROPSHOT:] *= boost[:, None]
+
+        # Strategist: target the weaker groundstroke
+        mask = ment == STRATEGIST
+        if mask.any():
+            weak = self._weak_side_direction(self.pos[rows, h], self.hand[rows, o], os_)
+            side_boost = 1 + (np.abs(os_[:, FOREHAND] - os_[:, BACKHAND]) / 100) * 1.8
+            w[ar[mask], weak[mask]] *= side_boost[mask]
+
+        # Disruptor: dropshots vs slow opponents, volleys vs fast
+        mask = ment == DISRUPTOR
+        speed_diff = (os_[:, SPEED] - opp_avg) / np.maximum(1, opp_avg)
+        slow = mask & (speed_diff < 0)
+        fast = mask & (speed_diff >= 0)
+        w[slow, C_DROPSHOT] *= 1 + np.abs(speed_diff[slow]) * 3
+        w[fast, C_VOLLEY] *= 1 + speed_diff[fast] * 3
+
+        mask = ment == MARATHONIAN
+        w[mask, C_SLICE] *= 1.8
+        w[mask, C_LIFT] *= 0.6
+        mask = ment == BRUTE
+        w[mask, C_LIFT] *= 1.8
+        w[mask, C_SLICE] *= 0.6
+        mask = ment == BASELINER
+        w[mask, C_DROPSHOT] *= 0.4
+        w[mask, C_VOLLEY] *= 0.4
+        mask = ment == NET_PLAYER
+        w[mask, C_DROPSHOT] *= 2.0
+        w[mask, C_VOLLEY] *= 2.0
+
+        mask = ment == SPECIALIST
+        cross_better = hs[:, CROSS] >= hs[:, STRAIGHT]
+        w[mask & cross_better, C_CROSS] *= 1.5
+        w[mask & ~cross_better, C_STRAIGHT] *= 1.5
+
+        # Wildcard: one spin and one direction boosted, regenerated per game
+        # (mirrors GameEngine's shared game key: only a stale or missing boost is redrawn)
+        mask = ment == WILDCARD
+        if mask.any():
+            r = rows[mask]
+            hm = h[mask]
+            redraw = (self.wc_game[r] != game_id[mask]) | ~self.wc_has[r, hm]
+            rr, hr = r[redraw], hm[redraw]
+            self.wc_game[rr] = game_id[mask][redraw]
+            self.wc_spin[rr, hr] = self.rng.integers(C_LIFT, C_SLICE + 1, size=len(rr))
+            self.wc_dir[rr, hr] = self.rng.integers(C_CROSS, C_STRAIGHT + 1, size=len(rr))
+            self.wc_has[rr, hr] = True
+            am = ar[mask]
+            w[am, self.wc_spin[r, hm]] *= 1.7
+            w[am, self.wc_dir[r, hm]] *= 1.4
+
+        # IQ refinements
+        iq_factor = (hs[:, IQ] - 50) / 250.0
+        smart = np.abs(iq_factor) >= 0.01
+        diff = hs[:, CROSS] - hs[:, STRAIGHT]
+        m1 = smart & (diff != 0)
+        stronger = np.where(diff > 0, C_CROSS, C_STRAIGHT)
+        w[ar[m1], stronger[m1]] *= 1 + iq_factor[m1] * np.abs(diff[m1]) / 80.0
+
+        special = hs[:, [DROPSHOT, VOLLEY, LIFT, SLICE]]
+        avg_special = special.mean(axis=1, keepdims=True)
+        up = 1 + iq_factor[:, None] * (special - avg_special) / 80.0
+        down = np.maximum(0.5, 1 - np.abs(iq_factor)[:, None] * (avg_special - special) / 160.0)
+        factor = np.where(special > avg_special, up, np.where(special < avg_special, down, 1.0))
+        w[smart, C_DROPSHOT:] *= factor[smart]
+
+        slow = smart & (os_[:, SPEED] < opp_avg)
+        slowness = (opp_avg - os_[:, SPEED]) / np.maximum(1, opp_avg)
+        w[slow, C_DROPSHOT] *= 1 + iq_factor[slow] * slowness[slow] * 2
+        w[slow, C_LIFT] *= 1 + iq_factor[slow] * slowness[slow] * 1.5
+
+        fh_bh = np.abs(os_[:, FOREHAND] - os_[:, BACKHAND])
+        m4 = smart & (fh_bh > 3)
+        if m4.any():
+            weak = self._weak_side_direction(self.pos[rows, h], self.hand[rows, o], os_)
+            w[ar[m4], weak[m4]] *= 1 + iq_factor[m4] * (fh_bh[m4] / 100.0) * 2
+        return w
+
+    def _choose(self, weights):
+        cum = np.cumsum(weights, axis=1)
+        draw = self.rng.random(len(weights)) * cum[:, -1]
+        return np.minimum((cum <= draw[:, None]).sum(axis=1), weights.shape[1] - 1)
+
+    # ── simulation ──
+
+    def run(self):
+        """Simulate all matches to completion and return a BatchResult."""
+        m = self.n
+        rng = self.rng
+        fx = self.fx
+        max_sets = int(2 * self.sets_to_win.max() - 1)
+
+        self.games = np.zeros((m, 2), dtype=np.int64)
+        self.sets = np.zeros((m, 2), dtype=np.int64)
+        self.set_scores = np.full((m, max_sets, 2), -1, dtype=np.int64)
+        self.n_sets = np.zeros(m, dtype=np.int64)
+        self.stats = np.zeros((m, 2, len(STAT_KEYS)), dtype=np.int64)
+        self.games_played = np.zeros(m, dtype=np.int64)
+        self.shots = np.zeros(m, dtype=np.int64)
+        self.stamina = np.full((m, 2), 100.0)
+        self.speed = self.raw_speed.copy()
+        self.pos = np.tile(np.array([RIGHT, LEFT]), (m, 1))
+        self.volley = np.zeros((m, 2), dtype=bool)
+        self.wc_game = np.full(m, -1, dtype=np.int64)
+        self.wc_has = np.zeros((m, 2), dtype=bool)
+        self.wc_spin = np.zeros((m, 2), dtype=np.int64)
+        self.wc_dir = np.zeros((m, 2), dtype=np.int64)
+        self.skills = self.base_skills.copy()
+
+        server = np.zeros(m, dtype=np.int64)
+        last_power = np.zeros(m)
+        rm = np.ones(m)
+        hitter = np.zeros(m, dtype=np.int64)
+        leftright = np.zeros(m, dtype=np.int64)
+        rally = np.zeros(m, dtype=np.int64)
+        in_rally = np.zeros(m, dtype=bool)
+        active = np.ones(m, dtype=bool)
+        point_winner = np.zeros(m, dtype=np.int64)
+        ar_all = np.arange(m)
+
+        while active.any():
+            point_over = np.zeros(m, dtype=bool)
+
+            # ── Serve: start a new point for every active match not in a rally ──
+            rows = ar_all[active & ~in_rally]
+            if len(rows):
+                g = self.games[rows]
+                s = self.sets[rows]
+                stw = self.sets_to_win[rows]
+                ahead1 = (g[:, 0] >= 5) & (g[:, 0] > g[:, 1])
+                ahead2 = (g[:, 1] >= 5) & (g[:, 1] > g[:, 0])
+                important = ahead1 | ahead2 | ((g[:, 0] == 6) & (g[:, 1] == 6))
+                self.skills[rows] = np.where(important[:, None, None],
+                                             self.boost_skills[rows], self.base_skills[rows])
+                imp_rows = rows[important]
+                self.speed[imp_rows] = np.floor(self.skills[imp_rows, :, SPEED]
+                                                * self._speed_modifier(self.stamina[imp_rows]))
+
+                h = server[rows]
+                o = 1 - h
+                rm[rows] = 1.0
+                game_id = self.games_played[rows]
+                w = self._tendencies(rows, h, o, self.skills, rm[rows], game_id)
+                choice = self._choose(w)
+                lr = (choice == C_CROSS).astype(np.int64)
+                leftright[rows] = lr
+                hs = self.skills[rows, h]
+                pm = rng.uniform(*shot_model.SERVE_POWER_RANGE, size=len(rows)) * fx[rows, FX_SERVE]
+                power = np.round(hs[:, SERVE] * pm * self._power_modifier(self.stamina[rows, h]))
+                last_power[rows] = power
+                self.pos[rows, o] = 1 - lr
+                eff_speed = self.speed[rows, o] * fx[rows, FX_SPEED]
+                ace = power > eff_speed
+                rm[rows] = np.where(eff_speed - power <= 10, 0.8, 1.0)
+                rally[rows] = 1
+
+                ace_rows = rows[ace]
+                self.stats[ace_rows, h[ace], S_ACES] += 1
+                point_winner[ace_rows] = h[ace]
+                point_over[ace_rows] = True
+                in_rally[rows[~ace]] = True
+                hitter[rows[~ace]] = o[~ace]  # receiver hits next
+                # Served this step; rallies continue next step
+                serving = np.zeros(m, dtype=bool)
+                serving[rows] = True
+            else:
+                serving = np.zeros(m, dtype=bool)
+
+            # ── Rally shot for every match already in a rally ──
+            rows = ar_all[in_rally & ~serving]
+            if len(rows):
+                h = hitter[rows]
+                o = 1 - h
+                k = len(rows)
+                ar = np.arange(k)
+                hs = self.skills[rows, h]
+                r_rm = rm[rows]
+
+                # A hitter in volley mode can only volley; otherwise no volley
+                # against an opponent who is already at the net
+                choice = np.full(k, C_VOLLEY)
+                free = ~self.volley[rows, h]
+                if free.any():
+                    fr, fh, fo = rows[free], h[free], o[free]
+                    w = self._tendencies(fr, fh, fo, self.skills, r_rm[free], self.games_played[fr])
+                    w[self.volley[fr, fo], C_VOLLEY] = 0.0
+                    choice[free] = self._choose(w)
+
+                is_ground = choice <= C_STRAIGHT
+                incoming = leftright[rows]
+                hand = self.hand[rows, h]
+                forehand = ((hand == HAND_LEFT) & (incoming == RIGHT)) | ((hand == HAND_RIGHT) & (incoming == LEFT))
+                shot = np.select(
+                    [is_ground & forehand, is_ground, choice == C_DROPSHOT, choice == C_VOLLEY, choice == C_LIFT],
+                    [T_FOREHAND, T_BACKHAND, T_DROPSHOT, T_VOLLEY, T_LIFT],
+                    T_SLICE,
+                )
+                # Lift/slice pick their ball direction 50/50
+                spin = (shot == T_LIFT) | (shot == T_SLICE)
+                direction = np.where(spin, (rng.random(k) >= 0.5).astype(np.int64), choice)
+                self.volley[rows[shot == T_VOLLEY], h[shot == T_VOLLEY]] = True
+
+                is_cross = direction == C_CROSS
+                lr = np.where(self.pos[rows, h] == RIGHT, is_cross, ~is_cross).astype(np.int64)
+                leftright[rows] = lr
+
+                # Shot power/precision (GameEngine.calculate_shot)
+                rf = fx[rows]
+                lift_sk = hs[:, LIFT]
+                slice_sk = hs[:, SLICE]
+                drop_sk = hs[:, DROPSHOT]
+                volley_sk = hs[:, VOLLEY]
+                ground_sk = np.where(shot == T_FOREHAND, hs[:, FOREHAND],
+                                     np.where(shot == T_BACKHAND, hs[:, BACKHAND], volley_sk))
+                base = np.select(
+                    [shot == T_DROPSHOT, shot == T_LIFT, shot == T_SLICE],
+                    [drop_sk * r_rm * rf[:, FX_DROPSHOT],
+                     lift_sk * r_rm * 1.3 * rf[:, FX_LIFT],
+                     slice_sk * r_rm * (0.2 + (slice_sk / 100) * 0.5)],
+                    ground_sk * r_rm,
+                )
+                base = np.where(shot == T_BACKHAND, base * rf[:, FX_BACKHAND], base)
+                base = np.where(shot == T_VOLLEY,
+                                base * (1.0 + np.maximum(0, (volley_sk - 30) / 100)) * rf[:, FX_VOLLEY], base)
+                base = np.where(shot == T_FOREHAND, base * rf[:, FX_FOREHAND], base)
+                dir_sk = np.where(direction == C_CROSS, np.floor(hs[:, CROSS] * rf[:, FX_CROSS]),
+                                  np.floor(hs[:, STRAIGHT] * rf[:, FX_STRAIGHT]))
+                prec_sk = np.select(
+                    [shot == T_DROPSHOT, shot == T_LIFT, shot == T_SLICE, shot == T_VOLLEY],
+                    [drop_sk, np.maximum(5, np.floor(lift_sk * 0.4 + 5)),
+                     np.minimum(95, np.floor(slice_sk * 1.2 + 20)), volley_sk],
+                    dir_sk,
+                )
+                precision = self._triangular_precision(prec_sk)
+                bucket = np.clip((last_power[rows].astype(np.int64) - 1) // 10, 0, 10)
+                pm = rng.uniform(POWER_LO[bucket], POWER_HI[bucket])
+                power = np.round(base * pm * self._power_modifier(self.stamina[rows, h]))
+                last_power[rows] = power
+
+                # Dropshot success uses the dropshot's own power (as GameEngine does)
+                is_drop = shot == T_DROPSHOT
+                chance = np.clip((drop_sk - power + 100) / 200, 0.05, 0.95)
+                drop_ok = is_drop & (rng.random(k) < chance)
+                self.pos[rows, o] = 1 - lr
+                rally[rows] += 1
+
+                speed_o = self.speed[rows, o]
+                drop_diff = speed_o - drop_sk
+                drop_winner = drop_ok & (drop_diff < 0)
+                drop_rm = np.select([drop_diff < 2, drop_diff < 4, drop_diff < 6, drop_diff <= 7],
+                                    [0.3, 0.4, 0.5, 0.6], 0.75)
+                new_rm = np.where(drop_ok, drop_rm, 2.0)
+                volley_o = self.volley[rows, o]
+                new_rm = np.where(is_drop & volley_o, 3.0, new_rm)
+
+                # Catching (GameEngine.can_catch)
+                eff_speed = speed_o * rf[:, FX_SPEED]
+                ratio = np.maximum(1, power) / eff_speed
+                pf = (0.3 + precision / 70) * np.where(volley_o, 1.85, 1.0)
+                score = ratio * pf
+                catch_rm = np.where(score > 1, 0.7, 1.0)
+                caught = np.where(is_drop, True, score <= 1.3)
+                new_rm = np.where(is_drop, new_rm, catch_rm)
+                weak_lift = (shot == T_LIFT) & caught & (power < 35)
+                new_rm = np.where(weak_lift, np.maximum(new_rm, 1.3 + (35 - power) / 50), new_rm)
+                rm[rows] = new_rm
+                self.volley[rows[is_drop & ~drop_winner], o[is_drop & ~drop_winner]] = True
+
+                won = drop_winner | ~caught
+                wr, wh, ws = rows[won], h[won], shot[won]
+                for t, col in WINNER_STAT.items():
+                    sel = ws == t
+                    self.stats[wr[sel], wh[sel], col] += 1
+                brk = wh != server[wr]
+                self.stats[wr[brk], wh[brk], S_BREAKS] += 1
+                point_winner[wr] = wh
+                point_over[wr] = True
+                in_rally[wr] = False
+
+                # Defender pays a small stamina cost for every caught ball
+                cont = ~won
+                cr, co = rows[cont], o[cont]
+                drain = precision[cont] / (np.maximum(1, self.skills[cr, co, STAMINA]) * 10.0)
+                drain = np.where(shot[cont] == T_SLICE, drain * rf[cont, FX_SLICE_STAMINA], drain)
+                drain = drain * rf[cont, FX_STAMINA_DRAIN]
+                self.stamina[cr, co] = np.maximum(0, self.stamina[cr, co] - drain)
+                self.speed[cr, co] = np.floor(self.skills[cr, co, SPEED] * self._speed_modifier(self.stamina[cr, co]))
+                hitter[cr] = co
+
+            # ── Finish points: per-game stamina, score, sets ──
+            rows = ar_all[point_over]
+            if len(rows):
+                self.shots[rows] += rally[rows]
+                self.skills[rows] = self.base_skills[rows]
+                stam_sk = np.maximum(1, self.base_skills[rows, :, STAMINA])
+                st = np.maximum(0, self.stamina[rows] - 3.5 * (100.0 / (stam_sk + 50)))
+                self.stamina[rows] = np.minimum(100.0, st + stam_sk / 100.0)
+                self.speed[rows] = np.floor(self.base_skills[rows, :, SPEED] * self._speed_modifier(self.stamina[rows]))
+                self.volley[rows] = False
+
+                self.games[rows, point_winner[rows]] += 1
+                self.games_played[rows] += 1
+                server[rows] = 1 - server[rows]
+
+                g = self.games[rows]
+                p1_set = ((g[:, 0] >= 6) & (g[:, 0] - g[:, 1] >= 2)) | ((g[:, 0] == 7) & (g[:, 1] == 6))
+                p2_set = ((g[:, 1] >= 6) & (g[:, 1] - g[:, 0] >= 2)) | ((g[:, 1] == 7) & (g[:, 0] == 6))
+                done = rows[p1_set | p2_set]
+                if len(done):
+                    set_winner = np.where(p1_set, 0, 1)[p1_set | p2_set]
+                    self.sets[done, set_winner] += 1
+                    self.set_scores[done, self.n_sets[done]] = self.games[done]
+                    self.n_sets[done] += 1
+                    self.games[done] = 0
+                    self.stamina[done] = np.minimum(100.0, self.stamina[done] + self.base_skills[done, :, STAMINA] / 8.0)
+                    finished = done[(self.sets[done] == self.sets_to_win[done, None]).any(axis=1)]
+                    active[finished] = False
+
+        winner = np.where(self.sets[:, 0] == self.sets_to_win, 0, 1)
+        return BatchResult(winner, self.set_scores, self.n_sets, self.stats, self.games_played, self.shots)
+
+
+def simulate_batch(players1, players2, surfaces, sets_to_win=2, seed=None):
+    """Convenience wrapper: simulate player1[i] vs player2[i] for every i."""
+    engine = BatchEngine.from_players(players1, players2, surfaces, sets_to_win,
+                                      rng=np.random.default_rng(seed))
+    return engine.run()
@@ -0,0 +1,329 @@
+import json
+import struct
+
+from sim.game_engine import STAT_KEYS
+
+# Compact binary encoding of GameEngine.simulate_match(visualize=True) events.
+#
+# Layout (all little-endian), version 1:
+#
+#   header   b"TGEV", u8 version, u16 n, n bytes of JSON {"players": [[id, name], [id, name]]}
+#   point    u8 TAG_POINT
+#            u8 winner (0/1), u8 player1 games, u8 player2 games (after the point)
+#            u8 finished sets, then u8 u8 per finished set
+#            u8 changed counters k, then k x (u8 counter, u16 value)   (match_stats deltas)
+#            u8 shots, then per shot: u8 code, u16 x*32, u16 y*32, f32 power,
+#                                     u16 stamina1*65535, u16 stamina2*65535
+#            u8 summary flags, and if present: u8 winning shot, u16 rally length, u16 ball_y*32
+#   end      u8 TAG_END, u8 winner (0/1)
+#
+# A shot code packs the shot type (bits 0-2, index into SHOT_TYPES), the hitter
+# (bit 3) and is_final (bit 4). Player ids only appear in the header; records
+# refer to players as 0/1. Coordinates keep 1/32 px, power is a float32 and
+# stamina keeps 1/65535, which is far below what the viewer can show; every
+# other field round-trips exactly.
+#
+# decode_events yields lightweight records that read like the engine's dicts
+# (event['type'], event.get('hitter_id'), 'match_stats' in event, ...), so the
+# court viewer driver, PointStream and generate_commentary take them as is.
+
+MAGIC = b"TGEV"
+FORMAT_VERSION = 1
+
+TAG_POINT = 1
+TAG_END = 2
+
+SHOT_TYPES = ("serve", "forehand", "backhand", "dropshot", "volley", "lift", "slice")
+PLAYER_KEYS = ("player1", "player2")
+
+_SHOT_CODES = {name: i for i, name in enumerate(SHOT_TYPES)}
+_HITTER_BIT = 0x08
+_FINAL_BIT = 0x10
+
+_SUMMARY_PRESENT = 0x01
+_SUMMARY_ACE = 0x02
+_SUMMARY_BREAK = 0x04
+_SUMMARY_SERVER_BIT = 0x08
+_SUMMARY_WINNER_BIT = 0x10
+
+_POINT = struct.Struct("<BBBB")
+_SHOT = struct.Struct("<BHHfHH")
+_STAT = struct.Struct("<BH")
+_SUMMARY = struct.Struct("<BHH")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+
+_COORD_SCALE = 32
+_STAMINA_SCALE = 65535
+
+
+class _Record:
+    """Read-only record that also answers dict-style lookups of its fields."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+
+class BallPosition(_Record):
+    __slots__ = ("x", "y", "power")
+    type = "ball_position"
+
+    def __init__(self, x, y, power):
+        self.x = x
+        self.y = y
+        self.power = power
+
+
+class ShotRecord(_Record):
+    __slots__ = ("shot_type", "hitter_id", "is_final", "stamina", "ball")
+    type = "shot"
+
+    def __init__(self, shot_type, hitter_id, is_final, stamina, ball):
+        self.shot_type = shot_type
+        self.hitter_id = hitter_id
+        self.is_final = is_final
+        self.stamina = stamina
+        self.ball = ball
+
+    @property
+    def ball_positions(self):
+        return (self.ball,)
+
+
+class ScoreRecord(_Record):
+    __slots__ = ("sets", "current_set", "player1_name", "player2_name", "match_stats")
+    type = "score"
+
+    def __init__(self, sets, current_set, player1_name, player2_name, match_stats):
+        self.sets = sets
+        self.current_set = current_set
+        self.player1_name = player1_name
+        self.player2_name = player2_name
+        self.match_stats = match_stats
+
+
+class SummaryRecord(_Record):
+    __slots__ = ("winner_id", "loser_id", "winning_shot", "is_ace", "rally_length", "ball_y",
+                 "server_id", "is_break")
+    type = "point_summary"
+
+    def __init__(self, winner_id, loser_id, winning_shot, is_ace, rally_length, ball_y, server_id, is_break):
+        self.winner_id = winner_id
+        self.loser_id = loser_id
+        self.winning_shot = winning_shot
+        self.is_ace = is_ace
+        self.rally_length = rally_length
+        self.ball_y = ball_y
+        self.server_id = server_id
+        self.is_break = is_break
+
+
+class PointRecord(_Record):
+    __slots__ = ("events", "winner")
+    type = "point"
+
+    def __init__(self, events, winner):
+        self.events = events
+        self.winner = winner
+
+
+class MatchEndRecord(_Record):
+    __slots__ = ("winner",)
+    type = "match_end"
+
+    def __init__(self, winner):
+        self.winner = winner
+
+
+def _coord(value):
+    return max(0, min(0xFFFF, round(value * _COORD_SCALE)))
+
+
+def _stamina(value):
+    return max(0, min(_STAMINA_SCALE, round(value * _STAMINA_SCALE)))
+
+
+class EventEncoder:
+    """
+    Incremental encoder for the events of one match between player1 and
+    player2 (dicts with at least 'id' and 'name'). Feed it point and
+    match_end events with add(); getvalue() returns the encoded bytes.
+    """
+
+    def __init__(self, player1, player2):
+        self.ids = (player1["id"], player2["id"])
+        header = json.dumps({"players": [[player1["id"], player1["name"]],
+                                         [player2["id"], player2["name"]]]}).encode()
+        self._out = bytearray(MAGIC)
+        self._out += _U8.pack(FORMAT_VERSION)
+        self._out += _U16.pack(len(header))
+        self._out += header
+        self._stats = [0] * (2 * len(STAT_KEYS))
+
+    def _index(self, player_id):
+        return 0 if player_id == self.ids[0] else 1
+
+    def add(self, event):
+        out = self._out
+        if event["type"] == "match_end":
+            out += _U8.pack(TAG_END)
+            out += _U8.pack(self._index(event["winner"]["id"]))
+            return
+        score = summary = None
+        shots = []
+        for e in event["events"]:
+            if e["type"] == "score":
+                score = e
+            elif e["type"] == "shot":
+                shots.append(e)
+            elif e["type"] == "point_summary":
+                summary = e
+
+        out += _U8.pack(TAG_POINT)
+        current = score["current_set"]
+        out += _POINT.pack(PLAYER_KEYS.index(event["winner"]), current["player1"], current["player2"],
+                           len(score["sets"]))
+        for p1_games, p2_games in score["sets"]:
+            out += bytes((p1_games, p2_games))
+
+        changed = []
+        for p, key in enumerate(PLAYER_KEYS):
+            counters = score["match_stats"][key]
+            for s, stat in enumerate(STAT_KEYS):
+                i = p * len(STAT_KEYS) + s
+                if counters[stat] != self._stats[i]:
+                    self._stats[i] = counters[stat]
+                    changed.append(_STAT.pack(i, counters[stat]))
+        out += _U8.pack(len(changed))
+        out += b"".join(changed)
+
+        out += _U8.pack(len(shots))
+        for shot in shots:
+            ball = shot["ball_positions"][0]
+            code = _SHOT_CODES[shot["shot_type"]]
+            if self._index(shot["hitter_id"]):
+                code |= _HITTER_BIT
+            if shot.get("is_final"):
+                code |= _FINAL_BIT
+            stamina = shot["stamina"]
+            out += _SHOT.pack(code, _coord(ball["x"]), _coord(ball["y"]), ball["power"],
+                              _stamina(stamina[self.ids[0]]), _stamina(stamina[self.ids[1]]))
+
+        if summary is None:
+            out += _U8.pack(0)
+        else:
+            flags = _SUMMARY_PRESENT
+            if summary["is_ace"]:
+                flags |= _SUMMARY_ACE
+            if summary["is_break"]:
+                flags |= _SUMMARY_BREAK
+            if self._index(summary["server_id"]):
+                flags |= _SUMMARY_SERVER_BIT
+            if self._index(summary["winner_id"]):
+                flags |= _SUMMARY_WINNER_BIT
+            out += _U8.pack(flags)
+            out += _SUMMARY.pack(_SHOT_CODES[summary["winning_shot"]], summary["rally_length"],
+                                 _coord(summary["ball_y"]))
+
+    def getvalue(self):
+        return bytes(self._out)
+
+
+def encode_events(player1, player2, events):
+    """Encode an iterable of point / match_end events of one match."""
+    encoder = EventEncoder(player1, player2)
+    for event in events:
+        encoder.add(event)
+    return encoder.getvalue()
+
+
+def decode_events(data):
+    """
+    Lazily decode bytes from encode_events into PointRecord / MatchEndRecord
+    objects, in order. Raises ValueError for data that is not in this format
+    or from an unknown format version.
+    """
+    view = memoryview(data)
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError("Not an encoded match event stream")
+    version = view[4]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported event format version {version}")
+    (length,) = _U16.unpack_from(view, 5)
+    pos = 7 + length
+    header = json.loads(bytes(view[7:pos]))
+    (id1, name1), (id2, name2) = header["players"]
+    ids = (id1, id2)
+    names = (name1, name2)
+    stats = [0] * (2 * len(STAT_KEYS))
+    n_stats = len(STAT_KEYS)
+
+    while pos < len(view):
+        tag = view[pos]
+        pos += 1
+        if tag == TAG_END:
+            winner = view[pos]
+            pos += 1
+            yield MatchEndRecord({"id": ids[winner], "name": names[winner]})
+            continue
+        if tag != TAG_POINT:
+            raise ValueError(f"Corrupt event stream: unknown record tag {tag}")
+
+        winner, games1, games2, n_sets = _POINT.unpack_from(view, pos)
+        pos += _POINT.size
+        sets = [(view[pos + 2 * i], view[pos + 2 * i + 1]) for i in range(n_sets)]
+        pos += 2 * n_sets
+
+        n_changed = view[pos]
+        pos += 1
+        for _ in range(n_changed):
+            i, value = _STAT.unpack_from(view, pos)
+            pos += _STAT.size
+            stats[i] = value
+        match_stats = {
+            "player1": dict(zip(STAT_KEYS, stats[:n_stats])),
+            "player2": dict(zip(STAT_KEYS, stats[n_stats:])),
+        }
+        events = [ScoreRecord(sets, {"player1": games1, "player2": games2}, name1, name2, match_stats)]
+
+        n_shots = view[pos]
+        pos += 1
+        for _ in range(n_shots):
+            code, x, y, power, stamina1, stamina2 = _SHOT.unpack_from(view, pos)
+            pos += _SHOT.size
+            events.append(ShotRecord(
+                SHOT_TYPES[code & 0x07],
+                ids[1 if code & _HITTER_BIT else 0],
+                bool(code & _FINAL_BIT),
+                {id1: stamina1 / _STAMINA_SCALE, id2: stamina2 / _STAMINA_SCALE},
+                BallPosition(x / _COORD_SCALE, y / _COORD_SCALE, power),
+            ))
+
+        flags = view[pos]
+        pos += 1
+        if flags & _SUMMARY_PRESENT:
+            shot, rally_length, ball_y = _SUMMARY.unpack_from(view, pos)
+            pos += _SUMMARY.size
+            point_winner = 1 if flags & _SUMMARY_WINNER_BIT else 0
+            events.append(SummaryRecord(
+                ids[point_winner],
+                ids[1 - point_winner],
+                SHOT_TYPES[shot],
+                bool(flags & _SUMMARY_ACE),
+                rally_length,
+                ball_y / _COORD_SCALE,
+                ids[1 if flags & _SUMMARY_SERVER_BIT else 0],
+                bool(flags & _SUMMARY_BREAK),
+            ))
+
+        yield PointRecord(events, PLAYER_KEYS[winner])
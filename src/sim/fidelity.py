@@ -0,0 +1,251 @@
+import math
+import random
+from collections import defaultdict
+
+from sim.game_engine import PLAYER_KEYS, STAT_KEYS, GameEngine, MatchResult
+from sim.markov import set_winner, solve_match
+
+# Tiered simulation fidelity per tournament category.
+#
+# FULL plays the rally-by-rally GameEngine. ANALYTIC draws every game from a
+# hold probability, a logistic function of the skill gap between server and
+# receiver fitted per surface to full-engine games. ELO picks the winner from
+# RankingSystem.calculate_expected_score and the score from games drawn with
+# the average hold. Neither cheap tier produces point events or match stats
+# (the counters are all zero), and both cost microseconds instead of
+# milliseconds.
+#
+# calibrate() plays a sample of full-engine matches between the given players
+# and fits the hold model to their games. Each cheap tier then has its
+# favourite for every sampled match (higher win probability under the tier's
+# model); the analytic skill effect and the ELO rating gap are scaled so that
+# the upset rate the tier expects matches how often those favourites lost in
+# the full engine. A tier that cannot get within `tolerance` is played with
+# the full engine instead; calibration_report says which.
+
+FULL, ANALYTIC, ELO = "full", "analytic", "elo"
+TIERS = (FULL, ANALYTIC, ELO)
+
+# A reasonable split of the default calendar: Challenger events, most of the
+# matches played, go cheap, the main tour keeps the full engine.
+DEFAULT_TIERS = {
+    "Challenger 50": ELO,
+    "Challenger 75": ANALYTIC,
+    "Challenger 100": ANALYTIC,
+    "Challenger 125": ANALYTIC,
+    "Challenger 175": ANALYTIC,
+}
+
+SURFACES = ("clay", "grass", "hard", "indoor")
+ZERO_STATS = dict.fromkeys(STAT_KEYS, 0)
+
+
+def skill_average(player):
+    skills = player["skills"]
+    return sum(skills.values()) / len(skills)
+
+
+def hold_features(server, receiver):
+    """Inputs of the hold model: bias, skill average gap and the server's serve (both per 10 points)."""
+    return (1.0, (skill_average(server) - skill_average(receiver)) / 10, (server["skills"]["serve"] - 60) / 10)
+
+
+def _logistic(z):
+    return 1 / (1 + math.exp(-z))
+
+
+def _fit_logistic(rows, iterations=12):
+    """Newton's method for logistic regression on [(features, held)] rows."""
+    n = len(rows[0][0])
+    w = [0.0] * n
+    for _ in range(iterations):
+        grad = [0.0] * n
+        hess = [[0.0] * n for _ in range(n)]
+        for x, y in rows:
+            p = _logistic(sum(a * b for a, b in zip(w, x)))
+            for i in range(n):
+                grad[i] += (y - p) * x[i]
+                for j in range(n):
+                    hess[i][j] += p * (1 - p) * x[i] * x[j]
+        # Solve hess * step = grad by Gaussian elimination (n is tiny)
+        a = [hess[i] + [grad[i]] for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                f = a[j][i] / a[i][i]
+                for k in range(i, n + 1):
+                    a[j][k] -= f * a[i][k]
+        step = [0.0] * n
+        for i in reversed(range(n)):
+            step[i] = (a[i][n] - sum(a[i][k] * step[k] for k in range(i + 1, n))) / a[i][i]
+        w = [a_ + s for a_, s in zip(w, step)]
+    return tuple(w)
+
+
+def play_games(hold1, hold2, sets_to_win, rng):
+    """
+    Play a match game by game, player1 serving first, where player1 holds
+    with probability hold1 and player2 with hold2. Returns (winner index,
+    set scores, games played).
+    """
+    sets = [0, 0]
+    set_scores = []
+    server = 0
+    games = 0
+    while sets[0] < sets_to_win and sets[1] < sets_to_win:
+        score = [0, 0]
+        winner = None
+        while winner is None:
+            if server == 0:
+                score[0 if rng.random() < hold1 else 1] += 1
+            else:
+                score[1 if rng.random() < hold2 else 0] += 1
+            server ^= 1
+            games += 1
+            winner = set_winner(*score)
+        sets[winner] += 1
+        set_scores.append(tuple(score))
+    return (0 if sets[0] == sets_to_win else 1), set_scores, games
+
+
+class FidelityPolicy:
+    """
+    Which fidelity tier plays each tournament category (FULL for categories
+    not in `tiers`), with the calibrated models of the cheaper tiers.
+    """
+
+    def __init__(self, tiers=None, default=FULL, tolerance=0.03):
+        self.tiers = dict(DEFAULT_TIERS if tiers is None else tiers)
+        for tier in list(self.tiers.values()) + [default]:
+            if tier not in TIERS:
+                raise ValueError(f"Unknown fidelity tier {tier!r}")
+        self.default = default
+        self.tolerance = tolerance
+        self.hold_coefficients = {}   # surface -> logistic coefficients of hold_features
+        self.analytic_scale = 1.0     # multiplies the skill terms of the hold model
+        self.elo_scale = 1.0          # multiplies the rating gap fed to calculate_expected_score
+        self.base_hold = 0.6          # average hold, used for ELO-tier scores
+        self.calibration_report = None
+        self._disabled = set()        # tiers that missed the tolerance
+
+    @property
+    def calibrated(self):
+        return self.calibration_report is not None
+
+    def tier_for(self, category):
+        tier = self.tiers.get(category, self.default)
+        return FULL if tier in self._disabled else tier
+
+    def hold_probability(self, server, receiver, surface):
+        bias, *weights = self.hold_coefficients.get(surface) or self.hold_coefficients["hard"]
+        _, *x = hold_features(server, receiver)
+        return _logistic(bias + self.analytic_scale * sum(w * v for w, v in zip(weights, x)))
+
+    def elo_expected(self, ranking_system, player1, player2):
+        """player1's expected score with the calibrated rating gap."""
+        r1 = ranking_system.get_elo_rating(player1)
+        r2 = ranking_system.get_elo_rating(player2)
+        return ranking_system.calculate_expected_score(r1, r1 + self.elo_scale * (r2 - r1))
+
+    def play(self, tier, player1, player2, surface, sets_to_win, rng, ranking_system):
+        """MatchResult of player1 vs player2 played at a cheap tier, drawing from rng."""
+        if tier == ANALYTIC:
+            winner, set_scores, games = play_games(self.hold_probability(player1, player2, surface),
+                                                   self.hold_probability(player2, player1, surface),
+                                                   sets_to_win, rng)
+        elif tier == ELO:
+            winner = 0 if rng.random() < self.elo_expected(ranking_system, player1, player2) else 1
+            score_winner, set_scores, games = play_games(self.base_hold, self.base_hold, sets_to_win, rng)
+            if score_winner != winner:
+                set_scores = [(g2, g1) for g1, g2 in set_scores]
+        else:
+            raise ValueError(f"{tier!r} is not a cheap fidelity tier")
+        players = (player1, player2)
+        return MatchResult(players[winner], PLAYER_KEYS[winner], set_scores,
+                           {player1["id"]: dict(ZERO_STATS), player2["id"]: dict(ZERO_STATS)}, games, 0)
+
+    def calibrate(self, players, ranking_system, matches=400, seed=0):
+        """
+        Fit the cheaper tiers to `matches` full-engine matches between pairs
+        of `players`, on every surface, best of three and of five.
+        Returns (and keeps as calibration_report) each cheap tier's expected
+        upset rate next to the full engine's for the same favourites.
+        """
+        rng = random.Random(seed)
+        # Draws mostly pair players of similar strength, so opponents are
+        # picked within a window of up to 32 places in ELO order
+        active = sorted((p for p in players if not p.get("retired")), key=ranking_system.get_elo_rating)
+        samples = []                       # (player1, player2, surface, sets_to_win, player1 won)
+        games = defaultdict(list)          # surface -> [(features, held)]
+        for m in range(matches):
+            i = rng.randrange(len(active))
+            j = min(len(active) - 1, i + rng.randint(1, 32))
+            if j == i:
+                i = max(0, j - rng.randint(1, 32))
+            player1, player2 = rng.sample((active[i], active[j]), 2)
+            surface = SURFACES[m % len(SURFACES)]
+            sets_to_win = 3 if m % 4 == 3 else 2
+            engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win,
+                                rng=random.Random(rng.getrandbits(64)))
+            engine.log_games = False
+            while not engine.is_match_over():
+                while not engine.is_set_over():
+                    server = engine.server_index
+                    winner_key = engine.simulate_point()
+                    engine.update_games(winner_key)
+                    engine.switch_server()
+                    games[surface].append((hold_features(engine.players[server].player,
+                                                         engine.players[server ^ 1].player),
+                                           winner_key == PLAYER_KEYS[server]))
+                engine.update_sets(engine.is_set_over())
+                engine.recover_set_stamina()
+            samples.append((player1, player2, surface, sets_to_win, engine.result().winner_key == "player1"))
+
+        self.hold_coefficients = {surface: _fit_logistic(rows) for surface, rows in games.items()}
+        all_games = [held for rows in games.values() for _, held in rows]
+        self.base_hold = sum(all_games) / len(all_games)
+
+        def analytic_probabilities(scale):
+            self.analytic_scale = scale
+            probabilities = []
+            for p1, p2, surface, sets_to_win, _ in samples:
+                h1 = self.hold_probability(p1, p2, surface)
+                h2 = self.hold_probability(p2, p1, surface)
+                hold = [[(h1, h1), (h2, h2)]] * (2 * sets_to_win - 1)
+                probabilities.append(solve_match(hold, sets_to_win)["win_probability"])
+            return probabilities
+
+        def elo_probabilities(scale):
+            self.elo_scale = scale
+            return [self.elo_expected(ranking_system, p1, p2) for p1, p2, *_ in samples]
+
+        def upsets(probabilities):
+            """(upset rate the tier expects, upset rate in the full-engine sample) for the tier's favourites."""
+            expected = observed = n = 0
+            for (*_, won), p in zip(samples, probabilities):
+                if p != 0.5:
+                    expected += min(p, 1 - p)
+                    observed += won != (p > 0.5)
+                    n += 1
+            return expected / max(1, n), observed / max(1, n)
+
+        report = {"matches": len(samples)}
+        self._disabled = set()
+        for tier, probabilities in ((ANALYTIC, analytic_probabilities), (ELO, elo_probabilities)):
+            expected, observed = upsets(probabilities(1.0))
+            if abs(expected - observed) > self.tolerance / 2:
+                # Expected upsets fall as the scale grows: bisect on a log scale
+                lo, hi = math.log(0.05), math.log(20)
+                for _ in range(16):
+                    mid = (lo + hi) / 2
+                    expected, observed = upsets(probabilities(math.exp(mid)))
+                    if expected > observed:
+                        lo = mid
+                    else:
+                        hi = mid
+                expected, observed = upsets(probabilities(math.exp((lo + hi) / 2)))
+            report[tier] = {"expected": expected, FULL: observed}
+            if abs(expected - observed) > self.tolerance:
+                self._disabled.add(tier)
+        report["disabled"] = sorted(self._disabled)
+        self.calibration_report = report
+        return report
@@ -1,5 +1,15 @@
 import random
 import math
+from bisect import bisect
+
+from sim.match_log import MatchLog
+from sim.shot_model import (RETURN_POWER_BY_POWER, RETURN_POWER_RANGES, SERVE, SERVE_POWER_RANGE, SHOT_CODES,
+                            ShotModel, ShotProfile)
+
+# Version of the match model. Bump it whenever a change makes the same players
+# and seed play out differently, so stored replays (sim.replay) of matches from
+# older versions are refused instead of showing a different match.
+ENGINE_VERSION = 1
 
 # Surface gameplay effects: modifiers applied during match simulation.
 # Each surface makes certain shots/mechanics naturally stronger or weaker.
@@ -19,64 +29,188 @@ SURFACE_EFFECTS = {
     "indoor":  {"volley_power": 1.05, "straight_prec": 1.05, "serve_power": 1.05},
 }
 
+PLAYER_KEYS = ("player1", "player2")
+SHOT_CHOICES = ("cross", "straight", "dropshot", "volley", "lift", "slice")
+SHOT_CHOICES_NO_VOLLEY = ("cross", "straight", "dropshot", "lift", "slice")
+# Per-player match_stats counters, in order
+STAT_KEYS = ("aces", "breaks", "forehand_winners", "backhand_winners", "dropshot_winners",
+             "volley_winners", "lift_winners", "slice_winners")
+
+
+class MatchResult:
+    """
+    Compact outcome of a headless match (see GameEngine.simulate_match).
+    Carries only what bookkeeping needs: the winner, the set scores and the
+    per-player counters. No point events, score snapshots or log lines.
+    """
+    __slots__ = ("winner", "winner_key", "set_scores", "match_stats", "games", "shots")
+
+    def __init__(self, winner, winner_key, set_scores, match_stats, games, shots):
+        self.winner = winner            # player dict of the match winner
+        self.winner_key = winner_key    # "player1" or "player2"
+        self.set_scores = set_scores    # list of (player1_games, player2_games)
+        self.match_stats = match_stats  # {player_id: counters}, same shape as GameEngine.match_stats
+        self.games = games              # games played in the match
+        self.shots = shots              # shots hit in the match (serves included)
+
+    @property
+    def winner_id(self):
+        return self.winner["id"]
+
+    def format_set_scores(self):
+        """Format the set scores as a string (e.g., "6-4, 7-5")."""
+        return ", ".join(f"{p1}-{p2}" for p1, p2 in self.set_scores)
+
+
+class Skills:
+    """
+    A player's skills resolved once into attributes, with the defaults the
+    engine has always used for skills older saves may lack.
+    `avg` is the mean over every skill in the source dict (used by the
+    opponent-speed checks of the disruptor mentality and IQ).
+    """
+    __slots__ = ("values", "serve", "forehand", "backhand", "speed", "stamina", "cross", "straight",
+                 "dropshot", "volley", "lift", "slice", "iq", "mental", "avg")
+
+    def __init__(self, values):
+        self.values = values
+        self.serve = values["serve"]
+        self.forehand = values["forehand"]
+        self.backhand = values["backhand"]
+        self.speed = values["speed"]
+        self.stamina = values["stamina"]
+        self.cross = values.get("cross", 50)
+        self.straight = values.get("straight", 50)
+        self.dropshot = values.get("dropshot", 30)
+        self.volley = values.get("volley", 30)
+        self.lift = values.get("lift", 30)
+        self.slice = values.get("slice", 30)
+        self.iq = values.get("iq", 50)
+        self.mental = values.get("mental", 50)
+        self.avg = sum(values.values()) / max(1, len(values))
+
+    def boosted(self):
+        """Skills on an important point: everything but mental scaled by the mental modifier."""
+        modifier = 1.0 + (self.mental - 50) / 500.0
+        return Skills({
+            skill: min(100, math.floor(value * modifier)) if skill != "mental" else value
+            for skill, value in self.values.items()
+        })
+
+
+class Conditioning:
+    """
+    Stamina and speed coefficients of one skill set on one surface, resolved
+    once per match so the per-shot and per-game stamina updates are plain
+    arithmetic on these fields.
+    """
+    __slots__ = ("speed", "rested_speed", "catch_divisor", "slice_drain", "surface_drain", "game_drain",
+                 "game_recovery", "set_recovery")
+
+    def __init__(self, skills, surface_fx):
+        stamina_skill = max(1, skills.stamina)
+        self.speed = skills.speed
+        self.rested_speed = int(skills.speed)
+        # reduce_stamina (per catch)
+        self.catch_divisor = stamina_skill * 10.0
+        self.slice_drain = surface_fx.get("slice_stamina", 1.5)
+        self.surface_drain = surface_fx.get("stamina_drain", 1.0)
+        # reset_stamina_and_speed (per game) and recover_set_stamina
+        self.game_drain = 3.5 * (100.0 / (stamina_skill + 50))
+        self.game_recovery = stamina_skill / 100.0
+        self.set_recovery = skills.stamina / 8.0
+
+    def speed_at(self, match_stamina):
+        """Speed with the stamina penalty (see GameEngine._get_stamina_speed_modifier)."""
+        if match_stamina >= 40:
+            return self.rested_speed
+        return int(self.speed * (1.0 - (40 - match_stamina) / 40 * 0.25))
+
+
+class PlayerState:
+    """
+    Per-match state of one player, indexed 0 (player1) or 1 (player2).
+    `skills` points at `base_skills`, or at the precomputed `boosted_skills`
+    on important points, and `conditioning` and `shot_profile` at the
+    matching Conditioning and ShotProfile.
+    """
+    __slots__ = ("index", "key", "player", "id", "hand", "mentality", "side", "base_skills",
+                 "boosted_skills", "skills", "base_conditioning", "boosted_conditioning", "conditioning",
+                 "base_shot_profile", "boosted_shot_profile", "shot_profile",
+                 "match_stamina", "speed", "position", "volley_mode", "stats")
+
+    def __init__(self, index, player, start_speed, position, surface_fx, shot_model):
+        self.index = index
+        self.key = PLAYER_KEYS[index]
+        self.player = player
+        self.id = player["id"]
+        self.hand = player["hand"]
+        self.mentality = player.get("mentality", "neutral")
+        self.side = "left" if index == 0 else "right"  # Court side balls to this player land on
+        self.base_skills = Skills(player["skills"])
+        self.boosted_skills = self.base_skills.boosted()
+        self.skills = self.base_skills
+        self.base_conditioning = Conditioning(self.base_skills, surface_fx)
+        self.boosted_conditioning = Conditioning(self.boosted_skills, surface_fx)
+        self.conditioning = self.base_conditioning
+        self.base_shot_profile = ShotProfile(self.base_skills, shot_model)
+        self.boosted_shot_profile = ShotProfile(self.boosted_skills, shot_model)
+        self.shot_profile = self.base_shot_profile
+        # match_stamina: persistent 0-100 pool that drains over the match
+        self.match_stamina = 100.0
+        self.speed = start_speed
+        self.position = position  # "right" or "left"
+        # Once a player hits a volley, they can only hit volleys until the point ends
+        self.volley_mode = False
+        self.stats = dict.fromkeys(STAT_KEYS, 0)
+
+
 class GameEngine:
     SURFACES = ["clay", "grass", "hard", "indoor"]
-    
-    def __init__(self, player1, player2, surface, sets_to_win=2):
+
+    def __init__(self, player1, player2, surface, sets_to_win=2, apply_form=True, rng=None, profile=None):
         """
         Initialize the game engine with two players.
         Each player is a dictionary containing stats like serve, forehand, backhand, speed, etc.
+        With apply_form=False the players' skills are used as given (no random daily form).
+        rng is the random.Random the match draws from (default: the global random
+        module); see sim.rng for how the scheduler derives one per match.
+        profile (a sim.instrument.EngineProfile) counts and times this match's
+        hot path; without one the engine runs uninstrumented.
         """
+        self.rng = rng if rng is not None else random
         self.surface = surface
         self.surface_fx = SURFACE_EFFECTS.get(surface, {})
+        self.surface_speed = self.surface_fx.get("speed", 1.0)
+        self.shot_model = ShotModel(self.surface_fx)
         self.original_player1 = player1
         self.original_player2 = player2
-        self.p1 = self._apply_random_form(player1.copy())
-        self.p2 = self._apply_random_form(player2.copy())
-        self.games = {"player1": 0, "player2": 0}  # Games won in the current set
-        self.sets = {"player1": 0, "player2": 0}  # Sets won in the match
+        if apply_form:
+            self.p1 = self._apply_random_form(player1.copy())
+            self.p2 = self._apply_random_form(player2.copy())
+        else:
+            self.p1 = dict(player1, skills=dict(player1["skills"]))
+            self.p2 = dict(player2, skills=dict(player2["skills"]))
+        # Per-player state, indexed 0/1 (speed starts from the skill before form)
+        self.players = (
+            PlayerState(0, self.p1, player1["skills"]["speed"], "right", self.surface_fx, self.shot_model),
+            PlayerState(1, self.p2, player2["skills"]["speed"], "left", self.surface_fx, self.shot_model),
+        )
+        self._games = [0, 0]  # Games won in the current set
+        self._sets = [0, 0]  # Sets won in the match
         self.set_scores = []  # Track the scores of each set as tuples (player1_games, player2_games)
-        self.current_server = self.p1  # Player 1 serves first by default
-        self.current_receiver = self.p2
+        self._server = 0  # Player 1 serves first by default
         self.sets_to_win = sets_to_win
-        self.match_log = []
-
-        # Track player positions: "right" or "left"
-        self.positions = {player1["id"]: "right", player2["id"]: "left"}
+        self.match_log = MatchLog(self.p1['name'], self.p2['name'])  # Rendered to text when read
+        self.log_games = True  # Headless matches skip the per-game log records
+        self.games_played = 0
+        self.shots_played = 0
 
-        # Track stamina and speed for each player
-        # match_stamina: persistent 0-100 pool that drains over the match
-        self.match_stamina = {player1["id"]: 100.0, player2["id"]: 100.0}
-        self.speed = {player1["id"]: player1["skills"]["speed"], player2["id"]: player2["skills"]["speed"]}
         self.last_shot_power = 0  # Initialize last shot power
         self.last_shot_precision = 50
-        
-        # Track volley mode for each player (once a player hits a volley, they can only hit volleys)
-        self.volley_mode = {player1["id"]: False, player2["id"]: False}
-        
-        # Track match statistics for each player
-        self.match_stats = {
-            player1["id"]: {
-                "aces": 0,
-                "breaks": 0,
-                "forehand_winners": 0,
-                "backhand_winners": 0,
-                "dropshot_winners": 0,
-                "volley_winners": 0,
-                "lift_winners": 0,
-                "slice_winners": 0
-            },
-            player2["id"]: {
-                "aces": 0,
-                "breaks": 0,
-                "forehand_winners": 0,
-                "backhand_winners": 0,
-                "dropshot_winners": 0,
-                "volley_winners": 0,
-                "lift_winners": 0,
-                "slice_winners": 0
-            }
-        }
+
+        # Match statistics per player id (the same counter dicts as PlayerState.stats)
+        self.match_stats = {state.id: state.stats for state in self.players}
         # Track the last shot type for winner classification
         self.last_shot_type = None
         # Current return multiplier (updated each rally exchange for mentality access)
@@ -84,17 +218,59 @@ class GameEngine:
         # Wildcard mentality state: random boosts regenerated each game
         self._wildcard_boosts = {}
         self._wildcard_game_key = None
+        # True while both players play with mental-boosted skills
+        self.boosted = False
+        # Compiled shot-choice tables per hitter index, see choose_shot_direction
+        self._shot_tables = ({}, {})
+        if profile is not None:
+            profile.attach(self)
+
+    @property
+    def games(self):
+        """Games won in the current set, {"player1": n, "player2": n}."""
+        return {"player1": self._games[0], "player2": self._games[1]}
+
+    @property
+    def sets(self):
+        """Sets won in the match, {"player1": n, "player2": n}."""
+        return {"player1": self._sets[0], "player2": self._sets[1]}
+
+    @property
+    def current_server(self):
+        return self.players[self._server].player
+
+    @current_server.setter
+    def current_server(self, player):
+        self._server = 0 if player is self.p1 else 1
+
+    @property
+    def current_receiver(self):
+        return self.players[self._server ^ 1].player
+
+    @current_receiver.setter
+    def current_receiver(self, player):
+        self._server = 1 if player is self.p1 else 0
+
+    @property
+    def server_index(self):
+        """Index (0 or 1) in self.players of the player serving the current game."""
+        return self._server
+
+    def switch_server(self):
+        """Hand the serve to the other player, as after every game."""
+        self._server ^= 1
 
     def _stamina_snapshot(self):
         """Return a dict with both players' match stamina as fraction 0.0-1.0."""
+        s1, s2 = self.players
         return {
-            self.p1['id']: max(0.0, self.match_stamina[self.p1['id']] / 100.0),
-            self.p2['id']: max(0.0, self.match_stamina[self.p2['id']] / 100.0),
+            s1.id: max(0.0, s1.match_stamina / 100.0),
+            s2.id: max(0.0, s2.match_stamina / 100.0),
         }
-        
+
     def _apply_random_form(self, player):
         """Apply random form multiplier to all skills"""
-        form_multiplier = random.uniform(0.975, 1.025)
+        form_multiplier = self.rng.uniform(0.975, 1.025)
         player_copy = player.copy()
         player_copy["skills"] = {
             skill: min(100, math.floor(value * form_multiplier))
@@ -106,13 +282,13 @@ class GameEngine:
         """
         Update the sets won in the match based on the winner of the set.
         """
-        self.sets[winner_key] += 1
-        
+        self._sets[0 if winner_key == "player1" else 1] += 1
+
         # Add the current set score to the set_scores list
-        self.set_scores.append((self.games["player1"], self.games["player2"]))
+        self.set_scores.append((self._games[0], self._games[1]))
 
         # Reset games for the next set
-        self.games = {"player1": 0, "player2": 0}
+        self._games = [0, 0]
 
     def format_set_scores(self):
         """
@@ -120,13 +296,16 @@ class GameEngine:
         """
         return ", ".join(f"{p1}-{p2}" for p1, p2 in self.set_scores)
 
-    def simulate_match(self, visualize=False):
+    def simulate_match(self, visualize=False, headless=False):
         """
         Simulate a full match until one player wins.
         If visualize=True, yields point events for visualization.
+        If headless=True, skips the match log and returns a compact MatchResult.
         """
         if visualize:
             return self._simulate_match_visualize()
+        elif headless:
+            return self._simulate_match_headless()
         else:
             return self._simulate_match_normal()
 
@@ -137,76 +316,92 @@ class GameEngine:
                 winner_key, point_events = self.simulate_point(visualize=True)
                 # Update games and stats BEFORE yielding so the point_events reflect the updated state
                 self.update_games(winner_key)
-                
+
                 # Update the score event in point_events with the current score and stats AFTER the point was won
                 if point_events and point_events[0]['type'] == 'score':
-                    point_events[0]['current_set'] = {'player1': self.games['player1'], 'player2': self.games['player2']}
+                    point_events[0]['current_set'] = self.games
                     point_events[0]['match_stats'] = {
-                        'player1': self.match_stats[self.p1['id']].copy(),
-                        'player2': self.match_stats[self.p2['id']].copy()
+                        'player1': self.players[0].stats.copy(),
+                        'player2': self.players[1].stats.copy()
                     }
-                
+
                 point_data = {
                     'type': 'point',
                     'events': point_events,
                     'winner': winner_key
                 }
                 yield point_data
-                self.current_server, self.current_receiver = self.current_receiver, self.current_server
+                self._server ^= 1
             set_winner_key = self.is_set_over()
             self.update_sets(set_winner_key)
             self.recover_set_stamina()
 
-        if self.sets["player1"] == self.sets_to_win:
-            match_winner = self.p1
-        elif self.sets["player2"] == self.sets_to_win:
-            match_winner = self.p2
-        else:
-            # This should never happen if match simulation is correct
-            raise ValueError(f"Match ended without a winner! Sets: P1={self.sets['player1']}, P2={self.sets['player2']}")
-
-        self.match_log.append(
-            f"{match_winner['name']} wins the match! Final Score: {self.format_set_scores()}"
-        )
+        winner_state = self._match_winner_state()
+        self.match_log.match(winner_state.index, self.set_scores)
+        match_winner = winner_state.player
         yield {'type': 'match_end', 'winner': match_winner}
 
     def _simulate_match_normal(self):
-        """Simulate match without visualization (returns winner)"""        
+        """Simulate match without visualization (returns winner)"""
         while not self.is_match_over():
             while not self.is_set_over():
                 winner_key = self.simulate_point(visualize=False)
                 self.update_games(winner_key)
-                self.current_server, self.current_receiver = self.current_receiver, self.current_server
+                self._server ^= 1
 
             set_winner_key = self.is_set_over()
             self.update_sets(set_winner_key)
             self.recover_set_stamina()
-        
-        if self.sets["player1"] == self.sets_to_win:
-            match_winner = self.p1
-        elif self.sets["player2"] == self.sets_to_win:
-            match_winner = self.p2
-        else:
-            # This should never happen if match simulation is correct
-            raise ValueError(f"Match ended without a winner! Sets: P1={self.sets['player1']}, P2={self.sets['player2']}")
 
-        self.match_log.append(
-            f"{match_winner['name']} wins the match! Final Score: {self.format_set_scores()}"
-        )
+        winner_state = self._match_winner_state()
+        self.match_log.match(winner_state.index, self.set_scores)
+        match_winner = winner_state.player
         return match_winner
-    
+
+    def _simulate_match_headless(self):
+        """Simulate match without visualization or logging (returns MatchResult)"""
+        self.log_games = False
+        while not self.is_match_over():
+            while not self.is_set_over():
+                winner_key = self.simulate_point(visualize=False)
+                self.update_games(winner_key)
+                self._server ^= 1
+
+            set_winner_key = self.is_set_over()
+            self.update_sets(set_winner_key)
+            self.recover_set_stamina()
+
+        return self.result()
+
+    def result(self):
+        """MatchResult of a finished match, however it was simulated."""
+        winner = self._match_winner_state()
+        return MatchResult(
+            winner.player,
+            winner.key,
+            self.set_scores,
+            self.match_stats,
+            self.games_played,
+            self.shots_played,
+        )
+
+    def _match_winner_state(self):
+        """PlayerState of the player who won the match."""
+        if self._sets[0] == self.sets_to_win:
+            return self.players[0]
+        elif self._sets[1] == self.sets_to_win:
+            return self.players[1]
+        # This should never happen if match simulation is correct
+        raise ValueError(f"Match ended without a winner! Sets: P1={self._sets[0]}, P2={self._sets[1]}")
+
     def _is_important_point(self):
         """
         Determine if the current point is an 'important point' where mental stat matters.
         Important points: set points, match points, and break points.
-        Returns a dict mapping player_key -> True if that player is facing pressure
-        (i.e. their opponent has a set/match/break point).
         Both players are considered under pressure during important points.
         """
-        p1_games = self.games["player1"]
-        p2_games = self.games["player2"]
-        p1_sets = self.sets["player1"]
-        p2_sets = self.sets["player2"]
+        p1_games, p2_games = self._games
+        p1_sets, p2_sets = self._sets
 
         important = False
 
@@ -215,7 +410,7 @@ class GameEngine:
         if (p1_games >= 5 and p1_games > p2_games) or (p2_games >= 5 and p2_games > p1_games):
             important = True
 
-        # Match point: one player is one game from winning the set AND 
+        # Match point: one player is one game from winning the set AND
         # that set win would give them the match
         if (p1_games >= 5 and p1_games > p2_games and p1_sets == self.sets_to_win - 1):
             important = True
@@ -228,37 +423,28 @@ class GameEngine:
 
         return important
 
-    def _get_mental_modifier(self, player):
+    def _apply_mental_boost(self):
         """
-        Calculate the mental stat modifier for important points.
-        Mental stat of 50 = neutral (no change).
-        Formula: skills * (1 + (mental - 50) / 500)
-        At mental 80: +6% boost. At mental 20: -6% penalty.
-        Range is roughly -10% to +10%.
+        Apply mental modifier to both players' skills during important points.
+        Mental stat of 50 = neutral: skills * (1 + (mental - 50) / 500), so
+        mental 80 is a +6% boost and mental 20 a -6% penalty.
+        The boosted skills are computed once per match, so this only swaps them in.
         """
-        mental = player["skills"].get("mental", 50)
-        return 1.0 + (mental - 50) / 500.0
-
-    def _apply_mental_boost(self):
-        """Apply mental modifier to both players' skills during important points."""
-        self._mental_backup = {}
-        for player in [self.p1, self.p2]:
-            modifier = self._get_mental_modifier(player)
-            self._mental_backup[player["id"]] = player["skills"].copy()
-            player["skills"] = {
-                skill: min(100, math.floor(value * modifier)) if skill != "mental" else value
-                for skill, value in player["skills"].items()
-            }
+        self.boosted = True
+        for state in self.players:
+            state.skills = state.boosted_skills
+            state.conditioning = state.boosted_conditioning
+            state.shot_profile = state.boosted_shot_profile
             # Update speed tracking with both mental boost and stamina modifier
-            self.speed[player["id"]] = int(player["skills"]["speed"] * self._get_stamina_speed_modifier(player))
+            state.speed = state.conditioning.speed_at(state.match_stamina)
 
     def _revert_mental_boost(self):
         """Revert mental modifier after the point is over."""
-        if hasattr(self, '_mental_backup'):
-            for player in [self.p1, self.p2]:
-                if player["id"] in self._mental_backup:
-                    player["skills"] = self._mental_backup[player["id"]]
-            del self._mental_backup
+        self.boosted = False
+        for state in self.players:
+            state.skills = state.base_skills
+            state.conditioning = state.base_conditioning
+            state.shot_profile = state.base_shot_profile
 
     def simulate_point(self, visualize=False):
         """
@@ -270,23 +456,23 @@ class GameEngine:
         if is_important:
             self._apply_mental_boost()
 
-        server = self.current_server
-        receiver = self.current_receiver
+        server = self.players[self._server]
+        receiver = self.players[self._server ^ 1]
         hitter = server
         defender = receiver
-        
+
         # Initialize visualization events if needed
         point_events = None
         if visualize:
             point_events = [{
                 'type': 'score',
                 'sets': self.set_scores.copy(),  # Previous set scores
-                'current_set': {'player1': self.games['player1'], 'player2': self.games['player2']},
+                'current_set': self.games,
                 'player1_name': self.p1['name'],
                 'player2_name': self.p2['name'],
                 'match_stats': {
-                    'player1': self.match_stats[self.p1['id']].copy(),
-                    'player2': self.match_stats[self.p2['id']].copy()
+                    'player1': self.players[0].stats.copy(),
+                    'player2': self.players[1].stats.copy()
                 }
             }]
 
@@ -296,11 +482,10 @@ class GameEngine:
         # Determine shot_leftright based on hitter's position and shot_direction
         shot_leftright = "left" if shot_direction == "cross" else "right"
         shot_power, shot_precision, shot_direction = self.calculate_shot(hitter, "serve", shot_direction, 1)
-        side = "left" if self._get_player_key(defender) == "player1" else "right"
         ball_side, target_x, target_y = self.get_ball_coordinates(
-            side, shot_power, shot_leftright, None  # No precision for serve
+            defender.side, shot_power, shot_leftright, None  # No precision for serve
         )
-        
+
         # Add serve visualization
         if visualize:
             point_events.append({
@@ -312,7 +497,7 @@ class GameEngine:
                     'y': target_y,
                     'power': shot_power,
                 }],
-                'hitter_id': hitter['id'],
+                'hitter_id': hitter.id,
                 'stamina': self._stamina_snapshot(),
             })
         rally_length = 1
@@ -334,27 +519,27 @@ class GameEngine:
                         'y': target_y,
                         'power': shot_power,
                     }],
-                    'hitter_id': hitter['id'],
+                    'hitter_id': hitter.id,
                     'is_final': True,
                     'stamina': self._stamina_snapshot(),
-                })            
+                })
             self.reset_stamina_and_speed()
-            winner_key = self._get_player_key(hitter)
+            self.shots_played += rally_length
             # Track ace
-            self.match_stats[hitter['id']]["aces"] += 1
+            hitter.stats["aces"] += 1
             if visualize:
                 point_events.append({
                     'type': 'point_summary',
-                    'winner_id': hitter['id'],
-                    'loser_id': defender['id'],
+                    'winner_id': hitter.id,
+                    'loser_id': defender.id,
                     'winning_shot': 'serve',
                     'is_ace': True,
                     'rally_length': rally_length,
                     'ball_y': target_y,
-                    'server_id': server['id'],
+                    'server_id': server.id,
                     'is_break': False,
                 })
-            return (winner_key, point_events) if visualize else winner_key
+            return (hitter.key, point_events) if visualize else hitter.key
 
         # Step 3: Alternate shots until someone misses
         # Continue rally until someone misses
@@ -371,36 +556,34 @@ class GameEngine:
                 # Determine actual ball direction based on cross/straight tendencies
                 c_w = 50
                 s_w = 50
-                shot_direction = random.choices(["cross", "straight"], weights=[c_w, s_w], k=1)[0]
+                shot_direction = self.rng.choices(["cross", "straight"], weights=[c_w, s_w], k=1)[0]
             else:
                 shot_type = shot_direction
-            
+
             # If hitter chooses to hit a volley, activate volley mode
             if shot_type == "volley":
-                self.volley_mode[hitter["id"]] = True
+                hitter.volley_mode = True
 
             # Determine shot_leftright for visualization/positioning
-            hitter_position = self.positions[hitter["id"]]
-            if hitter_position == "right":
+            if hitter.position == "right":
                 shot_leftright = "left" if shot_direction == "cross" else "right"
             else:
                 shot_leftright = "right" if shot_direction == "cross" else "left"
 
             shot_power, shot_precision, shot_direction = self.calculate_shot(hitter, shot_type, shot_direction, return_multiplier)
-            side = "left" if self._get_player_key(defender) == "player1" else "right"
-            
+
             # For dropshot, calculate success before getting coordinates
             shot_success = None
             if shot_type == "dropshot":
-                dropshot_skill = hitter["skills"].get("dropshot", 30)
+                dropshot_skill = hitter.skills.dropshot
                 success_chance = max(0.05, min(0.95, (dropshot_skill - self.last_shot_power + 100) / 200))
-                shot_success = random.random() < success_chance
-            
+                shot_success = self.rng.random() < success_chance
+
             # Get ball coordinates with dropshot/volley success info
             # For dropshot, always use success coordinates (ball near net)
             ball_coords_success = True if shot_type == "dropshot" else shot_success
             ball_side, ball_row, ball_col = self.get_ball_coordinates(
-                side, shot_power, shot_leftright, shot_precision, shot_type, ball_coords_success
+                defender.side, shot_power, shot_leftright, shot_precision, shot_type, ball_coords_success
             )
             self.update_positions(defender, shot_leftright)
 
@@ -415,23 +598,22 @@ class GameEngine:
                         'y': ball_col,
                         'power': shot_power,
                     }],
-                    'hitter_id': hitter['id'],
+                    'hitter_id': hitter.id,
                     'stamina': self._stamina_snapshot(),
                 })
 
             # Dropshot/volley mechanics
             if shot_type == "dropshot":
                 if shot_success:
-                    defender_speed = self.speed[defender["id"]]
-                    diff = defender_speed - dropshot_skill
+                    diff = defender.speed - dropshot_skill
                     if diff < 0:
                         self.reset_stamina_and_speed()
-                        winner_key = self._get_player_key(hitter)
-                        self.match_stats[hitter['id']]["dropshot_winners"] += 1
+                        self.shots_played += rally_length
+                        hitter.stats["dropshot_winners"] += 1
                         # Track break
-                        if self._get_player_key(hitter) != self._get_player_key(server):
-                            self.match_stats[hitter['id']]["breaks"] += 1
-                        return (winner_key, point_events) if visualize else winner_key
+                        if hitter is not server:
+                            hitter.stats["breaks"] += 1
+                        return (hitter.key, point_events) if visualize else hitter.key
                     elif diff < 2:
                         return_multiplier = 0.3
                     elif diff < 4:
@@ -449,9 +631,9 @@ class GameEngine:
             if shot_type == "dropshot":
                 # Dropshot: opponent always catches (if not already a winner which returned above)
                 caught = True
-                if self.volley_mode[defender["id"]]:
+                if defender.volley_mode:
                     return_multiplier = 3
-                self.volley_mode[defender["id"]] = True
+                defender.volley_mode = True
             else:
                 # For all other shots, use the normal can_catch logic
                 caught, catch_return_multiplier = self.can_catch(defender, shot_power, shot_precision, shot_type, hitter=hitter)
@@ -462,9 +644,8 @@ class GameEngine:
                 return_multiplier = max(return_multiplier, 1.3 + (35 - shot_power) / 50)
 
             if not caught:
-                side = "left" if self._get_player_key(defender) == "player1" else "right"
                 ball_side, target_x, target_y = self.get_ball_coordinates(
-                    side, shot_power, shot_leftright, shot_precision, shot_type, shot_success
+                    defender.side, shot_power, shot_leftright, shot_precision, shot_type, shot_success
                 )
                 if visualize:
                     point_events.append({
@@ -476,45 +657,46 @@ class GameEngine:
                             'y': target_y,
                             'power': shot_power,
                         }],
-                        'hitter_id': hitter['id'],
+                        'hitter_id': hitter.id,
                         'stamina': self._stamina_snapshot(),
                     })
                 self.reset_stamina_and_speed()
-                winner_key = self._get_player_key(hitter)
-                
+                self.shots_played += rally_length
+
                 # Track winner by shot type
+                stats = hitter.stats
                 if shot_type == "forehand":
-                    self.match_stats[hitter['id']]["forehand_winners"] += 1
+                    stats["forehand_winners"] += 1
                 elif shot_type == "backhand":
-                    self.match_stats[hitter['id']]["backhand_winners"] += 1
+                    stats["backhand_winners"] += 1
                 elif shot_type == "dropshot":
-                    self.match_stats[hitter['id']]["dropshot_winners"] += 1
+                    stats["dropshot_winners"] += 1
                 elif shot_type == "volley":
-                    self.match_stats[hitter['id']]["volley_winners"] += 1
+                    stats["volley_winners"] += 1
                 elif shot_type == "lift":
-                    self.match_stats[hitter['id']]["lift_winners"] += 1
+                    stats["lift_winners"] += 1
                 elif shot_type == "slice":
-                    self.match_stats[hitter['id']]["slice_winners"] += 1
-                
+                    stats["slice_winners"] += 1
+
                 # Track break (point won by non-server while not on serve)
-                is_break = self._get_player_key(hitter) != self._get_player_key(server)
+                is_break = hitter is not server
                 if is_break:
-                    self.match_stats[hitter['id']]["breaks"] += 1
-                
+                    stats["breaks"] += 1
+
                 if visualize:
                     point_events.append({
                         'type': 'point_summary',
-                        'winner_id': hitter['id'],
-                        'loser_id': defender['id'],
+                        'winner_id': hitter.id,
+                        'loser_id': defender.id,
                         'winning_shot': shot_type,
                         'is_ace': False,
                         'rally_length': rally_length,
                         'ball_y': target_y,
-                        'server_id': server['id'],
+                        'server_id': server.id,
                         'is_break': is_break,
                     })
-                
-                return (winner_key, point_events) if visualize else winner_key
+
+                return (hitter.key, point_events) if visualize else hitter.key
 
             self.reduce_stamina(defender, shot_precision, shot_type=shot_type)
 
@@ -526,100 +708,41 @@ class GameEngine:
         Volleys get a power boost based on volley skill (upside of volley mode).
         Lift: power boost over neutral, low precision scaling with lift skill.
         Slice: very high precision, power malus scaling with slice skill.
+        The factors and surface effects come from the player's ShotProfile
+        (see sim.shot_model).
         """
-        fx = self.surface_fx
-
-        if shot_type == "dropshot":
-            base_power = player["skills"].get(shot_type, 30) * previous_multiplier
-            # Surface: clay boosts dropshot power
-            base_power *= fx.get("dropshot_power", 1.0)
-            precision_skill = player["skills"].get(shot_type, 30)
-        elif shot_type == "lift":
-            lift_skill = player["skills"].get("lift", 30)
-            # Power boost compared to neutral shots
-            base_power = lift_skill * previous_multiplier * 1.3
-            # Surface: clay boosts lift power
-            base_power *= fx.get("lift_power", 1.0)
-            # Low precision that scales with lift skill
-            precision_skill = max(5, int(lift_skill * 0.4 + 5))
-        elif shot_type == "slice":
-            slice_skill = player["skills"].get("slice", 30)
-            # Power malus: low slice = very low power, high slice = moderate power
-            power_factor = 0.2 + (slice_skill / 100) * 0.5  # 0.2 to 0.7
-            base_power = slice_skill * previous_multiplier * power_factor
-            # Very high precision compared to neutral shots
-            precision_skill = min(95, int(slice_skill * 1.2 + 20))
-        else:
-            base_power = player["skills"][shot_type] * previous_multiplier
-            precision_skill = player["skills"][direction]
-
-            # Surface: grass boosts backhand power
-            if shot_type == "backhand":
-                base_power *= fx.get("backhand_power", 1.0)
-
-            # Volley power boost: 1.[volley_stat-10], simulating time compression for opponent
-            if shot_type == "volley":
-                volley_skill = player["skills"].get("volley", 30)
-                volley_power_boost = 1.0 + max(0, (volley_skill - 30) / 100)  # 1.0 to 1.5x
-                base_power = base_power * volley_power_boost
-                # Surface: indoor boosts volley power
-                base_power *= fx.get("volley_power", 1.0)
-
-            # Surface: hard boosts forehand power
-            if shot_type == "forehand":
-                base_power *= fx.get("forehand_power", 1.0)
-
-            # Surface: indoor boosts straight precision, hard boosts cross precision
-            if direction == "straight":
-                precision_skill = int(precision_skill * fx.get("straight_prec", 1.0))
-            if direction == "cross":
-                precision_skill = int(precision_skill * fx.get("cross_prec", 1.0))
-        
+        profile = player.shot_profile
+        code = SHOT_CODES[shot_type]
+        base_power = (profile.power_skill[code] * previous_multiplier * profile.power_factor[code]
+                      * profile.power_fx[code])
+        precision_skill = profile.shot_precision[code]
+        if precision_skill is None:
+            precision_skill = profile.precision(code, direction)
         precision = self._weighted_random_precision(precision_skill)
 
-        # Special handling for serves
-        if shot_type == "serve":
-            power_multiplier = random.uniform(0.5, 1.3)  # Serve gets a special bonus range
-            # Surface: grass boosts serve power
-            power_multiplier *= fx.get("serve_power", 1.0)
+        if code == SERVE:
+            # Serve gets a special bonus range (grass and indoor boost it further)
+            power_multiplier = self.rng.uniform(*SERVE_POWER_RANGE)
+            power_multiplier *= profile.serve_fx
         else:
+            # Return range by the incoming shot's (rounded, non-negative) power
             last_shot_power = self.last_shot_power
-            if last_shot_power <= 10:
-                power_multiplier = random.uniform(1, 1.5)
-            elif 10 < last_shot_power <= 20:
-                power_multiplier = random.uniform(0.9, 1.5)
-            elif 20 < last_shot_power <= 30:
-                power_multiplier = random.uniform(0.8, 1.4)
-            elif 30 < last_shot_power <= 40:
-                power_multiplier = random.uniform(0.7, 1.4)
-            elif 40 < last_shot_power <= 50:
-                power_multiplier = random.uniform(0.6, 1.3)
-            elif 50 < last_shot_power <= 60:
-                power_multiplier = random.uniform(0.5, 1.3)
-            elif 60 < last_shot_power <= 70:
-                power_multiplier = random.uniform(0.4, 1.2)
-            elif 70 < last_shot_power <= 80:
-                power_multiplier = random.uniform(0.3, 1.2)
-            elif 80 < last_shot_power <= 90:
-                power_multiplier = random.uniform(0.2, 1.1)
-            elif 90 < last_shot_power <= 100:
-                power_multiplier = random.uniform(0.1, 1)
-            else:
-                power_multiplier = random.uniform(0, 0.8)
+            low, high = RETURN_POWER_BY_POWER[last_shot_power] if last_shot_power <= 100 else RETURN_POWER_RANGES[-1]
+            power_multiplier = self.rng.uniform(low, high)
 
         shot_power = round(base_power * power_multiplier * self._get_stamina_power_modifier(player))
         self.last_shot_power = shot_power
         return shot_power, precision, direction
-    
+
     def _weighted_random_precision(self, skill):
         # Use triangular distribution with mode at skill value
-        precision = random.triangular(1, 100, skill)
+        precision = self.rng.triangular(1, 100, skill)
         return min(100, max(1, round(precision)))
 
     def _get_stamina_speed_modifier(self, player):
         """Speed penalty when match_stamina drops below 40%.
         At 40: no penalty. At 0: -25% speed."""
-        ms = self.match_stamina[player["id"]]
+        ms = player.match_stamina
         if ms >= 40:
             return 1.0
         return 1.0 - (40 - ms) / 40 * 0.25
@@ -627,7 +750,7 @@ class GameEngine:
     def _get_stamina_power_modifier(self, player):
         """Power penalty when match_stamina drops below 20%.
         At 20: no penalty. At 0: -30% power."""
-        ms = self.match_stamina[player["id"]]
+        ms = player.match_stamina
         if ms >= 20:
             return 1.0
         return 1.0 - (20 - ms) / 20 * 0.30
@@ -639,17 +762,16 @@ class GameEngine:
         Receiving a slice costs 1.5x stamina (1.7x on grass).
         Surface stamina_drain modifier (e.g. clay 0.8x) applies to all drain.
         """
-        fx = self.surface_fx
-        stamina_skill = max(1, player["skills"]["stamina"])
-        drain = opponent_shot_precision / (stamina_skill * 10.0)
+        c = player.conditioning
+        drain = opponent_shot_precision / c.catch_divisor
         # Slices wear down the receiver (grass amplifies this further)
         if shot_type == "slice":
-            drain *= fx.get("slice_stamina", 1.5)
+            drain *= c.slice_drain
         # Surface stamina drain modifier (e.g. clay = 0.8x → less drain)
-        drain *= fx.get("stamina_drain", 1.0)
-        self.match_stamina[player["id"]] = max(0, self.match_stamina[player["id"]] - drain)
+        drain *= c.surface_drain
+        player.match_stamina = max(0, player.match_stamina - drain)
         # Update speed with current stamina penalty
-        self.speed[player["id"]] = int(player["skills"]["speed"] * self._get_stamina_speed_modifier(player))
+        player.speed = c.speed_at(player.match_stamina)
 
     def reset_stamina_and_speed(self):
         """
@@ -658,23 +780,20 @@ class GameEngine:
         Also resets volley mode and reverts mental boost.
         """
         self._revert_mental_boost()
-        for player in [self.p1, self.p2]:
-            stamina_skill = max(1, player["skills"]["stamina"])
+        for player in self.players:
+            c = player.conditioning
             # Per-game drain: each game costs significant energy
-            drain = 3.5 * (100.0 / (stamina_skill + 50))
-            self.match_stamina[player["id"]] = max(0, self.match_stamina[player["id"]] - drain)
+            player.match_stamina = max(0, player.match_stamina - c.game_drain)
             # Small recovery between games
-            recovery = stamina_skill / 100.0
-            self.match_stamina[player["id"]] = min(100.0, self.match_stamina[player["id"]] + recovery)
+            player.match_stamina = min(100.0, player.match_stamina + c.game_recovery)
             # Update speed with current stamina penalty
-            self.speed[player["id"]] = int(player["skills"]["speed"] * self._get_stamina_speed_modifier(player))
-            self.volley_mode[player["id"]] = False
+            player.speed = c.speed_at(player.match_stamina)
+            player.volley_mode = False
 
     def recover_set_stamina(self):
         """Bigger stamina recovery between sets (changeover rest)."""
-        for player in [self.p1, self.p2]:
-            recovery = player["skills"]["stamina"] / 8.0
-            self.match_stamina[player["id"]] = min(100.0, self.match_stamina[player["id"]] + recovery)
+        for player in self.players:
+            player.match_stamina = min(100.0, player.match_stamina + player.conditioning.set_recovery)
 
     def can_catch(self, player, shot_power, shot_precision, shot_type, hitter=None):
         """
@@ -682,7 +801,7 @@ class GameEngine:
         If hitter is in volley mode, precision_factor is increased by 1.1x (downside of volley mode).
         """
         # Effective speed (surface modifier, e.g. hard ×1.2)
-        eff_speed = self.speed[player["id"]] * self.surface_fx.get("speed", 1.0)
+        eff_speed = player.speed * self.surface_speed
 
         # Special case for serve returns
         if shot_type == "serve":  # Default serve precision
@@ -694,19 +813,19 @@ class GameEngine:
             else:
                 # Good return gets full power
                 return True, 1.0
-        
+
         # Base catch chance (speed vs power)
         speed_power_ratio = max(1, shot_power) / eff_speed
         # Precision factor (0.5-1.5) - higher precision makes catching harder
         precision_factor = 0.3 + (shot_precision / 70)
         # If catcher (player) is in volley mode, precision factor is harder (downside of volley mode)
-        if self.volley_mode[player["id"]]:
+        if player.volley_mode:
             precision_factor *= 1.85
         # Combined catch score
         catch_score = speed_power_ratio * precision_factor
         # Determine if caught based on catch score
         if catch_score > 1.3:  # Missed
-            return False, 0 
+            return False, 0
         elif catch_score > 1:  # Difficult catch
             return True, 0.7  # weak return
         else:  # easy catch
@@ -714,19 +833,18 @@ class GameEngine:
 
     def _get_direction_targeting_weak_side(self, hitter, opponent):
         """Determine which direction (cross/straight) targets opponent's weaker groundstroke."""
-        opp_fh = opponent["skills"]["forehand"]
-        opp_bh = opponent["skills"]["backhand"]
+        opp_fh = opponent.skills.forehand
+        opp_bh = opponent.skills.backhand
 
         # Determine which shot_leftright forces the opponent onto their weaker wing
-        if opponent["hand"] == "Right":
+        if opponent.hand == "Right":
             # Right-hander: backhand when ball lands on "right" side
             target_side = "right" if opp_bh < opp_fh else "left"
         else:
             # Left-hander: backhand when ball lands on "left" side
             target_side = "left" if opp_bh < opp_fh else "right"
 
-        hitter_pos = self.positions[hitter["id"]]
-        if hitter_pos == "right":
+        if hitter.position == "right":
             # cross → left, straight → right
             return "straight" if target_side == "right" else "cross"
         else:
@@ -735,12 +853,12 @@ class GameEngine:
 
     def _get_mentality_adjusted_tendencies(self, player, opponent):
         """Adjust shot tendencies based on player mentality.
-        
+
         Mentality is the sole driver of playstyle tendency adjustments.
         IQ refines decision-making on top.
         Tendency indices: 0=cross, 1=straight, 2=dropshot, 3=volley, 4=lift, 5=slice
         """
-        mentality = player.get("mentality", "neutral")
+        mentality = player.mentality
 
         # Fixed neutral base tendencies for all players (mentality modifies these)
         # cross=35, straight=35, dropshot=5, volley=5, lift=10, slice=10
@@ -767,8 +885,8 @@ class GameEngine:
         elif mentality == "strategist":
             # Target opponent's weaker groundstroke side
             weak_direction = self._get_direction_targeting_weak_side(player, opponent)
-            opp_skills = opponent["skills"]
-            fh_bh_diff = abs(opp_skills["forehand"] - opp_skills["backhand"])
+            opp_skills = opponent.skills
+            fh_bh_diff = abs(opp_skills.forehand - opp_skills.backhand)
             side_boost = 1 + (fh_bh_diff / 100) * 1.8
             if weak_direction == "cross":
                 base[0] *= side_boost
@@ -777,9 +895,9 @@ class GameEngine:
 
         elif mentality == "disruptor":
             # Dropshots vs slow opponents, volleys vs fast
-            opp_skills = opponent["skills"]
-            opp_avg = sum(opp_skills.values()) / max(1, len(opp_skills))
-            speed_diff = (opp_skills["speed"] - opp_avg) / max(1, opp_avg)
+            opp_skills = opponent.skills
+            opp_avg = opp_skills.avg
+            speed_diff = (opp_skills.speed - opp_avg) / max(1, opp_avg)
             if speed_diff < 0:
                 # Slow opponent: boost dropshots
                 base[2] *= 1 + abs(speed_diff) * 3
@@ -809,33 +927,38 @@ class GameEngine:
 
         elif mentality == "specialist":
             # Boost whichever is higher between the player's cross/straight skill
-            skills = player["skills"]
-            if skills.get("cross", 50) >= skills.get("straight", 50):
+            skills = player.skills
+            if skills.cross >= skills.straight:
                 base[0] *= 1.5  # cross
             else:
                 base[1] *= 1.5  # straight
 
         elif mentality == "wildcard":
-            # Random boost regenerated each game
-            game_key = (self.games["player1"], self.games["player2"],
-                        self.sets["player1"], self.sets["player2"])
-            pid = player["id"]
-            if self._wildcard_game_key != game_key or pid not in self._wildcard_boosts:
-                self._wildcard_game_key = game_key
-                # Pick one of slice/lift and one of cross/straight to boost
-                spin_idx = random.choice([4, 5])     # lift or slice
-                dir_idx = random.choice([0, 1])      # cross or straight
-                self._wildcard_boosts[pid] = (spin_idx, dir_idx)
-            spin_idx, dir_idx = self._wildcard_boosts[pid]
+            spin_idx, dir_idx = self._get_wildcard_boost(player)
             base[spin_idx] *= 1.7
             base[dir_idx] *= 1.4
 
         # neutral or unknown → raw tendencies, no modification
         return self._apply_iq_to_tendencies(player, opponent, base)
 
+    def _get_wildcard_boost(self, player):
+        """
+        Wildcard mentality: random (spin, direction) tendency indices to boost,
+        regenerated each game. The game key is shared by both players.
+        """
+        game_key = (self._games[0], self._games[1], self._sets[0], self._sets[1])
+        idx = player.index
+        if self._wildcard_game_key != game_key or idx not in self._wildcard_boosts:
+            self._wildcard_game_key = game_key
+            # Pick one of slice/lift and one of cross/straight to boost
+            spin_idx = self.rng.choice([4, 5])     # lift or slice
+            dir_idx = self.rng.choice([0, 1])      # cross or straight
+            self._wildcard_boosts[idx] = (spin_idx, dir_idx)
+        return self._wildcard_boosts[idx]
+
     def _apply_iq_to_tendencies(self, player, opponent, tendencies):
         """Apply IQ-based adjustments to shot tendencies.
-        
+
         IQ modifies decisions to be more intelligent:
         - Favor player's stronger directional skill
         - Favor player's best special shot
@@ -843,50 +966,43 @@ class GameEngine:
         - Target opponent's weaker groundstroke side
         IQ 50 = neutral. Range: ~-0.2 to +0.2 scaling factor.
         """
-        iq = player["skills"].get("iq", 50)
-        iq_factor = (iq - 50) / 250.0  # Range: -0.2 to +0.2
+        skills = player.skills
+        iq_factor = (skills.iq - 50) / 250.0  # Range: -0.2 to +0.2
 
         if abs(iq_factor) < 0.01:
             return tendencies
 
-        skills = player["skills"]
-
         # 1. Favor player's stronger direction
-        cross_val = skills.get("cross", 50)
-        straight_val = skills.get("straight", 50)
+        cross_val = skills.cross
+        straight_val = skills.straight
         if cross_val != straight_val:
             stronger_idx = 0 if cross_val > straight_val else 1
             diff = abs(cross_val - straight_val)
             tendencies[stronger_idx] *= (1 + iq_factor * diff / 80.0)
 
         # 2. Favor player's best special shot among dropshot/volley/lift/slice
-        special_map = {
-            2: skills.get("dropshot", 30),
-            3: skills.get("volley", 30),
-            4: skills.get("lift", 30),
-            5: skills.get("slice", 30),
-        }
-        avg_special = sum(special_map.values()) / max(1, len(special_map))
-        for idx, val in special_map.items():
+        specials = ((2, skills.dropshot), (3, skills.volley), (4, skills.lift), (5, skills.slice))
+        avg_special = (skills.dropshot + skills.volley + skills.lift + skills.slice) / 4
+        for idx, val in specials:
             if val > avg_special:
                 tendencies[idx] *= (1 + iq_factor * (val - avg_special) / 80.0)
             elif val < avg_special:
                 tendencies[idx] *= max(0.5, 1 - abs(iq_factor) * (avg_special - val) / 160.0)
 
         # 3. Target opponent weaknesses
-        opp_skills = opponent["skills"]
-        opp_avg = sum(opp_skills.values()) / max(1, len(opp_skills))
+        opp_skills = opponent.skills
+        opp_avg = opp_skills.avg
 
         # Slow opponent → boost dropshot and lift
-        opp_speed = opp_skills.get("speed", 50)
+        opp_speed = opp_skills.speed
         if opp_speed < opp_avg:
             slowness = (opp_avg - opp_speed) / max(1, opp_avg)
             tendencies[2] *= (1 + iq_factor * slowness * 2)   # dropshot
             tendencies[4] *= (1 + iq_factor * slowness * 1.5)  # lift
 
         # Weak groundstroke side → target it
-        opp_fh = opp_skills.get("forehand", 50)
-        opp_bh = opp_skills.get("backhand", 50)
+        opp_fh = opp_skills.forehand
+        opp_bh = opp_skills.backhand
         if abs(opp_fh - opp_bh) > 3:
             weak_dir = self._get_direction_targeting_weak_side(player, opponent)
             weakness = abs(opp_fh - opp_bh) / 100.0
@@ -903,22 +1019,49 @@ class GameEngine:
         using player tendencies, adjusted by mentality and IQ.
         If player is in volley mode, they can only hit volleys.
         If opponent is in volley mode, this player cannot choose volleys (to prevent double volleys).
+
+        Tendencies only depend on a little match state, so they are compiled
+        once per state into cumulative weights (see _shot_table) and a choice
+        is one uniform draw, the same draw random.choices would make.
         """
         # If player is in volley mode, they can only hit volleys
-        if self.volley_mode[player["id"]]:
+        if player.volley_mode:
             return "volley"
-        
-        # Get mentality-adjusted tendencies
-        tendencies = self._get_mentality_adjusted_tendencies(player, opponent or player)
-        shot_types = ["cross", "straight", "dropshot", "volley", "lift", "slice"]
-        
+
+        opponent = opponent or player
+        mentality = player.mentality
+        if mentality == "opportunist":
+            # Tendencies are flat for rm >= 1.0 and for 0.7 < rm < 1.0
+            rm = self.current_return_multiplier
+            rm_key = 1.0 if rm >= 1.0 else (0.8 if rm > 0.7 else rm)
+        else:
+            rm_key = None
+        wildcard = self._get_wildcard_boost(player) if mentality == "wildcard" else None
+        key = (player.position, rm_key, wildcard, opponent.volley_mode, self.boosted)
+
+        table = self._shot_tables[player.index].get(key)
+        if table is None:
+            table = self._shot_table(player, opponent)
+            self._shot_tables[player.index][key] = table
+        shot_types, cum_weights, total = table
+        return shot_types[bisect(cum_weights, self.rng.random() * total, 0, len(cum_weights) - 1)]
+
+    def _shot_table(self, player, opponent):
+        """Compile the current tendencies into (shot_types, cumulative weights, total)."""
+        tendencies = self._get_mentality_adjusted_tendencies(player, opponent)
+        shot_types = SHOT_CHOICES
+
         # If opponent is in volley mode, remove volley from available options
-        if opponent and self.volley_mode[opponent["id"]]:
-            volley_idx = shot_types.index("volley")
-            shot_types.pop(volley_idx)
-            tendencies.pop(volley_idx)
-        
-        return random.choices(shot_types, weights=tendencies, k=1)[0]
+        if opponent.volley_mode:
+            shot_types = SHOT_CHOICES_NO_VOLLEY
+            tendencies.pop(SHOT_CHOICES.index("volley"))
+
+        cum_weights = []
+        total = 0
+        for weight in tendencies:
+            total += weight
+            cum_weights.append(total)
+        return shot_types, cum_weights, total + 0.0
 
     def determine_shot_type(self, player, incoming_direction):
         """
@@ -926,7 +1069,7 @@ class GameEngine:
         The incoming direction is reversed for the opponent because the court is mirrored.
         """
         reversed_direction = "Left" if incoming_direction == "right" else "Right"
-        if player["hand"] == reversed_direction:
+        if player.hand == reversed_direction:
             return "forehand"
         else:  # Left-handed player
             return "backhand"
@@ -936,38 +1079,34 @@ class GameEngine:
         Update the positions of the players based on the shot direction.
         """
         if shot_leftright == "left":
-            self.positions[player["id"]] = "right" 
-        else: 
-            self.positions[player["id"]] = "left"
+            player.position = "right"
+        else:
+            player.position = "left"
 
     def update_games(self, winner_key):
         """
         Update the games won in the current set based on the winner of the point.
         """
-        self.games[winner_key] += 1
-        p1_games = self.games["player1"]
-        p2_games = self.games["player2"]
-        
-        # Check if this game win results in a set win
+        self._games[0 if winner_key == "player1" else 1] += 1
+        self.games_played += 1
+        if not self.log_games:
+            return
+        p1_games, p2_games = self._games
+        winner = 0 if winner_key == "player1" else 1
+
+        # Check if this game win results in a set win (one combined line)
         set_winner = self.is_set_over()
         if set_winner:
-            # Combine game and set winning messages
-            self.match_log.append(
-                f"{self._player_ref(winner_key)} won the game. Score: {p1_games}-{p2_games} / "
-                f"{self._player_ref(set_winner)} won the set. Sets: {self.sets['player1']}-{self.sets['player2']}"
-            )
-        elif p1_games > 0 or p2_games > 0:
-            # Regular game win message
-            self.match_log.append(
-                f"{self._player_ref(winner_key)} won the game. Score: {p1_games}-{p2_games}"
-            )
+            self.match_log.set(winner, p1_games, p2_games, 0 if set_winner == "player1" else 1,
+                               self._sets[0], self._sets[1])
+        else:
+            self.match_log.game(winner, p1_games, p2_games)
 
     def is_set_over(self):
         """
         Check if the current set is over based on tennis rules.
         """
-        p1_games = self.games["player1"]
-        p2_games = self.games["player2"]
+        p1_games, p2_games = self._games
 
         # A player wins the set if they have at least 6 games and a 2-game lead
         if p1_games >= 6 and p1_games - p2_games >= 2:
@@ -987,30 +1126,26 @@ class GameEngine:
         """
         Check if the match is over (first to 2 sets wins).
         """
-        return self.sets["player1"] == self.sets_to_win or self.sets["player2"] == self.sets_to_win
-    
+        return self._sets[0] == self.sets_to_win or self._sets[1] == self.sets_to_win
+
     def _player_ref(self, player_key):
         """Return player name for logging purposes"""
         return self.p1['name'] if player_key == "player1" else self.p2['name']
-    
-    def _get_player_key(self, player):
-        """Return 'player1' or 'player2' based on player ID"""
-        return "player1" if player['id'] == self.p1['id'] else "player2"
-    
+
     def get_original_players(self):
         """Return the original player stats without surface/form bonuses"""
         return {
             'player1': self._remove_bonuses(self.p1),
             'player2': self._remove_bonuses(self.p2)
         }
-        
+
     def _remove_bonuses(self, player):
         """Remove any temporary bonuses from a player's stats"""
         original = player.copy()
         if 'original_skills' in player:
             original['skills'] = player['original_skills']
         return original
-            
+
     def get_ball_coordinates(self, side, shot_power, shot_direction, shot_precision=None, shot_type=None, shot_success=None):
         """
         Returns (x, y) coordinates for the ball in screen space (1200x600 court).
@@ -1035,7 +1170,7 @@ class GameEngine:
                 if shot_success:
                     # Successful: randomly either [650, 100] or [650, 500]
                     x = 650
-                    y = random.choice([125, 475])
+                    y = self.rng.choice([125, 475])
                 else:
                     # Unsuccessful: [900, 300]
                     x = 900
@@ -1062,8 +1197,8 @@ class GameEngine:
                 spread = power_factor  # 0..1
                 min_offset = spread * 120          # power 100 → at least 120px from centre
                 max_offset = 80 + spread * 120     # power 100 → up to 200px from centre
-                offset = random.uniform(min_offset, max_offset)
-                direction = random.choice([-1, 1])
+                offset = self.rng.uniform(min_offset, max_offset)
+                direction = self.rng.choice([-1, 1])
                 y = BASELINE_Y + direction * offset
                 
             else:  # Regular shots
@@ -1105,7 +1240,7 @@ class GameEngine:
                 if shot_success:
                     # Successful: randomly either [550, 100] or [550, 500]
                     x = 550
-                    y = random.choice([125, 475])
+                    y = self.rng.choice([125, 475])
                 else:
                     # Unsuccessful: [300, 300]
                     x = 300
@@ -1130,8 +1265,8 @@ class GameEngine:
                 spread = power_factor
                 min_offset = spread * 120
                 max_offset = 80 + spread * 120
-                offset = random.uniform(min_offset, max_offset)
-                direction = random.choice([-1, 1])
+                offset = self.rng.uniform(min_offset, max_offset)
+                direction = self.rng.choice([-1, 1])
                 y = BASELINE_Y + direction * offset
                 
             else:  # Regular shots
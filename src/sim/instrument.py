@@ -0,0 +1,129 @@
+import time
+from collections import Counter
+
+# Opt-in instrumentation of GameEngine's hot path.
+#
+# An EngineProfile attached to an engine (GameEngine(..., profile=p)) replaces
+# a few of that engine's methods with counting wrappers set on the instance,
+# so the engine code itself carries no checks: an engine without a profile
+# runs exactly the class methods, and instrumentation costs nothing when off.
+#
+# Counters: matches, rallies (simulate_point calls, one game each, see
+# GameEngine.simulate_point) by their length in shots, shots by type, catch
+# attempts and catches, and mental boosts (important points played with
+# boosted skills). With timers=True the wrapped calls are also timed with
+# time.perf_counter_ns; choose_shot_direction, calculate_shot and can_catch
+# run inside simulate_point, so their time is a share of the rally time
+# (which includes the wrappers' own overhead).
+#
+# Profiles add up with merge(), which is how TournamentScheduler builds its
+# per-week and per-season profiles.
+
+TIMED = ("simulate_point", "choose_shot_direction", "calculate_shot", "can_catch")
+
+
+class EngineProfile:
+    """Counters, and optionally timers, aggregated over every engine attached to it."""
+
+    def __init__(self, timers=False):
+        self.timers = timers
+        self.reset()
+
+    def reset(self):
+        self.matches = 0
+        self.rally_lengths = Counter()   # shots in the rally -> rallies
+        self.shots = Counter()           # shot type -> shots
+        self.catch_attempts = 0
+        self.catches = 0
+        self.mental_boosts = 0
+        self.calls = Counter()           # timed method -> calls
+        self.time_ns = Counter()         # timed method -> nanoseconds
+
+    def merge(self, other):
+        """Add the counts of another profile (e.g. one filled in another process) to this one."""
+        self.matches += other.matches
+        self.rally_lengths.update(other.rally_lengths)
+        self.shots.update(other.shots)
+        self.catch_attempts += other.catch_attempts
+        self.catches += other.catches
+        self.mental_boosts += other.mental_boosts
+        self.calls.update(other.calls)
+        self.time_ns.update(other.time_ns)
+        return self
+
+    def attach(self, engine):
+        """Instrument one engine; called by GameEngine.__init__ when given a profile."""
+        self.matches += 1
+        clock = time.perf_counter_ns if self.timers else None
+
+        def wrap(name, count=None):
+            method = getattr(engine, name)
+            calls = self.calls
+            time_ns = self.time_ns
+            if clock is None:
+                if count is None:
+                    return
+                def wrapper(*args, **kwargs):
+                    result = method(*args, **kwargs)
+                    count(args, kwargs, result)
+                    return result
+            else:
+                def wrapper(*args, **kwargs):
+                    start = clock()
+                    result = method(*args, **kwargs)
+                    time_ns[name] += clock() - start
+                    calls[name] += 1
+                    if count is not None:
+                        count(args, kwargs, result)
+                    return result
+            setattr(engine, name, wrapper)
+
+        shots_before = [0]
+        simulate_point = engine.simulate_point
+
+        def point(*args, **kwargs):
+            shots_before[0] = engine.shots_played
+            return simulate_point(*args, **kwargs)
+        engine.simulate_point = point
+
+        def count_rally(args, kwargs, result):
+            self.rally_lengths[engine.shots_played - shots_before[0]] += 1
+
+        def count_shot(args, kwargs, result):
+            self.shots[args[1] if len(args) > 1 else kwargs["shot_type"]] += 1
+
+        def count_catch(args, kwargs, result):
+            self.catch_attempts += 1
+            self.catches += bool(result[0])
+
+        def count_boost(args, kwargs, result):
+            self.mental_boosts += 1
+
+        wrap("simulate_point", count_rally)
+        wrap("choose_shot_direction")
+        wrap("calculate_shot", count_shot)
+        wrap("can_catch", count_catch)
+        wrap("_apply_mental_boost", count_boost)
+
+    def report(self):
+        """Plain-dict summary: counts, and per timed method its calls, milliseconds and share of rally time."""
+        rallies = sum(self.rally_lengths.values())
+        shots = sum(self.shots.values())
+        report = {
+            "matches": self.matches,
+            "rallies": rallies,
+            "shots": shots,
+            "mean_rally_length": sum(n * k for n, k in self.rally_lengths.items()) / rallies if rallies else 0.0,
+            "rally_lengths": dict(sorted(self.rally_lengths.items())),
+            "shots_by_type": dict(self.shots.most_common()),
+            "catch_rate": self.catches / self.catch_attempts if self.catch_attempts else 0.0,
+            "mental_boosts": self.mental_boosts,
+            "mental_boost_rate": self.mental_boosts / rallies if rallies else 0.0,
+        }
+        if self.timers:
+            total = self.time_ns["simulate_point"]
+            report["timers"] = {name: {"calls": self.calls[name],
+                                       "ms": self.time_ns[name] / 1e6,
+                                       "share": self.time_ns[name] / total if total else 0.0}
+                                for name in TIMED}
+        return report
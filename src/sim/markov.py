@@ -0,0 +1,201 @@
+import math
+import random
+from collections import defaultdict
+
+from sim.game_engine import GameEngine
+from sim.rng import derive_seed, new_master_seed
+
+# Analytic match-probability solver.
+#
+# In GameEngine every simulate_point call decides a whole game, so a match is a
+# Markov chain over the scoreboard: games, sets and who serves (the serve swaps
+# after every game, across set boundaries too). The only extra state the game
+# model has is the mental boost of _is_important_point, which depends on the
+# games of the current set alone, and match stamina, which drains over the match
+# and mostly tracks how many sets have been played. Given each player's hold
+# probability per set number with and without the boost, exact set and match
+# probabilities follow by dynamic programming over (games, server) inside a set
+# and (sets, server) across sets.
+#
+# Daily form (GameEngine._apply_random_form) moves hold probabilities from one
+# match to the next, and a single averaged hold would overstate favourites, so
+# predictions solve the chain for a small grid of form levels and average.
+
+NORMAL, PRESSURE = 0, 1
+# Midpoints of the thirds of GameEngine's uniform(0.975, 1.025) form range
+FORM_LEVELS = (0.975 + 0.05 / 6, 1.0, 1.025 - 0.05 / 6)
+
+
+def is_important(p1_games, p2_games):
+    """Same rule as GameEngine._is_important_point (match points are set points too)."""
+    return ((p1_games >= 5 and p1_games > p2_games)
+            or (p2_games >= 5 and p2_games > p1_games)
+            or (p1_games == 6 and p2_games == 6))
+
+
+def set_winner(p1_games, p2_games):
+    """Same rule as GameEngine.is_set_over: 0/1 for the set winner, None if still running."""
+    if (p1_games >= 6 and p1_games - p2_games >= 2) or (p1_games == 7 and p2_games == 6):
+        return 0
+    if (p2_games >= 6 and p2_games - p1_games >= 2) or (p2_games == 7 and p1_games == 6):
+        return 1
+    return None
+
+
+def with_form(player, form):
+    """Copy of player with GameEngine's form multiplier applied to every skill."""
+    return dict(player, skills={k: min(100, math.floor(v * form)) for k, v in player["skills"].items()})
+
+
+def estimate_hold_probabilities(player1, player2, surface, sets_to_win=2, matches=200,
+                                prior_games=10, seed=None, apply_form=True, rng=None):
+    """
+    Estimate each player's probability of winning a game on serve by playing
+    `matches` full GameEngine matches and counting held games, split by set
+    number and by normal and pressure (important point) games. Sparse cells are
+    shrunk with `prior_games` pseudo-games: pressure towards normal games of the
+    same set, later sets towards the set before.
+
+    Returns hold[set_index][server][state] with server 0 = player1,
+    1 = player2 and state NORMAL or PRESSURE.
+
+    The matches draw from `rng` (a random.Random), or else from a stream
+    seeded with `seed` (fresh entropy without one); the global random
+    module is left alone.
+    """
+    if rng is None:
+        rng = random.Random(seed if seed is not None else new_master_seed())
+    max_sets = 2 * sets_to_win - 1
+    # [set_index][server][state] -> [held, played]
+    counts = [[[[0, 0], [0, 0]], [[0, 0], [0, 0]]] for _ in range(max_sets)]
+    for _ in range(matches):
+        engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, apply_form=apply_form, rng=rng)
+        engine.log_games = False
+        while not engine.is_match_over():
+            set_counts = counts[len(engine.set_scores)]
+            while not engine.is_set_over():
+                state = PRESSURE if engine._is_important_point() else NORMAL
+                server_key = "player1" if engine.current_server is engine.p1 else "player2"
+                winner_key = engine.simulate_point()
+                engine.update_games(winner_key)
+                engine.switch_server()
+                tally = set_counts[0 if server_key == "player1" else 1][state]
+                tally[0] += winner_key == server_key
+                tally[1] += 1
+            engine.update_sets(engine.is_set_over())
+            engine.recover_set_stamina()
+
+    hold = []
+    for set_index, set_counts in enumerate(counts):
+        set_hold = []
+        for server in range(2):
+            held, played = set_counts[server][NORMAL]
+            if set_index == 0:
+                normal = (held + 1) / (played + 2)
+            else:
+                prior = hold[set_index - 1][server][NORMAL]
+                normal = (held + prior_games * prior) / (played + prior_games)
+            held_p, played_p = set_counts[server][PRESSURE]
+            pressure = (held_p + prior_games * normal) / (played_p + prior_games)
+            set_hold.append((normal, pressure))
+        hold.append(set_hold)
+    return hold
+
+
+def solve_set(hold, first_server=0):
+    """
+    Exact distribution of final set scores {(p1_games, p2_games): probability}
+    when `first_server` (0 = player1) serves the first game of the set, from
+    one set's hold[server][state].
+    """
+    result = defaultdict(float)
+    frontier = {(0, 0): 1.0}
+    games = 0
+    while frontier:
+        server = first_server if games % 2 == 0 else 1 - first_server
+        nxt = defaultdict(float)
+        for (g1, g2), p in frontier.items():
+            h = hold[server][PRESSURE if is_important(g1, g2) else NORMAL]
+            p1_wins = h if server == 0 else 1 - h
+            for score, q in (((g1 + 1, g2), p1_wins), ((g1, g2 + 1), 1 - p1_wins)):
+                if set_winner(*score) is None:
+                    nxt[score] += p * q
+                else:
+                    result[score] += p * q
+        frontier = nxt
+        games += 1
+    return dict(result)
+
+
+def solve_match(hold, sets_to_win=2, first_server=0):
+    """
+    Exact match probabilities from per-game hold probabilities
+    hold[set_index][server][state] (see estimate_hold_probabilities).
+
+    Returns a dict with player1's win probability, the distribution of set
+    scores from player1's side (e.g. "2-1"), the distribution of first-set
+    scores and the expected number of games.
+    """
+    set_dists = [(solve_set(set_hold, 0), solve_set(set_hold, 1)) for set_hold in hold]
+    set_games = [[sum((g1 + g2) * p for (g1, g2), p in dist.items()) for dist in dists] for dists in set_dists]
+
+    frontier = {(0, 0, first_server): 1.0}
+    outcomes = defaultdict(float)
+    expected_games = 0.0
+    while frontier:
+        nxt = defaultdict(float)
+        for (s1, s2, server), p in frontier.items():
+            set_index = s1 + s2
+            expected_games += p * set_games[set_index][server]
+            for (g1, g2), q in set_dists[set_index][server].items():
+                n1 = s1 + (g1 > g2)
+                n2 = s2 + (g2 > g1)
+                next_server = server if (g1 + g2) % 2 == 0 else 1 - server
+                if n1 == sets_to_win or n2 == sets_to_win:
+                    outcomes[f"{n1}-{n2}"] += p * q
+                else:
+                    nxt[(n1, n2, next_server)] += p * q
+        frontier = nxt
+
+    win_probability = sum(p for score, p in outcomes.items() if int(score.split("-")[0]) == sets_to_win)
+    return {
+        "win_probability": win_probability,
+        "set_scores": dict(sorted(outcomes.items())),
+        "first_set_scores": {f"{g1}-{g2}": p for (g1, g2), p in sorted(set_dists[0][first_server].items())},
+        "expected_games": expected_games,
+    }
+
+
+def predict_matchup_analytic(player1, player2, surface, sets_to_win=2, matches=900, seed=None):
+    """
+    Predict a matchup analytically: estimate hold probabilities by sampling
+    `matches` matches spread over a grid of daily-form levels for both
+    players, solve the match exactly for each grid point and average. Each
+    grid point samples from its own stream under `seed` (see sim.rng).
+    """
+    if seed is None:
+        seed = new_master_seed()
+    grid = [(f1, f2) for f1 in range(len(FORM_LEVELS)) for f2 in range(len(FORM_LEVELS))]
+    per_point = max(1, matches // len(grid))
+    solved = []
+    for f1, f2 in grid:
+        hold = estimate_hold_probabilities(with_form(player1, FORM_LEVELS[f1]), with_form(player2, FORM_LEVELS[f2]),
+                                           surface, sets_to_win, per_point, apply_form=False,
+                                           rng=random.Random(derive_seed(seed, "markov", f1, f2)))
+        solved.append((hold, solve_match(hold, sets_to_win)))
+
+    weight = 1.0 / len(solved)
+    set_scores = defaultdict(float)
+    first_set_scores = defaultdict(float)
+    for _, result in solved:
+        for score, p in result["set_scores"].items():
+            set_scores[score] += p * weight
+        for score, p in result["first_set_scores"].items():
+            first_set_scores[score] += p * weight
+    return {
+        "win_probability": sum(r["win_probability"] for _, r in solved) * weight,
+        "set_scores": dict(sorted(set_scores.items())),
+        "first_set_scores": dict(sorted(first_set_scores.items())),
+        "expected_games": sum(r["expected_games"] for _, r in solved) * weight,
+        "hold": [h for h, _ in solved],
+    }
@@ -0,0 +1,55 @@
+from collections.abc import Sequence
+
+# The text log of a match, kept as compact records.
+#
+# GameEngine logs a line per game and one at the end of the match. Formatting
+# those as it goes costs an f-string per game for every match played, while
+# only the few matches somebody watches are ever read. MatchLog stores a
+# tuple of ints per line (who won, the game score, the set score) and renders
+# the text when a line is read, so the log is still a sequence of strings to
+# the UI. Headless matches (GameEngine.log_games False) record nothing.
+
+GAME, SET, MATCH = range(3)
+
+
+class MatchLog(Sequence):
+    """
+    Lines of a match log, rendered on access from records:
+    (GAME, winner, games1, games2), (SET, winner, games1, games2, set winner,
+    sets1, sets2) and (MATCH, winner, set scores). Winners are player indexes.
+    """
+    __slots__ = ("names", "records")
+
+    def __init__(self, name1, name2):
+        self.names = (name1, name2)
+        self.records = []
+
+    def game(self, winner, games1, games2):
+        self.records.append((GAME, winner, games1, games2))
+
+    def set(self, winner, games1, games2, set_winner, sets1, sets2):
+        self.records.append((SET, winner, games1, games2, set_winner, sets1, sets2))
+
+    def match(self, winner, set_scores):
+        self.records.append((MATCH, winner, tuple(set_scores)))
+
+    def render(self, record):
+        kind, winner = record[0], self.names[record[1]]
+        if kind == GAME:
+            return f"{winner} won the game. Score: {record[2]}-{record[3]}"
+        if kind == SET:
+            return (f"{winner} won the game. Score: {record[2]}-{record[3]} / "
+                    f"{self.names[record[4]]} won the set. Sets: {record[5]}-{record[6]}")
+        scores = ", ".join(f"{p1}-{p2}" for p1, p2 in record[2])
+        return f"{winner} wins the match! Final Score: {scores}"
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.render(record) for record in self.records[index]]
+        return self.render(self.records[index])
+
+    def __repr__(self):
+        return f"MatchLog({list(self)!r})"
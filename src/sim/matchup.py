@@ -0,0 +1,126 @@
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from sim.game_engine import STAT_KEYS, GameEngine
+from sim.rng import derive_seed
+
+# Head-to-head predictions: "what is P(A beats B on clay, best of 5)?"
+# Matches are simulated headless in chunks spread over a process pool; chunk
+# results are merged in submission order so a given seed always gives the same
+# answer, and sampling stops early once the confidence interval is tight enough.
+
+
+def _simulate_chunk(player1, player2, surface, sets_to_win, count, seed, chunk):
+    """Simulate `count` matches of chunk number `chunk` in a worker and return summed counters."""
+    rng = random.Random(derive_seed(seed, "matchup", chunk))
+    wins = 0
+    set_scores = Counter()
+    games = 0
+    shots = 0
+    stats = [[0] * len(STAT_KEYS), [0] * len(STAT_KEYS)]
+    for _ in range(count):
+        engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, rng=rng)
+        result = engine.simulate_match(headless=True)
+        if result.winner_key == "player1":
+            wins += 1
+        sets_won = sum(1 for a, b in result.set_scores if a > b)
+        set_scores[f"{sets_won}-{len(result.set_scores) - sets_won}"] += 1
+        games += result.games
+        shots += result.shots
+        for idx, pid in enumerate((player1["id"], player2["id"])):
+            counters = result.match_stats[pid]
+            for k, key in enumerate(STAT_KEYS):
+                stats[idx][k] += counters[key]
+    return {"matches": count, "wins": wins, "set_scores": set_scores,
+            "games": games, "shots": shots, "stats": stats}
+
+
+def wilson_interval(wins, n, z=1.96):
+    """Wilson score interval for a win probability."""
+    if n == 0:
+        return 0.0, 1.0
+    p = wins / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def predict_matchup(player1, player2, surface, sets_to_win=2, n=2000, tolerance=0.02,
+                    min_matches=200, chunk_size=100, workers=None, seed=None):
+    """
+    Estimate P(player1 beats player2) by Monte Carlo simulation.
+
+    Simulates up to `n` matches in chunks of `chunk_size` across `workers`
+    processes (default: all cores, 1 runs in-process) and stops early once the
+    95% interval half-width is at most `tolerance` after `min_matches` matches.
+
+    Returns a dict with the win probability, its confidence interval, the
+    distribution of set scores (from player1's side, e.g. "2-1") and average
+    per-match stats. Each chunk draws from its own stream under `seed` (see
+    sim.rng), leaving the global random module alone.
+    """
+    if n <= 0:
+        raise ValueError(f"n must be positive, got {n}")
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    workers = workers or os.cpu_count() or 1
+    chunk_sizes = [min(chunk_size, n - start) for start in range(0, n, chunk_size)]
+    args = [(player1, player2, surface, sets_to_win, size, seed, i) for i, size in enumerate(chunk_sizes)]
+
+    totals = {"matches": 0, "wins": 0, "set_scores": Counter(), "games": 0, "shots": 0,
+              "stats": [[0] * len(STAT_KEYS), [0] * len(STAT_KEYS)]}
+
+    def merge(chunk):
+        totals["matches"] += chunk["matches"]
+        totals["wins"] += chunk["wins"]
+        totals["set_scores"].update(chunk["set_scores"])
+        totals["games"] += chunk["games"]
+        totals["shots"] += chunk["shots"]
+        for idx in range(2):
+            for k in range(len(STAT_KEYS)):
+                totals["stats"][idx][k] += chunk["stats"][idx][k]
+        lo, hi = wilson_interval(totals["wins"], totals["matches"])
+        return totals["matches"] >= min_matches and (hi - lo) / 2 <= tolerance
+
+    if workers == 1:
+        for a in args:
+            if merge(_simulate_chunk(*a)):
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded window of chunks in flight and merge in submission order
+            window = workers * 2
+            futures = [pool.submit(_simulate_chunk, *a) for a in args[:window]]
+            next_arg = len(futures)
+            for future in futures:
+                if merge(future.result()):
+                    break
+                if next_arg < len(args):
+                    futures.append(pool.submit(_simulate_chunk, *args[next_arg]))
+                    next_arg += 1
+            for future in futures:
+                future.cancel()
+
+    matches = totals["matches"]
+    lo, hi = wilson_interval(totals["wins"], matches)
+    return {
+        "player1_id": player1["id"],
+        "player2_id": player2["id"],
+        "surface": surface,
+        "sets_to_win": sets_to_win,
+        "matches": matches,
+        "win_probability": totals["wins"] / matches,
+        "confidence_interval": (lo, hi),
+        "set_scores": {score: count / matches for score, count in sorted(totals["set_scores"].items())},
+        "average": {
+            "games": totals["games"] / matches,
+            "shots": totals["shots"] / matches,
+            "shots_per_game": totals["shots"] / max(1, totals["games"]),
+            "player1": {key: totals["stats"][0][k] / matches for k, key in enumerate(STAT_KEYS)},
+            "player2": {key: totals["stats"][1][k] / matches for k, key in enumerate(STAT_KEYS)},
+        },
+    }
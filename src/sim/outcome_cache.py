@@ -0,0 +1,176 @@
+import random
+import sys
+from collections import OrderedDict
+
+from sim.game_engine import PLAYER_KEYS, STAT_KEYS, GameEngine, MatchResult
+from sim.rng import derive_seed
+
+# Opt-in cache of match outcome distributions for repeated matchups.
+#
+# A match depends on the players only through what GameEngine reads: hand,
+# mentality and skills (shot tendencies are derived from mentality, IQ and the
+# skills, so they are covered too). The cache key is those, with every skill
+# divided by `quantum`, plus surface and sets_to_win. The first meeting of a
+# key is simulated live as usual (sample returns None). On the first repeat
+# the cache plays a pool of `pool_size` matches with the skills at the centre
+# of each bucket, and that meeting and every later one draw one pooled
+# outcome with the match's own random stream. Building a pool costs
+# `pool_size` matches, so it pays off for matchups that meet more often than
+# that; keys seen once are remembered by hash only, up to `seen_limit`.
+#
+# The pool is seeded from the key, so results do not depend on which meeting
+# came first. The price is bias: matches inside a bucket share one
+# distribution, and a pool of n outcomes only estimates it (see
+# utils/report_outcome_cache.py). Pools are evicted least recently used once
+# the estimated memory passes `memory_budget`, and dropped when development
+# moves one of their players to another skill bucket (invalidate_player,
+# called from PlayerDevelopment), since that pairing can no longer hit them.
+
+_TUPLE_BYTES = sys.getsizeof(())
+_POINTER_BYTES = 8
+
+
+class OutcomeCache:
+    """LRU cache of pooled match outcomes, see the module comment."""
+
+    def __init__(self, pool_size=16, quantum=2, memory_budget=8 * 2 ** 20, seed=0, seen_limit=65536):
+        self.pool_size = pool_size
+        self.quantum = quantum
+        self.memory_budget = memory_budget
+        self.seed = seed
+        self.seen_limit = seen_limit
+        self._pools = OrderedDict()   # key -> (outcomes, estimated bytes, ids of the players it was built for)
+        self._seen = OrderedDict()    # hash(key) of keys met once, oldest first
+        self._keys_by_player = {}     # player id -> keys of pools built for that player
+        self.memory = 0
+        self.first_meetings = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def side(self, player):
+        """One player's part of a cache key: hand, mentality and quantized skills."""
+        q = self.quantum
+        return (player.get("hand"), player.get("mentality", "neutral"),
+                tuple((name, value // q) for name, value in sorted(player["skills"].items())))
+
+    def key(self, player1, player2, surface, sets_to_win):
+        """Cache key of a matchup: both players' sides, surface and format."""
+        return (surface, sets_to_win, self.side(player1), self.side(player2))
+
+    def _pool_player(self, side, index):
+        """Stand-in player at the centre of each skill bucket of one side of a key."""
+        hand, mentality, skills = side
+        q = self.quantum
+        return {
+            "id": index + 1,
+            "name": PLAYER_KEYS[index],
+            "hand": hand,
+            "mentality": mentality,
+            "skills": {name: min(100, bucket * q + q // 2) for name, bucket in skills},
+        }
+
+    def _build_pool(self, key):
+        surface, sets_to_win, side1, side2 = key
+        player1 = self._pool_player(side1, 0)
+        player2 = self._pool_player(side2, 1)
+        rng = random.Random(derive_seed(self.seed, "outcome_pool", key))
+        outcomes = []
+        for _ in range(self.pool_size):
+            engine = GameEngine(player1, player2, surface, sets_to_win=sets_to_win, rng=rng)
+            result = engine.simulate_match(headless=True)
+            stats = tuple(result.match_stats[p["id"]][k] for p in (player1, player2) for k in STAT_KEYS)
+            outcomes.append((PLAYER_KEYS.index(result.winner_key), tuple(result.set_scores), stats,
+                             result.games, result.shots))
+        # The key is held by the pool and by both players' key sets
+        size = sys.getsizeof(key) + 2 * _POINTER_BYTES
+        for side in (side1, side2):
+            size += sys.getsizeof(side) + sys.getsizeof(side[2]) + sum(sys.getsizeof(s) for s in side[2])
+        size += _TUPLE_BYTES + _POINTER_BYTES * len(outcomes)
+        for outcome in outcomes:
+            size += sys.getsizeof(outcome) + sys.getsizeof(outcome[1]) + sys.getsizeof(outcome[2])
+            size += sum(sys.getsizeof(s) for s in outcome[1])
+        return tuple(outcomes), size
+
+    def sample(self, player1, player2, surface, sets_to_win, rng=random):
+        """
+        MatchResult for player1 vs player2 drawn from the matchup's pool,
+        built on the first repeat meeting. None for a first meeting, which
+        the caller simulates live.
+        """
+        key = self.key(player1, player2, surface, sets_to_win)
+        entry = self._pools.get(key)
+        if entry is None:
+            seen = hash(key)
+            if seen not in self._seen:
+                self.first_meetings += 1
+                self._seen[seen] = None
+                if len(self._seen) > self.seen_limit:
+                    self._seen.popitem(last=False)
+                return None
+            del self._seen[seen]
+            self.misses += 1
+            entry = self._build_pool(key) + ((player1["id"], player2["id"]),)
+            self._pools[key] = entry
+            self.memory += entry[1]
+            for player in (player1, player2):
+                self._keys_by_player.setdefault(player["id"], set()).add(key)
+            self._evict()
+        else:
+            self.hits += 1
+            self._pools.move_to_end(key)
+
+        winner, set_scores, stats, games, shots = entry[0][rng.randrange(len(entry[0]))]
+        n = len(STAT_KEYS)
+        return MatchResult(
+            (player1, player2)[winner],
+            PLAYER_KEYS[winner],
+            list(set_scores),
+            {player1["id"]: dict(zip(STAT_KEYS, stats[:n])), player2["id"]: dict(zip(STAT_KEYS, stats[n:]))},
+            games,
+            shots,
+        )
+
+    def _drop(self, key, entry):
+        """Forget a pool removed from _pools: its memory and both players' references to its key."""
+        self.memory -= entry[1]
+        for player_id in entry[2]:
+            keys = self._keys_by_player.get(player_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_player[player_id]
+
+    def _evict(self):
+        while self.memory > self.memory_budget and len(self._pools) > 1:
+            self._drop(*self._pools.popitem(last=False))
+            self.evictions += 1
+
+    def invalidate_player(self, player):
+        """
+        Drop the pools built for this player's matchups that no longer match
+        their skills. A skill change inside the same bucket keeps them.
+        """
+        keys = self._keys_by_player.get(player["id"])
+        if not keys:
+            return
+        side = self.side(player)
+        for key in [k for k in keys if side not in k[2:]]:
+            self._drop(key, self._pools.pop(key))
+            self.invalidations += 1
+
+    def report(self):
+        """Counters of the cache's use so far."""
+        lookups = self.first_meetings + self.hits + self.misses
+        return {
+            "lookups": lookups,
+            "first_meetings": self.first_meetings,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "pools": len(self._pools),
+            "memory_bytes": self.memory,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,71 @@
+import hashlib
+import json
+import random
+
+from sim.game_engine import ENGINE_VERSION, GameEngine
+
+# Seed-based match replays.
+#
+# A match is fully determined by the engine code, the surface and format, the
+# RNG seed it was played with and the parts of both player dicts the engine
+# reads (SNAPSHOT_FIELDS). So instead of keeping point events, a finished match
+# is stored as a small replay record:
+#
+#   {"seed": ..., "engine_version": ..., "surface": ..., "sets_to_win": ...,
+#    "players": [snapshot hash of player1, snapshot hash of player2]}
+#
+# The snapshots themselves are kept once per player by the caller (the
+# scheduler keeps them per tournament), keyed by their hash, so storage grows
+# with matches and players rather than with shots. replay_match plays the match
+# again and yields exactly the events the original run produced.
+
+SNAPSHOT_FIELDS = ("id", "name", "hand", "mentality", "skills")
+
+
+def player_snapshot(player):
+    """Copy of the fields of a player dict that GameEngine reads."""
+    snapshot = {k: player[k] for k in SNAPSHOT_FIELDS if k in player}
+    snapshot["skills"] = dict(player["skills"])
+    return snapshot
+
+
+def snapshot_hash(snapshot):
+    """Short stable hash of a player snapshot."""
+    blob = json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha1(blob).hexdigest()[:16]
+
+
+def make_replay(seed, surface, sets_to_win, snapshot_hashes):
+    """Replay record of a match played with GameEngine(..., rng=random.Random(seed))."""
+    return {
+        "seed": seed,
+        "engine_version": ENGINE_VERSION,
+        "surface": surface,
+        "sets_to_win": sets_to_win,
+        "players": list(snapshot_hashes),
+    }
+
+
+def replay_match(record, snapshots):
+    """
+    Play a recorded match again from its replay record and a mapping of
+    snapshot hash -> player snapshot.
+
+    Returns (engine, events): events is the simulate_match(visualize=True)
+    generator, and engine.match_log (a sim.match_log.MatchLog) fills up as
+    it is consumed. Raises ValueError if the record is from another engine
+    version or a snapshot does not match its hash, since the events would
+    then differ from the match that was actually played.
+    """
+    if record["engine_version"] != ENGINE_VERSION:
+        raise ValueError(f"Replay recorded with engine version {record['engine_version']}, "
+                         f"this is version {ENGINE_VERSION}")
+    players = []
+    for h in record["players"]:
+        snapshot = snapshots.get(h)
+        if snapshot is None or snapshot_hash(snapshot) != h:
+            raise ValueError(f"Player snapshot {h} is missing or altered")
+        players.append(snapshot)
+    engine = GameEngine(players[0], players[1], record["surface"], sets_to_win=record["sets_to_win"],
+                        rng=random.Random(record["seed"]))
+    return engine, engine.simulate_match(visualize=True)
@@ -0,0 +1,35 @@
+import hashlib
+import random
+
+# Random-stream splitting for reproducible simulation.
+#
+# A game has one master seed (TournamentScheduler.rng_seed, stored in the
+# save). Every component that draws random numbers gets its own random.Random
+# seeded from the master seed and a path naming what it simulates:
+#
+#   ("migration",)                                  save/default-data fixes on load
+#   ("season", year)                                year end: retirements, newgens
+#   ("week", year, week)                            entries, development, news
+#   ("tournament", year, week, tid)                 the draw of one tournament
+#   ("match", year, week, tid, round, match_idx)    one GameEngine match
+#
+# Streams never share state, so a match's result depends only on its players
+# and its path, not on which matches ran before it or in which process.
+# Season, week and tournament streams are consumed in program order on the
+# main process.
+
+
+def derive_seed(master_seed, *path):
+    """Stable 64-bit seed for `path` under `master_seed` (same in every process and Python run)."""
+    key = repr((master_seed,) + path).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+
+def make_rng(master_seed, *path):
+    """random.Random for `path` under `master_seed`, see derive_seed."""
+    return random.Random(derive_seed(master_seed, *path))
+
+
+def new_master_seed():
+    """Fresh master seed from OS entropy, for new games."""
+    return random.SystemRandom().randrange(2 ** 63)
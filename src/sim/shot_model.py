@@ -0,0 +1,100 @@
+# Shot power and precision model of GameEngine.calculate_shot, as tables.
+#
+# A shot's power is
+#     round(skill * previous_multiplier * factor * surface_fx * multiplier * stamina_modifier)
+# where skill and factor depend on the shot type (lift hits 1.3x, slice and
+# volley scale with their own skill), surface_fx comes from SURFACE_EFFECTS,
+# and multiplier is drawn uniformly from a range picked by the power of the
+# incoming shot (RETURN_POWER_RANGES), or from SERVE_POWER_RANGE for serves.
+# Precision is the triangular mode fed to _weighted_random_precision:
+# a transform of the shot's own skill for dropshots, volleys, lifts and
+# slices, the direction skill (cross / straight, with the surface's precision
+# effect) for everything else.
+#
+# ShotModel holds a surface's factors by shot code; ShotProfile resolves one
+# skill set against it once per match, so calculate_shot is a few tuple
+# lookups. The batch engine builds its NumPy arrays from the same tables.
+#
+# The products are evaluated in the same order as the original if/elif code
+# (multiplying by 1.0 where a shot has no factor is exact), so matches are
+# unchanged bit for bit.
+
+SHOT_TYPES = ("serve", "forehand", "backhand", "dropshot", "volley", "lift", "slice")
+SHOT_CODES = {name: code for code, name in enumerate(SHOT_TYPES)}
+SERVE, FOREHAND, BACKHAND, DROPSHOT, VOLLEY, LIFT, SLICE = range(len(SHOT_TYPES))
+
+# SURFACE_EFFECTS key of each shot code's base power effect (the serve's
+# surface effect applies to its multiplier instead, see SERVE_FX_KEY)
+POWER_FX_KEYS = (None, "forehand_power", "backhand_power", "dropshot_power", "volley_power", "lift_power", None)
+SERVE_FX_KEY = "serve_power"
+PRECISION_FX_KEYS = {"cross": "cross_prec", "straight": "straight_prec"}
+
+SERVE_POWER_RANGE = (0.5, 1.3)
+# Return power multiplier range by bucket of the incoming shot's power:
+# <=10, (10, 20], ..., (90, 100], >100
+RETURN_POWER_RANGES = (
+    (1, 1.5), (0.9, 1.5), (0.8, 1.4), (0.7, 1.4), (0.6, 1.3), (0.5, 1.3),
+    (0.4, 1.2), (0.3, 1.2), (0.2, 1.1), (0.1, 1), (0, 0.8),
+)
+
+
+def power_bucket(last_power):
+    """Index into RETURN_POWER_RANGES for an incoming shot of this power."""
+    if last_power <= 10:
+        return 0
+    if last_power > 100:
+        return 10
+    return -int(-last_power // 10) - 1
+
+
+# RETURN_POWER_RANGES by whole incoming power 0..100 (shot powers are rounded)
+RETURN_POWER_BY_POWER = tuple(RETURN_POWER_RANGES[power_bucket(power)] for power in range(101))
+
+
+class ShotModel:
+    """A surface's shot effects, by shot code (see the module comment)."""
+    __slots__ = ("power_fx", "serve_fx", "precision_fx")
+
+    def __init__(self, surface_fx):
+        self.power_fx = tuple(surface_fx.get(key, 1.0) if key else 1.0 for key in POWER_FX_KEYS)
+        self.serve_fx = surface_fx.get(SERVE_FX_KEY, 1.0)
+        self.precision_fx = {direction: surface_fx.get(key, 1.0) for direction, key in PRECISION_FX_KEYS.items()}
+
+
+class ShotProfile:
+    """
+    One skill set's shot inputs on a surface: per shot code the power skill,
+    its skill-dependent factor and the surface effect, and the precision
+    skill (None where it follows the shot direction, see precision()).
+    """
+    __slots__ = ("skills", "power_skill", "power_factor", "power_fx", "serve_fx", "shot_precision",
+                 "direction_precision")
+
+    def __init__(self, skills, model):
+        self.skills = skills
+        self.power_skill = (skills.serve, skills.forehand, skills.backhand, skills.dropshot, skills.volley,
+                            skills.lift, skills.slice)
+        self.power_factor = (1.0, 1.0, 1.0, 1.0,
+                             1.0 + max(0, (skills.volley - 30) / 100),   # 1.0 to 1.5x, time compression
+                             1.3,                                         # lift: power over neutral shots
+                             0.2 + (skills.slice / 100) * 0.5)            # slice: 0.2 to 0.7
+        self.power_fx = model.power_fx
+        self.serve_fx = model.serve_fx
+        self.shot_precision = (None, None, None,
+                               skills.dropshot,
+                               None,
+                               max(5, int(skills.lift * 0.4 + 5)),        # lift: low precision
+                               min(95, int(skills.slice * 1.2 + 20)))     # slice: very high precision
+        self.direction_precision = {direction: int(getattr(skills, direction) * fx)
+                                    for direction, fx in model.precision_fx.items()}
+
+    def base_power(self, code, previous_multiplier):
+        return self.power_skill[code] * previous_multiplier * self.power_factor[code] * self.power_fx[code]
+
+    def precision(self, code, direction):
+        precision = self.shot_precision[code]
+        if precision is not None:
+            return precision
+        precision = self.direction_precision.get(direction)
+        # Volleys and serves aimed as dropshot/volley/lift/slice use that skill as is
+        return precision if precision is not None else getattr(self.skills, direction)
@@ -0,0 +1,77 @@
+from collections import deque
+
+# Lazy consumption of GameEngine.simulate_match(visualize=True).
+#
+# The match viewer shows one point at a time and only ever looks at the point
+# it is animating, the one before it (for the scoreboard and stats shown
+# without spoilers) and, at the end, the last point. PointStream pulls point
+# events from the generator as the viewer advances, keeping those plus a small
+# look-ahead buffer, so animation starts after the first point is simulated
+# and memory stays bounded however long the match is.
+
+
+class PointStream:
+    """
+    Point events of a match pulled on demand from a simulate_match(visualize=True)
+    generator. Points are addressed by index like a list, but only the last
+    `keep` points and up to `lookahead` points past the newest requested one
+    are held; older points raise IndexError.
+    """
+
+    def __init__(self, events, lookahead=3, keep=2):
+        self._events = iter(events)
+        self.lookahead = lookahead
+        self._buffer = deque()     # points start.._pulled-1
+        self._start = 0            # index of _buffer[0]
+        self._keep = keep
+        self.match_end = None      # the match_end event once the generator is exhausted
+        self.last = None           # the last point event pulled so far
+
+    @property
+    def finished(self):
+        """True once the generator is exhausted (the match is over)."""
+        return self.match_end is not None
+
+    def __len__(self):
+        """Points pulled so far; the number of points in the match once finished."""
+        return self._start + len(self._buffer)
+
+    def _pull(self):
+        """Pull one point from the generator; False when the match is over."""
+        if self.finished:
+            return False
+        for event in self._events:
+            if event['type'] == 'point':
+                self._buffer.append(event)
+                self.last = event
+                return True
+            if event['type'] == 'match_end':
+                self.match_end = event
+        if self.match_end is None:
+            self.match_end = {'type': 'match_end', 'winner': None}
+        return False
+
+    def has(self, i):
+        """Whether the match has a point i (simulating up to it if needed)."""
+        while len(self) <= i:
+            if not self._pull():
+                return False
+        return True
+
+    def get(self, i):
+        """Point i. Moves the window: older points are dropped and the look-ahead topped up."""
+        if not self.has(i):
+            raise IndexError(f"match has only {len(self)} points")
+        if i < self._start:
+            raise IndexError(f"point {i} is no longer buffered")
+        while self._start < i - self._keep + 1:
+            self._buffer.popleft()
+            self._start += 1
+        self.has(i + self.lookahead)
+        return self._buffer[i - self._start]
+
+    def peek(self, i):
+        """Point i if it is buffered, without moving the window or simulating; else None."""
+        if self._start <= i < len(self):
+            return self._buffer[i - self._start]
+        return None
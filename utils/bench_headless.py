@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: matches/sec for a full Grand Slam draw, simulated with point events
+(the old scheduler path) versus the headless compact-result path.
+
+Usage: python utils/bench_headless.py [--repeat N]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+
+
+def run_draw(scheduler, tournament, visualize):
+    """Play every round of the tournament, returns the number of matches simulated."""
+    matches = 0
+    while not tournament.get('winner_id') and tournament['current_round'] < len(tournament['bracket']):
+        active = tournament['active_matches']
+        for match_idx in range(len(active)):
+            match = tournament['active_matches'][match_idx]
+            if len(match) < 3 or match[2] is None:
+                if match[0] is not None and match[1] is not None:
+                    matches += 1
+                scheduler.simulate_through_match(tournament['id'], match_idx, visualize=visualize)
+            if tournament['active_matches'] is not active:
+                break
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='draws simulated per mode')
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    random.seed(args.seed)
+    scheduler = TournamentScheduler(save_path='data/__bench_no_save__.json')
+    tournament = next(t for t in scheduler.tournaments if t['category'] == "Grand Slam")
+    tournament['participants'] = [p['id'] for p in scheduler.players][:tournament['draw_size']]
+    scheduler.generate_bracket(tournament['id'])
+
+    players_snapshot = copy.deepcopy(scheduler.players)
+    tournament_snapshot = copy.deepcopy(tournament)
+
+    print(f"{tournament['name']}: {tournament['draw_size']} draw, best of 5")
+    results = {}
+    for label, visualize in (("events (before)", True), ("headless (after)", False)):
+        total_matches = 0
+        elapsed = 0.0
+        for i in range(args.repeat):
+            scheduler.players = copy.deepcopy(players_snapshot)
+            tournament.clear()
+            tournament.update(copy.deepcopy(tournament_snapshot))
+            random.seed(args.seed + i)
+            start = time.perf_counter()
+            total_matches += run_draw(scheduler, tournament, visualize)
+            elapsed += time.perf_counter() - start
+        results[label] = total_matches / elapsed
+        print(f"  {label:<18} {total_matches:5d} matches in {elapsed:6.2f}s -> {results[label]:8.1f} matches/sec")
+
+    before, after = results["events (before)"], results["headless (after)"]
+    print(f"  speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rallies per second on every surface, for the GameEngine in the
+working tree versus the engine at a git ref, usually the commit before the
+engine change being measured.
+
+Each surface plays the same seeded headless matches with both engines,
+alternating `--repeat` times and keeping the best time of each. A rally is
+one simulate_point call (one game, see GameEngine.simulate_point); shots per
+second are shown too. Both engines must produce the same matches.
+
+Usage: python utils/bench_rallies.py --ref REF [--matches N] [--repeat R] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.game_engine import GameEngine
+from bench_simulate_point import SURFACES, load_players, load_reference_engine
+
+
+def play_surface(engine_cls, players, surface, matches, seed):
+    """Play `matches` seeded matches on `surface`; returns (rallies, shots, seconds, scores)."""
+    rallies = shots = 0
+    scores = []
+    start = time.perf_counter()
+    for m in range(matches):
+        p1 = players[m % len(players)]
+        p2 = players[(m * 7 + 3) % len(players)]
+        if p1['id'] == p2['id']:
+            p2 = players[(m + 1) % len(players)]
+        engine = engine_cls(p1, p2, surface, sets_to_win=2 + m % 2, rng=random.Random(seed + m))
+        result = engine.simulate_match(headless=True)
+        rallies += result.games
+        shots += result.shots
+        scores.append(result.set_scores)
+    return rallies, shots, time.perf_counter() - start, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ref', required=True, help='git ref of the reference engine')
+    parser.add_argument('--matches', type=int, default=200, help='matches per surface')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    reference = load_reference_engine(args.ref)
+
+    print(f"  {'surface':<8} {args.ref + ' rallies/s':>18} {'working rallies/s':>18} {'shots/s':>10} {'speedup':>8}")
+    for surface in SURFACES:
+        ref_time = elapsed = float('inf')
+        for _ in range(args.repeat):
+            ref_rallies, _, seconds, ref_scores = play_surface(reference, players, surface, args.matches, args.seed)
+            ref_time = min(ref_time, seconds)
+            rallies, shots, seconds, scores = play_surface(GameEngine, players, surface, args.matches, args.seed)
+            elapsed = min(elapsed, seconds)
+        flag = "" if scores == ref_scores else "  WARNING: different matches"
+        print(f"  {surface:<8} {ref_rallies / ref_time:18,.0f} {rallies / elapsed:18,.0f}"
+              f" {shots / elapsed:10,.0f} {ref_time / elapsed:7.2f}x{flag}")
+
+
+if __name__ == "__main__":
+    main()
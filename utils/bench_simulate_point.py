@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: GameEngine.simulate_point in the working tree versus the
+engine at a git ref (usually the commit before the engine change being
+measured), on the same seeded matches.
+
+Both engines consume the random stream identically, so they play the very
+same points; the benchmark checks that and reports microseconds per point.
+With --tight every match is a player against an identical copy, so 5-5 and
+6-6 are common and many points are played with the mental boost on.
+
+Usage: python utils/bench_simulate_point.py --ref REF [--matches N] [--tight]
+"""
+
+import argparse
+import atexit
+import importlib
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.game_engine import GameEngine
+
+MENTALITIES = ["neutral", "opportunist", "strategist", "disruptor", "marathonian",
+               "brute", "baseliner", "net-player", "specialist", "wildcard"]
+SURFACES = ["clay", "grass", "hard", "indoor"]
+
+
+def export_src(ref, directory):
+    """Write src/ as it is at git `ref` into `directory`; returns the path of that src/."""
+    archive = subprocess.run(['git', 'archive', ref, 'src'], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return os.path.join(directory, 'src')
+
+
+def import_engine(src):
+    """
+    GameEngine of the src/ tree at `src`, imported with that tree's own sim
+    package (shot model, match log, events). The working tree's sim modules
+    are put back in sys.modules afterwards.
+    """
+    def sim_modules():
+        return [name for name in sys.modules if name == 'sim' or name.startswith('sim.')]
+    saved = {name: sys.modules.pop(name) for name in sim_modules()}
+    sys.path.insert(0, src)
+    try:
+        return importlib.import_module('sim.game_engine').GameEngine
+    finally:
+        sys.path.remove(src)
+        for name in sim_modules():
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def load_reference_engine(ref):
+    """GameEngine as it is at git `ref`, with the rest of src/ at that ref (see import_engine)."""
+    directory = tempfile.mkdtemp(prefix='tennisgm-ref-')
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    return import_engine(export_src(ref, directory))
+
+
+def load_players(seed):
+    """Default-data players with the fields GameEngine expects filled in."""
+    rng = random.Random(seed)
+    with open(os.path.join(ROOT, 'data', 'default_data.json')) as f:
+        players = json.load(f)['players']
+    for i, p in enumerate(players):
+        skills = p['skills']
+        skills.setdefault('dropshot', rng.randint(25, 55))
+        skills.setdefault('volley', rng.randint(25, 55))
+        p['hand'] = 'Left' if i % 3 == 0 else 'Right'
+        p['mentality'] = MENTALITIES[i % len(MENTALITIES)]
+    return players
+
+
+def time_points(engine_cls, players, matches, seed, tight=False):
+    """
+    Play `matches` matches game by game, timing only simulate_point.
+    Returns (points, important points, seconds, winners).
+    """
+    points = 0
+    important = 0
+    elapsed = 0.0
+    winners = []
+    clock = time.perf_counter
+    for m in range(matches):
+        random.seed(seed + m)
+        p1 = players[m % len(players)]
+        p2 = players[(m * 7 + 3) % len(players)]
+        if tight:
+            p2 = dict(p1, id=-1 - p1['id'])
+        elif p1['id'] == p2['id']:
+            p2 = players[(m + 1) % len(players)]
+        engine = engine_cls(p1, p2, SURFACES[m % 4], sets_to_win=2 + m % 2)
+        engine.log_games = False
+        while not engine.is_match_over():
+            while not engine.is_set_over():
+                important += engine._is_important_point()
+                start = clock()
+                winner_key = engine.simulate_point()
+                elapsed += clock() - start
+                points += 1
+                engine.update_games(winner_key)
+                engine.current_server, engine.current_receiver = engine.current_receiver, engine.current_server
+            engine.update_sets(engine.is_set_over())
+            engine.recover_set_stamina()
+        winners.append((engine.sets['player1'], engine.sets['player2'], engine.format_set_scores()))
+    return points, important, elapsed, winners
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ref', required=True, help='git ref of the reference engine')
+    parser.add_argument('--matches', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=11)
+    parser.add_argument('--tight', action='store_true', help='mirror matches with frequent important points')
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    reference = load_reference_engine(args.ref)
+
+    results = {}
+    for label, engine_cls in ((f"{args.ref}", reference), ("working tree", GameEngine)):
+        points, important, elapsed, winners = time_points(engine_cls, players, args.matches, args.seed, args.tight)
+        results[label] = (points, elapsed, winners)
+        print(f"  {label:<14} {points:6d} points ({important / points:.0%} important) in {elapsed:6.2f}s"
+              f" -> {elapsed / points * 1e6:7.2f} us/point")
+
+    (ref_points, ref_time, ref_winners), (points, elapsed, winners) = results.values()
+    if ref_winners != winners:
+        print("  WARNING: engines produced different results for the same seeds")
+    print(f"  speedup: {ref_time / ref_points / (elapsed / points):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
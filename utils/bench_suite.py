@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the simulation stack, from default data with fixed seeds:
+
+  simulate_point   GameEngine.simulate_point alone (one game per call)
+  match_bo3        headless best-of-3 matches
+  match_bo5        headless best-of-5 matches
+  tournament_128   simulate_entire_tournament for a 128-draw Grand Slam
+  advance_week     advance_week alone, with each week's tournaments played in between
+  season           a 52-week season with its tournaments, through the year rollover
+  save_load        save_game followed by load_data of the same save
+
+Each benchmark runs `--repeat` times and reports the best ops/sec, then once
+more under tracemalloc for its peak memory (skipped with --no-memory).
+Results are compared with the baseline file, the previous run by default,
+flagging anything more than `--threshold` slower or larger; the run then
+becomes the new baseline unless --keep-baseline is given. Baselines of runs
+with other sizes or seeds are not compared.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/bench_suite.py [--only NAME ...] [--repeat R] [--seed N] [--baseline FILE]
+                                   [--keep-baseline] [--no-memory] [--threshold T]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+from sim.game_engine import GameEngine
+from bench_simulate_point import SURFACES, load_players
+
+# Work per run of each benchmark (part of the baseline's config)
+SIZES = {
+    "simulate_point": 200,   # matches played point by point
+    "match_bo3": 200,
+    "match_bo5": 100,
+    "tournament_128": 1,
+    "advance_week": 8,
+    "season": 52,
+    "save_load": 5,
+}
+
+
+def new_scheduler(seed):
+    """Scheduler fixture: a new game from default data."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return TournamentScheduler(save_path='data/__bench_no_save__.json', seed=seed)
+
+
+def pairings(players, count):
+    """Fixed list of `count` (player1, player2, surface) pairings."""
+    for m in range(count):
+        p1 = players[m % len(players)]
+        p2 = players[(m * 7 + 3) % len(players)]
+        if p1['id'] == p2['id']:
+            p2 = players[(m + 1) % len(players)]
+        yield m, p1, p2, SURFACES[m % len(SURFACES)]
+
+
+def play_week(scheduler):
+    """Play every tournament of the current week."""
+    for tournament in scheduler.get_current_week_tournaments():
+        if tournament.get('winner_id') is None and tournament.get('bracket'):
+            scheduler.simulate_entire_tournament(tournament['id'])
+
+
+# Each benchmark plays `size` units from `seed` and returns (ops, seconds),
+# timing only the operation it measures.
+
+def bench_simulate_point(size, seed):
+    players = load_players(seed)
+    points = 0
+    elapsed = 0.0
+    clock = time.perf_counter
+    for m, p1, p2, surface in pairings(players, size):
+        engine = GameEngine(p1, p2, surface, sets_to_win=2 + m % 2, rng=random.Random(seed + m))
+        engine.log_games = False
+        while not engine.is_match_over():
+            while not engine.is_set_over():
+                start = clock()
+                winner_key = engine.simulate_point()
+                elapsed += clock() - start
+                points += 1
+                engine.update_games(winner_key)
+                engine.switch_server()
+            engine.update_sets(engine.is_set_over())
+            engine.recover_set_stamina()
+    return points, elapsed
+
+
+def bench_matches(sets_to_win):
+    def bench(size, seed):
+        players = load_players(seed)
+        start = time.perf_counter()
+        for m, p1, p2, surface in pairings(players, size):
+            GameEngine(p1, p2, surface, sets_to_win=sets_to_win, rng=random.Random(seed + m)).simulate_match(headless=True)
+        return size, time.perf_counter() - start
+    return bench
+
+
+def bench_tournament_128(size, seed):
+    scheduler = new_scheduler(seed)
+    tournament = next(t for t in scheduler.tournaments if t['category'] == "Grand Slam" and t['draw_size'] == 128)
+    elapsed = 0.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(size):
+            tournament.update(winner_id=None, bracket=[], current_round=0, active_matches=[],
+                              replays={}, player_snapshots={})
+            tournament['participants'] = [p['id'] for p in scheduler.players if not p.get('retired')][:128]
+            scheduler.generate_bracket(tournament['id'])
+            start = time.perf_counter()
+            scheduler.simulate_entire_tournament(tournament['id'])
+            elapsed += time.perf_counter() - start
+    return size, elapsed
+
+
+def bench_advance_week(size, seed):
+    scheduler = new_scheduler(seed)
+    elapsed = 0.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(size):
+            play_week(scheduler)
+            start = time.perf_counter()
+            scheduler.advance_week()
+            elapsed += time.perf_counter() - start
+    return size, elapsed
+
+
+def bench_season(size, seed):
+    scheduler = new_scheduler(seed)
+    year = scheduler.current_year
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(size):
+            play_week(scheduler)
+            scheduler.advance_week()
+        elapsed = time.perf_counter() - start
+    if size >= 52 and scheduler.current_year == year:
+        raise RuntimeError("season benchmark did not reach the year rollover")
+    return size, elapsed
+
+
+def bench_save_load(size, seed):
+    scheduler = new_scheduler(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(4):
+            play_week(scheduler)
+            scheduler.advance_week()
+        start = time.perf_counter()
+        for _ in range(size):
+            scheduler.save_game('data/__bench_save__.json')
+            scheduler.load_data(save_path='data/__bench_save__.json')
+        elapsed = time.perf_counter() - start
+    return size, elapsed
+
+
+BENCHMARKS = {
+    "simulate_point": (bench_simulate_point, "points"),
+    "match_bo3": (bench_matches(2), "matches"),
+    "match_bo5": (bench_matches(3), "matches"),
+    "tournament_128": (bench_tournament_128, "tournaments"),
+    "advance_week": (bench_advance_week, "weeks"),
+    "season": (bench_season, "weeks"),
+    "save_load": (bench_save_load, "round trips"),
+}
+
+
+def run(name, seed, repeat, memory):
+    """Best ops/sec over `repeat` runs, and the peak traced memory of one more run."""
+    bench, unit = BENCHMARKS[name]
+    best = 0.0
+    for _ in range(repeat):
+        ops, seconds = bench(SIZES[name], seed)
+        best = max(best, ops / seconds)
+    result = {"ops_per_sec": best, "unit": unit}
+    if memory:
+        tracemalloc.start()
+        try:
+            bench(SIZES[name], seed)
+            result["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def compare(name, result, baseline, threshold):
+    """Text comparing a result with its baseline entry ('' without one)."""
+    if baseline is None:
+        return ""
+    notes = [f"{result['ops_per_sec'] / baseline['ops_per_sec']:.2f}x speed"]
+    if result['ops_per_sec'] < baseline['ops_per_sec'] * (1 - threshold):
+        notes.append("SLOWER")
+    if 'peak_mb' in result and 'peak_mb' in baseline:
+        notes.append(f"{result['peak_mb'] / baseline['peak_mb']:.2f}x memory")
+        if result['peak_mb'] > baseline['peak_mb'] * (1 + threshold):
+            notes.append("LARGER")
+    return "  " + " ".join(notes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='benchmarks to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--baseline', default=os.path.join(ROOT, 'bench_baseline.json'))
+    parser.add_argument('--keep-baseline', action='store_true', help='do not store this run as the baseline')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative change flagged as a regression')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    config = {"seed": args.seed, "sizes": SIZES}
+    previous = baseline.get("results", {}) if baseline.get("config") == config else {}
+    if baseline and not previous:
+        print(f"  baseline {args.baseline} has another seed or sizes, not comparing")
+
+    baseline_path = os.path.abspath(args.baseline)
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-bench-')
+    results = dict(previous)
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        for name in args.only or BENCHMARKS:
+            result = run(name, args.seed, args.repeat, not args.no_memory)
+            memory = f" {result['peak_mb']:8.1f} MB peak" if 'peak_mb' in result else ""
+            print(f"  {name:<15} {result['ops_per_sec']:12,.1f} {result['unit']}/s{memory}"
+                  f"{compare(name, result, previous.get(name), args.threshold)}")
+            results[name] = result
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if not args.keep_baseline:
+        with open(baseline_path, 'w') as f:
+            json.dump({"config": config, "python": platform.python_version(),
+                       "date": datetime.now().isoformat(timespec='seconds'), "results": results}, f, indent=2)
+        print(f"  stored as baseline in {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: simulate_entire_tournament for a 128-draw Grand Slam with the
+scheduler's id indexes (get_player / get_tournament) against the same
+scheduler looking players and tournaments up by scanning its lists, as it
+did before the indexes. The world is padded with copies of the default
+players to each of --sizes players, since the scans grow with it. Both
+lookups must play the same tournament.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/bench_tournament_lookup.py [--sizes N ...] [--repeat R] [--seed N]
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+
+
+class ScanningScheduler(TournamentScheduler):
+    """Looks players and tournaments up by scanning the lists."""
+
+    def get_player(self, player_id):
+        return next((p for p in self.players if p['id'] == player_id), None)
+
+    def get_tournament(self, tournament_id):
+        return next(t for t in self.tournaments if t['id'] == tournament_id)
+
+
+def padded_scheduler(cls, seed, size):
+    """A new game whose world is padded to `size` players with copies under new ids."""
+    scheduler = cls(save_path='data/__bench_no_save__.json', seed=seed)
+    players = list(scheduler.players)
+    next_id = max(p['id'] for p in players) + 1
+    for i in range(size - len(players)):
+        clone = copy.deepcopy(scheduler.players[i % len(scheduler.players)])
+        clone['id'] = next_id + i
+        clone['name'] = f"{clone['name']} {i}"
+        players.append(clone)
+    scheduler.players = players
+    scheduler.ranking_system.update_combined_rankings(scheduler.players, scheduler.current_date)
+    return scheduler
+
+
+def play_tournament(cls, seed, size, repeat):
+    """Best seconds per 128-draw tournament, and its bracket."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = padded_scheduler(cls, seed, size)
+        tournament = next(t for t in scheduler.tournaments
+                          if t['category'] == "Grand Slam" and t['draw_size'] == 128)
+        best = float('inf')
+        for _ in range(repeat):
+            tournament.update(winner_id=None, bracket=[], current_round=0, active_matches=[],
+                              replays={}, player_snapshots={})
+            # Spread over the whole list, so scans do not find every player near its front
+            active = [p['id'] for p in scheduler.players if not p.get('retired')]
+            tournament['participants'] = active[::max(1, len(active) // 128)][:128]
+            scheduler.generate_bracket(tournament['id'])
+            start = time.perf_counter()
+            scheduler.simulate_entire_tournament(tournament['id'])
+            best = min(best, time.perf_counter() - start)
+    return best, tournament['bracket']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[128, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-lookup-')
+    rows = []
+    try:
+        os.mkdir(os.path.join(workdir, 'data'))
+        for name in ('default_data.json', 'names.json', 'ranking.json'):
+            shutil.copy(os.path.join(ROOT, 'data', name), os.path.join(workdir, 'data', name))
+        os.chdir(workdir)
+        for size in args.sizes:
+            scanned, scanned_bracket = play_tournament(ScanningScheduler, args.seed, size, args.repeat)
+            indexed, indexed_bracket = play_tournament(TournamentScheduler, args.seed, size, args.repeat)
+            rows.append((size, scanned, indexed, scanned_bracket == indexed_bracket))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {'players':>7} {'scanning':>9} {'indexed':>9} {'speedup':>8}")
+    for size, scanned, indexed, same in rows:
+        print(f"  {size:>7} {scanned * 1000:7.0f}ms {indexed * 1000:7.0f}ms {scanned / indexed:7.2f}x"
+              f"{'' if same else '  DIFFERENT TOURNAMENT'}")
+    if not all(same for *_, same in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
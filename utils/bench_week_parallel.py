@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: weeks played with TournamentScheduler.simulate_current_week,
+every tournament in this process versus the week's tournaments spread over a
+process pool. Prints the time spent in tournaments per week for both, and
+checks that the two runs end in the same world (see check_rng_determinism).
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/bench_week_parallel.py [--seed N] [--weeks W] [--workers N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+from check_rng_determinism import world_hash
+
+
+def play_weeks(seed, weeks, map_tournaments=None):
+    """Play `weeks` weeks; returns ([(week, tournaments, seconds)], world hash)."""
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = TournamentScheduler(save_path='data/week_parallel_check.json', seed=seed)
+        for _ in range(weeks):
+            week = scheduler.current_week
+            start = time.perf_counter()
+            played = scheduler.simulate_current_week(map_tournaments)
+            times.append((week, len(played), time.perf_counter() - start))
+            scheduler.advance_week()
+    return times, world_hash(scheduler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=6)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-week-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        serial, serial_hash = play_weeks(args.seed, args.weeks)
+        shutil.rmtree('data')
+        shutil.copytree(os.path.join(ROOT, 'data'), 'data')
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            parallel, parallel_hash = play_weeks(args.seed, args.weeks, pool.map)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {'week':>4} {'events':>7} {'serial':>8} {f'{args.workers} workers':>10} {'speedup':>8}")
+    for (week, count, a), (_, _, b) in zip(serial, parallel):
+        print(f"  {week:>4} {count:>7} {a:7.2f}s {b:9.2f}s {a / b:7.2f}x")
+    total_serial = sum(t for *_, t in serial)
+    total_parallel = sum(t for *_, t in parallel)
+    print(f"  total {total_serial:.2f}s vs {total_parallel:.2f}s ({total_serial / total_parallel:.2f}x)")
+    if serial_hash != parallel_hash:
+        sys.exit("  serial and parallel weeks ended in different worlds")
+    print("  serial and parallel weeks ended in the same world")
+
+
+if __name__ == "__main__":
+    main()
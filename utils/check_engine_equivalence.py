@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Statistical-equivalence check of a candidate GameEngine (the working tree by
+default) against a reference engine at a git ref, usually the commit before
+the engine change being checked.
+
+Both engines play the same grid of matchups: default-data pairs covering
+every mentality, on every surface, some best of five. Each engine uses its
+own independent seeds, so an engine change that moves no distribution
+passes, even if it draws from the random stream differently. Matches are
+played in a process pool. An engine at a git ref comes with the whole src/
+tree at that ref (see bench_simulate_point.import_engine), so changes to the
+shot model and the other sim modules it imports are compared too.
+
+Each group of matches (all, per surface, per format, and per mentality for
+the players' own numbers) gets two-sample tests:
+  - player1 win rate and tiebreak-set rate: two-proportion z-tests
+  - games per match: two-sample Kolmogorov-Smirnov
+  - set score distribution: chi-square test of homogeneity
+  - every match_stats counter per match: Welch z-test on the means
+The p-values are corrected for the number of tests (Holm), and the check
+fails (exit status 1) if any corrected p-value is below --alpha.
+
+Usage: python utils/check_engine_equivalence.py --ref REF [--candidate REF] [--matches N]
+                                                [--workers W] [--alpha A] [--seed N]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from multiprocessing import Pool
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.game_engine import STAT_KEYS
+from sim.rng import derive_seed
+from bench_simulate_point import MENTALITIES, SURFACES, export_src, import_engine, load_players
+
+# Player index pairs; load_players gives index i the mentality i % 10, so
+# every mentality plays, against a range of ranking gaps
+PAIRS = [(0, 1), (2, 13), (4, 25), (6, 37), (8, 49), (11, 60), (23, 75), (35, 90), (47, 105), (59, 120)]
+WORKING = "working tree"
+
+
+def grid():
+    """Matchup cells: (pair index, player1 index, player2 index, surface, sets to win)."""
+    return [(k, i, j, surface, 3 if (k + s) % 4 == 0 else 2)
+            for k, (i, j) in enumerate(PAIRS) for s, surface in enumerate(SURFACES)]
+
+
+_engines = {}
+_players = {}
+
+
+def play_cell(task):
+    """
+    Worker: play one cell's matches with one engine; returns per-match records.
+    The engine is the working tree's, or imported from `src`, a src/ tree
+    exported at engine_ref.
+    """
+    engine_ref, src, players_seed, seed, cell, matches = task
+    if engine_ref not in _engines:
+        if src is None:
+            from sim.game_engine import GameEngine
+            _engines[engine_ref] = GameEngine
+        else:
+            _engines[engine_ref] = import_engine(src)
+    if players_seed not in _players:
+        _players[players_seed] = load_players(players_seed)
+    engine_cls = _engines[engine_ref]
+    players = _players[players_seed]
+    k, i, j, surface, sets_to_win = cell
+    p1, p2 = players[i], players[j]
+    records = []
+    for m in range(matches):
+        engine = engine_cls(p1, p2, surface, sets_to_win=sets_to_win,
+                            rng=random.Random(derive_seed(seed, engine_ref, k, surface, m)))
+        result = engine.simulate_match(headless=True)
+        records.append((0 if result.winner_key == "player1" else 1, tuple(map(tuple, result.set_scores)),
+                        tuple(result.match_stats[p1['id']][key] for key in STAT_KEYS),
+                        tuple(result.match_stats[p2['id']][key] for key in STAT_KEYS)))
+    return records
+
+
+# Two-sample tests, each returning (statistic, two-sided p-value)
+
+def two_proportions(x1, n1, x2, n2):
+    pooled = (x1 + x2) / (n1 + n2)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    if se == 0:
+        return 0.0, 1.0
+    z = (x2 / n2 - x1 / n1) / se
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def welch(a, b):
+    n1, n2 = len(a), len(b)
+    m1, m2 = sum(a) / n1, sum(b) / n2
+    v1 = sum((x - m1) ** 2 for x in a) / (n1 - 1)
+    v2 = sum((x - m2) ** 2 for x in b) / (n2 - 1)
+    se = math.sqrt(v1 / n1 + v2 / n2)
+    if se == 0:
+        return 0.0, 1.0 if m1 == m2 else 0.0
+    z = (m2 - m1) / se      # samples are large, so the t distribution is taken as normal
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def kolmogorov_smirnov(a, b):
+    n1, n2 = len(a), len(b)
+    ca, cb = Counter(a), Counter(b)
+    d = f1 = f2 = 0.0
+    for value in sorted(set(ca) | set(cb)):
+        f1 += ca[value] / n1
+        f2 += cb[value] / n2
+        d = max(d, abs(f1 - f2))
+    ne = n1 * n2 / (n1 + n2)
+    lam = (math.sqrt(ne) + 0.12 + 0.11 / math.sqrt(ne)) * d
+    if lam < 0.2:
+        return d, 1.0
+    p = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 101))
+    return d, min(1.0, max(0.0, p))
+
+
+def _upper_gamma(s, x):
+    """Regularized upper incomplete gamma Q(s, x)."""
+    if x <= 0:
+        return 1.0
+    if x < s + 1:
+        term = total = 1 / s
+        n = s
+        for _ in range(500):
+            n += 1
+            term *= x / n
+            total += term
+            if term < total * 1e-15:
+                break
+        return 1 - total * math.exp(-x + s * math.log(x) - math.lgamma(s))
+    # Continued fraction (modified Lentz)
+    b = x + 1 - s
+    c = 1 / 1e-300
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - s)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1 / d
+        h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(-x + s * math.log(x) - math.lgamma(s)) * h
+
+
+def chi_square(a, b, min_expected=5):
+    """Homogeneity of two categorical samples; categories expected < min_expected times are pooled."""
+    ca, cb = Counter(a), Counter(b)
+    n1, n2 = len(a), len(b)
+    rows = []
+    rare = [0, 0]
+    for category in set(ca) | set(cb):
+        if (ca[category] + cb[category]) * min(n1, n2) / (n1 + n2) < min_expected:
+            rare[0] += ca[category]
+            rare[1] += cb[category]
+        else:
+            rows.append((ca[category], cb[category]))
+    if sum(rare):
+        rows.append(tuple(rare))
+    if len(rows) < 2:
+        return 0.0, 1.0
+    chi2 = 0.0
+    for x1, x2 in rows:
+        total = x1 + x2
+        for observed, n in ((x1, n1), (x2, n2)):
+            expected = total * n / (n1 + n2)
+            chi2 += (observed - expected) ** 2 / expected
+    return chi2, _upper_gamma((len(rows) - 1) / 2, chi2 / 2)
+
+
+def holm(p_values):
+    """Holm-Bonferroni adjusted p-values, in the input order."""
+    order = sorted(range(len(p_values)), key=p_values.__getitem__)
+    adjusted = [0.0] * len(p_values)
+    running = 0.0
+    for rank, i in enumerate(order):
+        running = max(running, min(1.0, (len(p_values) - rank) * p_values[i]))
+        adjusted[i] = running
+    return adjusted
+
+
+def is_tiebreak(score):
+    return max(score) == 7 and min(score) == 6
+
+
+def match_tests(group, ref, cand):
+    """Tests on the matches of one group: [(group, metric, reference, candidate, p-value)]."""
+    tests = []
+    w1, w2 = sum(r[0] == 0 for r in ref), sum(r[0] == 0 for r in cand)
+    _, p = two_proportions(w1, len(ref), w2, len(cand))
+    tests.append((group, "player1 win rate", w1 / len(ref), w2 / len(cand), p))
+
+    sets1 = [s for r in ref for s in r[1]]
+    sets2 = [s for r in cand for s in r[1]]
+    t1, t2 = sum(map(is_tiebreak, sets1)), sum(map(is_tiebreak, sets2))
+    _, p = two_proportions(t1, len(sets1), t2, len(sets2))
+    tests.append((group, "tiebreak sets", t1 / len(sets1), t2 / len(sets2), p))
+
+    games1 = [sum(map(sum, r[1])) for r in ref]
+    games2 = [sum(map(sum, r[1])) for r in cand]
+    _, p = kolmogorov_smirnov(games1, games2)
+    tests.append((group, "games per match (KS)", sum(games1) / len(ref), sum(games2) / len(cand), p))
+
+    _, p = chi_square([f"{g1}-{g2}" for g1, g2 in sets1], [f"{g1}-{g2}" for g1, g2 in sets2])
+    tests.append((group, "set scores (chi2)", len(set(sets1)), len(set(sets2)), p))
+
+    for k, key in enumerate(STAT_KEYS):
+        a = [r[2][k] + r[3][k] for r in ref]
+        b = [r[2][k] + r[3][k] for r in cand]
+        _, p = welch(a, b)
+        tests.append((group, key, sum(a) / len(a), sum(b) / len(b), p))
+    return tests
+
+
+def player_tests(group, ref, cand):
+    """Tests on (won, stats) samples of the players of one mentality."""
+    tests = []
+    w1, w2 = sum(won for won, _ in ref), sum(won for won, _ in cand)
+    _, p = two_proportions(w1, len(ref), w2, len(cand))
+    tests.append((group, "win rate", w1 / len(ref), w2 / len(cand), p))
+    for k, key in enumerate(STAT_KEYS):
+        a = [stats[k] for _, stats in ref]
+        b = [stats[k] for _, stats in cand]
+        _, p = welch(a, b)
+        tests.append((group, key, sum(a) / len(a), sum(b) / len(b), p))
+    return tests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ref', required=True, help='git ref of the reference engine')
+    parser.add_argument('--candidate', default=WORKING, help='git ref of the candidate engine (default: working tree)')
+    parser.add_argument('--matches', type=int, default=200, help='matches per grid cell and engine')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--alpha', type=float, default=0.01, help='family-wise significance level')
+    parser.add_argument('--seed', type=int, default=19)
+    args = parser.parse_args()
+
+    cells = grid()
+    with tempfile.TemporaryDirectory(prefix='tennisgm-equivalence-') as workdir:
+        trees = {engine: None if engine == WORKING else export_src(engine, os.path.join(workdir, str(n)))
+                 for n, engine in enumerate((args.ref, args.candidate))}
+        tasks = [(engine, trees[engine], args.seed, derive_seed(args.seed, "equivalence"), cell, args.matches)
+                 for engine in (args.ref, args.candidate) for cell in cells]
+        with Pool(args.workers) as pool:
+            results = pool.map(play_cell, tasks)
+    reference, candidate = results[:len(cells)], results[len(cells):]
+
+    groups = defaultdict(lambda: ([], []))
+    mentality = defaultdict(lambda: ([], []))
+    for cell, ref_records, cand_records in zip(cells, reference, candidate):
+        k, i, j, surface, sets_to_win = cell
+        for side, records in ((0, ref_records), (1, cand_records)):
+            for name in ("all", surface, f"best of {2 * sets_to_win - 1}"):
+                groups[name][side].extend(records)
+            for index, player in ((0, i), (1, j)):
+                mentality[MENTALITIES[player % len(MENTALITIES)]][side].extend(
+                    (r[0] == index, r[2 + index]) for r in records)
+
+    tests = []
+    for name, (ref_records, cand_records) in groups.items():
+        tests += match_tests(name, ref_records, cand_records)
+    for name, (ref_samples, cand_samples) in sorted(mentality.items()):
+        tests += player_tests(name, ref_samples, cand_samples)
+    adjusted = holm([t[-1] for t in tests])
+
+    failed = [(t, q) for t, q in zip(tests, adjusted) if q < args.alpha]
+    matches = sum(map(len, reference))
+    print(f"  {len(cells)} matchups x {args.matches} matches per engine ({matches} each),"
+          f" {len(tests)} tests, Holm-corrected alpha {args.alpha}")
+    print(f"  {'group':<14} {'metric':<22} {args.ref:>10} {args.candidate[:12]:>12} {'p':>8} {'Holm p':>8}")
+    for (group, metric, a, b, p), q in zip(tests, adjusted):
+        if group == "all" or q < args.alpha:
+            flag = "  <-- moved" if q < args.alpha else ""
+            print(f"  {group:<14} {metric:<22} {a:>10.3f} {b:>12.3f} {p:>8.4f} {q:>8.4f}{flag}")
+    if failed:
+        print(f"  FAIL: {len(failed)} distributions moved beyond alpha {args.alpha}")
+        sys.exit(1)
+    print(f"  OK: smallest Holm-corrected p-value {min(adjusted):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Round-trip check and size report for the binary match event format
+(sim.events): play seeded matches with visualization, encode their events,
+decode them and compare every field with the original, then compare the
+encoded size with JSON and with the events held as Python objects.
+
+Usage: python utils/check_event_codec.py [--matches N] [--seed N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.events import decode_events, encode_events
+from sim.game_engine import GameEngine
+from bench_simulate_point import SURFACES, load_players
+
+# Fields stored quantized, with the largest difference the format allows
+TOLERANCES = {'x': 1 / 64, 'y': 1 / 64, 'ball_y': 1 / 64, 'power': 1e-4, 'stamina': 1 / 65535}
+
+
+def plain(obj):
+    """Decoded records (and engine dicts) as plain nested dicts and lists."""
+    if hasattr(obj, '__slots__') and hasattr(obj, 'get') and not isinstance(obj, dict):
+        fields = {n: getattr(obj, n) for cls in type(obj).__mro__ for n in getattr(cls, '__slots__', ())}
+        if 'ball' in fields:
+            fields['ball_positions'] = [fields.pop('ball')]
+        fields['type'] = obj.type
+        obj = fields
+    if isinstance(obj, dict):
+        return {k: plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [plain(v) for v in obj]
+    return obj
+
+
+def same(a, b, key=None):
+    """Compare an engine value with its decoded counterpart, allowing the format's quantization."""
+    if isinstance(a, dict):
+        if a.get('type') == 'shot':
+            a = dict(a, is_final=a.get('is_final', False))
+        if key == 'winner':  # match_end keeps only the winner's id and name
+            a = {'id': a['id'], 'name': a['name']}
+        # stamina dicts are keyed by player id, so their values inherit the parent key
+        return set(a) == set(b) and all(same(a[k], b[k], key if key == 'stamina' else k) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y, key) for x, y in zip(a, b))
+    if isinstance(a, float) or isinstance(b, float):
+        return abs(a - b) <= TOLERANCES.get(key, 0.0) * 1.0001
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matches', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    encoded_bytes = json_bytes = object_bytes = points = mismatches = 0
+    for m in range(args.matches):
+        p1 = players[m % len(players)]
+        p2 = players[(m * 7 + 3) % len(players)]
+        if p1['id'] == p2['id']:
+            p2 = players[(m + 1) % len(players)]
+        engine = GameEngine(p1, p2, SURFACES[m % 4], sets_to_win=2 + m % 2, rng=random.Random(args.seed + m))
+
+        tracemalloc.start()
+        events = list(engine.simulate_match(visualize=True))
+        object_bytes += tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        data = encode_events(p1, p2, events)
+        decoded = list(decode_events(data))
+        if not same(plain(events), plain(decoded)):
+            mismatches += 1
+            print(f"  MISMATCH in match {m}")
+        encoded_bytes += len(data)
+        json_bytes += len(json.dumps(events, default=lambda o: o.get('id') if isinstance(o, dict) else str(o)))
+        points += len(events) - 1
+
+    print(f"  {args.matches} matches, {points} points, {mismatches} round-trip mismatches")
+    print(f"  encoded {encoded_bytes / points:7.1f} bytes/point")
+    print(f"  JSON    {json_bytes / points:7.1f} bytes/point ({json_bytes / encoded_bytes:.1f}x)")
+    print(f"  objects {object_bytes / points:7.1f} bytes/point ({object_bytes / encoded_bytes:.1f}x)")
+    if mismatches:
+        sys.exit("Decoded events differ from the engine's")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Check the structured match log (sim.match_log): play the same seeded matches
+with the GameEngine in the working tree and the engine at a git ref (usually
+the commit before the engine change), with logging on, and compare the rendered log lines. Also times
+simulate_match with the log on and headless for the working engine.
+
+Usage: python utils/check_match_log.py --ref REF [--matches N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.game_engine import GameEngine
+from bench_simulate_point import SURFACES, load_players, load_reference_engine
+
+
+def play(engine_cls, players, matches, seed, **kwargs):
+    """Play `matches` seeded matches; returns (engines, seconds)."""
+    engines = []
+    start = time.perf_counter()
+    for m in range(matches):
+        p1 = players[m % len(players)]
+        p2 = players[(m * 7 + 3) % len(players)]
+        if p1['id'] == p2['id']:
+            p2 = players[(m + 1) % len(players)]
+        engine = engine_cls(p1, p2, SURFACES[m % len(SURFACES)], sets_to_win=2 + m % 2,
+                            rng=random.Random(seed + m))
+        engine.simulate_match(**kwargs)
+        engines.append(engine)
+    return engines, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ref', required=True, help='git ref of the reference engine')
+    parser.add_argument('--matches', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    reference, _ = play(load_reference_engine(args.ref), players, args.matches, args.seed)
+    working, logged_seconds = play(GameEngine, players, args.matches, args.seed)
+    _, headless_seconds = play(GameEngine, players, args.matches, args.seed, headless=True)
+
+    lines = sum(len(engine.match_log) for engine in reference)
+    different = sum(list(a.match_log) != list(b.match_log) for a, b in zip(reference, working))
+    print(f"  {args.matches} matches, {lines} log lines: {different} matches log differently from {args.ref}")
+    print(f"  working engine: logged {logged_seconds:.2f}s, headless {headless_seconds:.2f}s")
+    if different:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
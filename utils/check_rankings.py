@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Check the incremental combined ranking (RankingSystem.update_combined_rankings):
+play seeded weeks from default data and, after every advance_week, rank a copy
+of the players from scratch with a new RankingSystem and compare ranks and
+points. Also prints the time of the scheduler's (incremental) ranking calls
+against the from-scratch ones.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/check_rankings.py [--seed N] [--weeks W]
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from ranking import RankingSystem
+from schedule import TournamentScheduler
+
+FIELDS = ('rank', 'points', 'elo_points', 'championship_points')
+
+
+def timed_rankings(ranking_system, timings):
+    """Record the time of every update_combined_rankings call of this ranking system."""
+    update = ranking_system.update_combined_rankings
+
+    def timed(players, current_date):
+        start = time.perf_counter()
+        changes = update(players, current_date)
+        timings.append(time.perf_counter() - start)
+        return changes
+    ranking_system.update_combined_rankings = timed
+
+
+def from_scratch(scheduler, timings):
+    """{player id: FIELDS} of a copy of the players ranked by a new RankingSystem."""
+    players = copy.deepcopy(scheduler.players)
+    start = time.perf_counter()
+    RankingSystem(data_path=None).update_combined_rankings(players, scheduler.current_date)
+    timings.append(time.perf_counter() - start)
+    return {p['id']: tuple(p.get(f) for f in FIELDS) for p in players if not p.get('retired', False)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=60, help='past 52 to cover a new season')
+    args = parser.parse_args()
+
+    incremental, full = [], []
+    mismatches = 0
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-rankings-')
+    try:
+        os.mkdir(os.path.join(workdir, 'data'))
+        for name in ('default_data.json', 'names.json', 'ranking.json'):
+            shutil.copy(os.path.join(ROOT, 'data', name), os.path.join(workdir, 'data', name))
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler = TournamentScheduler(save_path='data/__rankings_check__.json', seed=args.seed)
+            timed_rankings(scheduler.ranking_system, incremental)
+            for _ in range(args.weeks):
+                scheduler.simulate_current_week()
+                scheduler.advance_week(news=False)
+                expected = from_scratch(scheduler, full)
+                live = {p['id']: tuple(p.get(f) for f in FIELDS)
+                        for p in scheduler.players if not p.get('retired', False)}
+                different = [pid for pid in expected if live.get(pid) != expected[pid]]
+                if different:
+                    mismatches += 1
+                    sys.stderr.write(f"  year {scheduler.current_year} week {scheduler.current_week}:"
+                                     f" {len(different)} players ranked differently\n")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {args.weeks} weeks, {len(incremental)} ranking updates:"
+          f" incremental {sum(incremental) / len(incremental) * 1000:.2f}ms,"
+          f" from scratch {sum(full) / len(full) * 1000:.2f}ms per update")
+    if mismatches:
+        sys.exit(f"  {mismatches} weeks ranked differently from scratch")
+    print("  every week ranked as from scratch")
+
+
+if __name__ == "__main__":
+    main()
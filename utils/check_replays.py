@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Check seed-based match replays: play a few weeks from default data, save and
+reload the game, then replay every recorded match and compare its winner and
+score with the bracket. Also reports how much a replay record weighs against
+the point events it stands for.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/check_replays.py [--seed N] [--weeks W]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=3)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-replay-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler = TournamentScheduler(save_path='data/replay_check.json', seed=args.seed)
+            for week in range(args.weeks):
+                for tournament in scheduler.get_current_week_tournaments():
+                    if tournament.get('winner_id') is None:
+                        scheduler.simulate_entire_tournament(tournament['id'])
+                if week < args.weeks - 1:
+                    scheduler.advance_week()
+            scheduler.save_game('data/replay_check.json')
+            scheduler = TournamentScheduler(save_path='data/replay_check.json')
+
+        checked = mismatches = 0
+        record_bytes = event_bytes = 0
+        for tournament in scheduler.tournaments:
+            for key, record in tournament.get('replays', {}).items():
+                round_idx, match_idx = map(int, key.split('-'))
+                p1, p2, winner_id, score = tournament['bracket'][round_idx][match_idx]
+                engine, events = scheduler.replay_match(tournament['id'], round_idx, match_idx)
+                events = list(events)
+                replay_winner = next(e['winner']['id'] for e in events if e['type'] == 'match_end')
+                if (replay_winner, engine.format_set_scores()) != (winner_id, score):
+                    mismatches += 1
+                    print(f"  MISMATCH {tournament['name']} {key}: {score} vs {engine.format_set_scores()}")
+                checked += 1
+                record_bytes += len(json.dumps(record))
+                event_bytes += len(json.dumps(events, default=lambda o: o.get('id') if isinstance(o, dict) else str(o)))
+            record_bytes += len(json.dumps(tournament.get('player_snapshots', {})))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {checked} matches replayed after save/load, {mismatches} mismatches")
+    if checked:
+        print(f"  storage: {record_bytes / checked:.0f} bytes/match with snapshots,"
+              f" point events would be {event_bytes / checked:.0f} bytes/match")
+    if mismatches or not checked:
+        sys.exit("Replays do not reproduce the recorded matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Check that a seeded game is reproducible: play the same weeks from default
+data twice with one master seed, once with every match in this process and
+once with each round's matches played by a process pool as one batch
+(simulate_entire_tournament, or simulate_current_round round by round with
+--by-round), and compare a hash of the resulting world (players, rankings,
+draws and results).
+
+Each run works on a temporary copy of data/, since the scheduler writes the
+ranking history and the newgen name pool to disk.
+
+Usage: python utils/check_rng_determinism.py [--seed N] [--weeks W] [--workers N] [--by-round]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+
+
+def world_hash(scheduler):
+    """Hash of everything the simulation decides, independent of dict order."""
+    state = {
+        'players': scheduler.players,
+        'tournaments': [{k: t.get(k) for k in ('id', 'participants', 'bracket', 'winner_id')}
+                        for t in scheduler.tournaments],
+        'hall_of_fame': scheduler.hall_of_fame,
+    }
+    blob = json.dumps(state, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def play_weeks(seed, weeks, map_matches=None, by_round=False):
+    """Play `weeks` weeks of a new game with master seed `seed`; returns the world hash per week."""
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-rng-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler = TournamentScheduler(save_path='data/no_save.json', seed=seed)
+            hashes = []
+            for _ in range(weeks):
+                tournaments = sorted(scheduler.get_current_week_tournaments(),
+                                     key=lambda t: TournamentScheduler.PRESTIGE_ORDER.index(t['category']))
+                for tournament in tournaments:
+                    if tournament.get('winner_id') is not None:
+                        continue
+                    if by_round and tournament.get('bracket'):
+                        while tournament.get('winner_id') is None:
+                            scheduler.simulate_current_round(tournament['id'], map_matches=map_matches)
+                    else:
+                        scheduler.simulate_entire_tournament(tournament['id'], map_matches=map_matches)
+                scheduler.advance_week()
+                hashes.append(world_hash(scheduler))
+        return hashes
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--by-round', action='store_true', help='play the pool run with simulate_current_round')
+    args = parser.parse_args()
+
+    serial = play_weeks(args.seed, args.weeks)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        parallel = play_weeks(args.seed, args.weeks, map_matches=pool.map, by_round=args.by_round)
+
+    for week, (a, b) in enumerate(zip(serial, parallel), 1):
+        print(f"  week {week:2d}: serial {a[:16]}  {args.workers} workers {b[:16]}  {'ok' if a == b else 'DIFFERENT'}")
+    if serial != parallel:
+        sys.exit("Serial and process-pool runs diverged")
+    print("  serial and process-pool runs are identical")
+
+
+if __name__ == "__main__":
+    main()
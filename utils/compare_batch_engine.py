@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compare the NumPy BatchEngine against GameEngine on a few matchups:
+win rate, sets/games/shots per match and match_stats counters.
+Differences larger than 4 standard errors are flagged.
+
+Usage: python utils/compare_batch_engine.py [--matches N]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+import numpy as np
+
+from sim.game_engine import STAT_KEYS, GameEngine
+from sim.batch_engine import BatchEngine
+
+MENTALITIES = ["neutral", "opportunist", "strategist", "disruptor", "marathonian",
+               "brute", "baseliner", "net-player", "specialist", "wildcard"]
+MATCHUPS = [(0, 1, "clay", 2), (2, 9, "grass", 3), (5, 13, "hard", 2), (19, 4, "indoor", 2), (7, 3, "hard", 3)]
+
+
+def load_players(seed):
+    """Default-data players with the fields GameEngine expects filled in."""
+    rng = random.Random(seed)
+    with open(os.path.join(ROOT, 'data', 'default_data.json')) as f:
+        players = json.load(f)['players']
+    for i, p in enumerate(players):
+        skills = p['skills']
+        skills.setdefault('dropshot', rng.randint(25, 55))
+        skills.setdefault('volley', rng.randint(25, 55))
+        p['hand'] = 'Left' if i % 3 == 0 else 'Right'
+        p['mentality'] = MENTALITIES[i % len(MENTALITIES)]
+    return players
+
+
+def summarize(values):
+    n = len(values)
+    mean = sum(values) / n
+    var = sum((v - mean) ** 2 for v in values) / max(1, n - 1)
+    return mean, math.sqrt(var / n)
+
+
+def compare(label, scalar, batch):
+    (m1, se1), (m2, se2) = summarize(scalar), summarize(batch)
+    se = math.sqrt(se1 ** 2 + se2 ** 2) or 1e-9
+    z = (m2 - m1) / se
+    flag = "  <-- check" if abs(z) > 4 else ""
+    print(f"    {label:<18} {m1:8.3f} {m2:8.3f}  z={z:+.2f}{flag}")
+    return abs(z) <= 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matches', type=int, default=2000, help='matches per matchup and engine')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    random.seed(args.seed)
+    ok = True
+    for a, b, surface, sets_to_win in MATCHUPS:
+        p1, p2 = players[a], players[b]
+        n = args.matches
+        print(f"{p1['name']} ({p1['mentality']}) vs {p2['name']} ({p2['mentality']}), {surface}, best of {2 * sets_to_win - 1}")
+
+        start = time.perf_counter()
+        scalar = {"win": [], "sets": [], "games": [], "shots": []}
+        scalar_stats = {k: [] for k in STAT_KEYS}
+        for _ in range(n):
+            engine = GameEngine(p1, p2, surface, sets_to_win=sets_to_win)
+            result = engine.simulate_match(headless=True)
+            scalar["win"].append(1 if result.winner_key == "player1" else 0)
+            scalar["sets"].append(len(result.set_scores))
+            scalar["games"].append(result.games)
+            scalar["shots"].append(result.shots)
+            for k in STAT_KEYS:
+                scalar_stats[k].append(sum(s[k] for s in result.match_stats.values()))
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        res = BatchEngine.from_players([p1] * n, [p2] * n, surface, sets_to_win,
+                                       rng=np.random.default_rng(args.seed + a * 100 + b)).run()
+        batch_time = time.perf_counter() - start
+        batch = {
+            "win": (res.winner == 0).astype(int).tolist(),
+            "sets": res.n_sets.tolist(),
+            "games": res.games.tolist(),
+            "shots": res.shots.tolist(),
+        }
+        totals = res.match_stats.sum(axis=1)
+
+        print(f"    {'':<18} {'scalar':>8} {'batch':>8}")
+        for key in ("win", "sets", "games", "shots"):
+            ok &= compare(key, scalar[key], batch[key])
+        for i, k in enumerate(STAT_KEYS):
+            ok &= compare(k, scalar_stats[k], totals[:, i].tolist())
+        print(f"    time: scalar {scalar_time:.2f}s, batch {batch_time:.2f}s ({scalar_time / batch_time:.1f}x)")
+
+    print("\nAll within tolerance" if ok else "\nSome statistics differ beyond tolerance")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Compare tiered simulation fidelity (sim.fidelity) with the full engine:
+play the same weeks from default data with every match on the full engine
+and with a FidelityPolicy, and report the calibration (upset rate per tier),
+the matches played at each tier and the time spent simulating tournaments.
+
+Tournaments are sorted by the tier the policy gives their category in both
+runs, so each tier's upset rate can be compared with the full engine on the
+same events. Upsets are wins by the player with the lower ELO rating going
+into the tournament.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/compare_fidelity.py [--seed N] [--weeks W] [--tolerance T]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+from sim.fidelity import TIERS, FidelityPolicy
+
+
+def play_weeks(seed, weeks, policy, fidelity=None):
+    """
+    Play `weeks` weeks, with `fidelity` as the scheduler's policy. Returns
+    (seconds in tournaments, matches, upsets), both counted by the tier
+    `policy` gives each tournament.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = TournamentScheduler(save_path='data/fidelity_check.json', seed=seed, fidelity=fidelity)
+        seconds = 0.0
+        matches = Counter()
+        upsets = Counter()
+        for week in range(weeks):
+            for tournament in scheduler.get_current_week_tournaments():
+                if tournament.get('winner_id') is not None or not tournament.get('bracket'):
+                    continue
+                tier = policy.tier_for(tournament.get('category'))
+                elo = {p['id']: p.get('elo_rating', 0) for p in scheduler.players}
+                start = time.perf_counter()
+                scheduler.simulate_entire_tournament(tournament['id'])
+                seconds += time.perf_counter() - start
+                for round_matches in tournament['bracket']:
+                    for p1, p2, winner, *_ in round_matches:
+                        if p1 is None or p2 is None or elo[p1] == elo[p2]:
+                            continue
+                        matches[tier] += 1
+                        upsets[tier] += elo[winner] < elo[p2 if winner == p1 else p1]
+            if week < weeks - 1:
+                scheduler.advance_week()
+    return seconds, matches, upsets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=8)
+    parser.add_argument('--tolerance', type=float, default=0.03)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-fidelity-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        policy = FidelityPolicy(tolerance=args.tolerance)
+        tiered_seconds, matches, upsets = play_weeks(args.seed, args.weeks, policy, policy)
+        full_seconds, full_matches, full_upsets = play_weeks(args.seed, args.weeks, policy)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = policy.calibration_report
+    print(f"  calibration on {report['matches']} full-engine matches, upset rate of each tier's favourites:")
+    for tier in TIERS[1:]:
+        off = "  (off: outside tolerance, played in full)" if tier in report['disabled'] else ""
+        print(f"    {tier:<9} expected {report[tier]['expected']:.3f}, full engine {report[tier]['full']:.3f}{off}")
+    print(f"  analytic skill scale {policy.analytic_scale:.2f}, ELO gap scale {policy.elo_scale:.2f}")
+
+    print(f"  {args.weeks} weeks, upset rate of the tournaments given to each tier, all full vs tiered:")
+    for tier in TIERS:
+        if matches[tier]:
+            print(f"    {tier:<9} {full_upsets[tier] / max(1, full_matches[tier]):.3f} vs"
+                  f" {upsets[tier] / matches[tier]:.3f} over {matches[tier]} matches")
+    print(f"  time in tournaments: full {full_seconds:.2f}s, tiered {tiered_seconds:.2f}s"
+          f" ({tiered_seconds / full_seconds:.0%})")
+
+
+if __name__ == "__main__":
+    main()
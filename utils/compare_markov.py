@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare the analytic Markov-chain solver against Monte Carlo predict_matchup
+on a few default-data matchups: win probability, set scores and solve time.
+
+Usage: python utils/compare_markov.py [--matches N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from sim.markov import predict_matchup_analytic, solve_match
+from sim.matchup import predict_matchup
+
+MENTALITIES = ["neutral", "opportunist", "strategist", "disruptor", "marathonian",
+               "brute", "baseliner", "net-player", "specialist", "wildcard"]
+MATCHUPS = [(0, 1, "clay", 2), (2, 9, "grass", 3), (5, 13, "hard", 2), (7, 3, "hard", 3)]
+
+
+def load_players(seed):
+    """Default-data players with the fields GameEngine expects filled in."""
+    rng = random.Random(seed)
+    with open(os.path.join(ROOT, 'data', 'default_data.json')) as f:
+        players = json.load(f)['players']
+    for i, p in enumerate(players):
+        skills = p['skills']
+        skills.setdefault('dropshot', rng.randint(25, 55))
+        skills.setdefault('volley', rng.randint(25, 55))
+        p['hand'] = 'Left' if i % 3 == 0 else 'Right'
+        p['mentality'] = MENTALITIES[i % len(MENTALITIES)]
+    return players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matches', type=int, default=4000, help='Monte Carlo matches per matchup')
+    parser.add_argument('--sample', type=int, default=900, help='matches sampled for hold probabilities')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    players = load_players(args.seed)
+    for a, b, surface, sets_to_win in MATCHUPS:
+        p1, p2 = players[a], players[b]
+        print(f"{p1['name']} vs {p2['name']}, {surface}, best of {2 * sets_to_win - 1}")
+
+        start = time.perf_counter()
+        mc = predict_matchup(p1, p2, surface, sets_to_win, n=args.matches, tolerance=0, workers=1, seed=args.seed)
+        mc_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        analytic = predict_matchup_analytic(p1, p2, surface, sets_to_win, matches=args.sample, seed=args.seed)
+        sample_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for hold in analytic["hold"]:
+            solve_match(hold, sets_to_win)
+        solve_time = (time.perf_counter() - start) / len(analytic["hold"])
+
+        lo, hi = mc["confidence_interval"]
+        p = analytic["win_probability"]
+        flag = "" if lo - 0.02 <= p <= hi + 0.02 else "  <-- check"
+        print(f"    win probability   MC {mc['win_probability']:.3f} [{lo:.3f}, {hi:.3f}]  analytic {p:.3f}{flag}")
+        for score, share in mc["set_scores"].items():
+            print(f"    {score:<17} MC {share:.3f}                  analytic {analytic['set_scores'].get(score, 0):.3f}")
+        print(f"    time: MC {mc_time:.2f}s, hold sampling {sample_time:.2f}s, solve {solve_time * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
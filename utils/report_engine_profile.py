@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Engine profile report (sim.instrument): play weeks from default data with an
+EngineProfile on the scheduler and print each week's matches, rally length,
+shots and mental boosts, then the totals, shots by type and, with --timers,
+the share of rally time in choose_shot_direction, calculate_shot and
+can_catch. Also plays the same weeks without a profile, to show the cost of
+the instrumentation.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/report_engine_profile.py [--seed N] [--weeks W] [--timers]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+from sim.instrument import EngineProfile
+
+
+def play_weeks(seed, weeks, profile=None):
+    """Play `weeks` weeks; returns (scheduler, seconds in tournaments)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = TournamentScheduler(save_path='data/profile_check.json', seed=seed, profile=profile)
+        seconds = 0.0
+        for _ in range(weeks):
+            start = time.perf_counter()
+            for tournament in scheduler.get_current_week_tournaments():
+                if tournament.get('winner_id') is None and tournament.get('bracket'):
+                    scheduler.simulate_entire_tournament(tournament['id'])
+            seconds += time.perf_counter() - start
+            scheduler.advance_week()
+    return scheduler, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=6)
+    parser.add_argument('--timers', action='store_true', help='time the hot-path methods too')
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-profile-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        _, plain_seconds = play_weeks(args.seed, args.weeks)
+        scheduler, profiled_seconds = play_weeks(args.seed, args.weeks, EngineProfile(timers=args.timers))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {'week':>8} {'matches':>8} {'rallies':>8} {'shots/rally':>12} {'catch':>6} {'boosts':>7}")
+    for week in scheduler.profile_weeks:
+        print(f"  {week['year']:>3}-{week['week']:<4} {week['matches']:>8} {week['rallies']:>8}"
+              f" {week['mean_rally_length']:>12.2f} {week['catch_rate']:>6.1%} {week['mental_boost_rate']:>7.1%}")
+    total = scheduler._season_profile.report()
+    print(f"  total: {total['matches']} matches, {total['rallies']} rallies, {total['shots']} shots")
+    print("  shots by type: " + ", ".join(f"{k} {v / total['shots']:.1%}" for k, v in total['shots_by_type'].items()))
+    if args.timers:
+        for name, timer in total['timers'].items():
+            print(f"    {name:<22} {timer['calls']:>9} calls {timer['ms']:>9.1f} ms {timer['share']:>7.1%}")
+    print(f"  time in tournaments: plain {plain_seconds:.2f}s, profiled {profiled_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Hit-rate and bias report for the opt-in match outcome cache
+(sim.outcome_cache): play the same weeks from default data with and without
+the cache, then compare pooled outcome distributions with live simulation.
+
+Hit rate: weeks played with an OutcomeCache, with lookups, first meetings
+(played live), pools built, hits, evictions, invalidations (weekly
+development moving a player to another skill bucket) and estimated memory,
+next to the wall time of the same weeks without the cache.
+
+Bias: for `--pairs` matchups, the player1 win rate and mean games of the
+matchup's pool versus `--live` seeded live matches, with the difference a
+pool of that size would show from sampling error alone.
+
+Works on a temporary copy of data/, since the scheduler writes to it.
+
+Usage: python utils/report_outcome_cache.py [--seed N] [--weeks W] [--pool N] [--quantum Q] [--budget MB]
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from schedule import TournamentScheduler
+from sim.game_engine import GameEngine
+from sim.outcome_cache import OutcomeCache
+from bench_simulate_point import SURFACES, load_players
+
+
+def play_weeks(seed, weeks, outcome_cache=None):
+    """Play `weeks` weeks headless; returns (seconds, matches played)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = TournamentScheduler(save_path='data/outcome_cache_check.json', seed=seed,
+                                        outcome_cache=outcome_cache)
+        start = time.perf_counter()
+        matches = 0
+        for week in range(weeks):
+            for tournament in scheduler.get_current_week_tournaments():
+                if tournament.get('winner_id') is None and tournament.get('bracket'):
+                    scheduler.simulate_entire_tournament(tournament['id'])
+                    matches += len(tournament.get('replays', {}))
+            if week < weeks - 1:
+                scheduler.advance_week()
+        return time.perf_counter() - start, matches
+
+
+def bias(args):
+    """Pool vs live win rate and games for a set of seeded matchups."""
+    players = load_players(args.seed)
+    cache = OutcomeCache(pool_size=args.pool, quantum=args.quantum, seed=args.seed)
+    rng = random.Random(args.seed)
+    deltas = []
+    games_deltas = []
+    expected = []
+    for _ in range(args.pairs):
+        p1, p2 = rng.sample(players, 2)
+        surface = rng.choice(SURFACES)
+        sets_to_win = rng.choice((2, 3))
+        pool, _ = cache._build_pool(cache.key(p1, p2, surface, sets_to_win))
+        pool_p = sum(1 for o in pool if o[0] == 0) / len(pool)
+        pool_games = sum(o[3] for o in pool) / len(pool)
+
+        wins = games = 0
+        for m in range(args.live):
+            engine = GameEngine(p1, p2, surface, sets_to_win=sets_to_win, rng=random.Random(rng.random()))
+            result = engine.simulate_match(headless=True)
+            wins += result.winner_key == 'player1'
+            games += result.games
+        live_p = wins / args.live
+        deltas.append(abs(pool_p - live_p))
+        games_deltas.append(abs(pool_games - games / args.live))
+        expected.append(math.sqrt(live_p * (1 - live_p) * (1 / len(pool) + 1 / args.live)))
+
+    print(f"  bias over {args.pairs} matchups ({args.live} live matches each, pools of {args.pool}, quantum {args.quantum}):")
+    print(f"    |p_pool - p_live|     mean {sum(deltas) / len(deltas):.3f}  max {max(deltas):.3f}"
+          f"  (sampling error alone ~{sum(expected) / len(expected):.3f})")
+    print(f"    |games_pool - live|   mean {sum(games_deltas) / len(games_deltas):.2f}"
+          f"  max {max(games_deltas):.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--weeks', type=int, default=4)
+    parser.add_argument('--pool', type=int, default=16)
+    parser.add_argument('--quantum', type=int, default=2)
+    parser.add_argument('--budget', type=float, default=8, help='cache memory budget in MB')
+    parser.add_argument('--pairs', type=int, default=30)
+    parser.add_argument('--live', type=int, default=200)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tennisgm-cache-')
+    try:
+        shutil.copytree(os.path.join(ROOT, 'data'), os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        live_seconds, matches = play_weeks(args.seed, args.weeks)
+        cache = OutcomeCache(pool_size=args.pool, quantum=args.quantum,
+                             memory_budget=int(args.budget * 2 ** 20), seed=args.seed)
+        cached_seconds, _ = play_weeks(args.seed, args.weeks, cache)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = cache.report()
+    print(f"  {args.weeks} weeks, {matches} matches: live {live_seconds:.1f}s, cached {cached_seconds:.1f}s")
+    print(f"  lookups {report['lookups']} ({report['first_meetings']} first meetings played live,"
+          f" {report['misses']} pools built, {report['hits']} hits), hit rate {report['hit_rate']:.1%}")
+    print(f"  pools {report['pools']}, {report['memory_bytes'] / 1024:.0f} KB,"
+          f" evictions {report['evictions']}, invalidations {report['invalidations']}")
+    bias(args)
+
+
+if __name__ == "__main__":
+    main()